@@ -1,134 +1,487 @@
+from __future__ import annotations
+
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 
 from util.admin.bearer_auth import BearerAuth
+from util.admin.token_cache import TokenCache
+from util.config import get_base_url
+from util.json_stream import iter_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Self
+
+    from util.admin.ledger import ResourceLedger
+    from util.admin.rate_limiter import RateLimiter
+    from util.admin.response_cache import ResponseCache
 
 LOGGER = logging.getLogger(__name__)
 
 
 class AdminAPIException(Exception):
-    """Raised for any kind of wrong behaviour in AdminAPI."""
+    """Raised for any kind of wrong behaviour in AdminAPI.
+
+    Attributes:
+        status_code (int): Status code of the response which caused exception or None.
+
+    """
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _wait_result(future: Future, deadlines: dict, index: int, poll: float | None, timeout_message: str) -> object:
+    """Wait for `future` until the deadline its task put in `deadlines`, return its result or `TimeoutError`."""
+    while not future.done():
+        deadline = deadlines.get(index)
+        if deadline is None:
+            # Not started yet or no timeout at all
+            wait([future], timeout = poll)
+            continue
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        wait([future], timeout = remaining)
+    return future.result() if future.done() else TimeoutError(timeout_message)
 
 
 class AdminAPI:
     """Wrapper for safe use of Contact List Application API.
 
+    All requests go through one owned `requests.Session`, so connections to the application are kept alive
+    and reused between calls instead of paying TCP and TLS handshake on every request.
+    Call `close()` or use the instance as a context manager to release pooled connections.
+
+    Tokens received from `create_user` and `log_in` are cached by credentials, so repeated `log_in` calls with
+    the same credentials don't make a round trip. Cached token is forgotten after `log_out`, `delete_user`
+    or when the application rejects it with 401.
+
+    With a `ResourceLedger` every created user and contact is recorded until it is deleted through this client,
+    so teardown can delete exactly what was created.
+
+    Every request is reported to hooks added with `add_hook()`, e.g. `util.metrics.MetricsRecorder`.
+
     Attributes:
         url (str):       Contact List Application base url.
+        session (requests.Session): Session with pooled keep-alive connections used for every request.
+        token_cache (TokenCache):   Cache of tokens by credentials or None if caching is disabled.
+        rate_limiter (RateLimiter): Limiter of requests per second or None.
+        response_cache (ResponseCache): Cache of `get_user`, `get_contact` and `get_contact_list` responses or None.
+                                        Writes through this client invalidate affected entries.
+        ledger (ResourceLedger): Record of created and not yet deleted resources or None.
+        hooks (list):    Callables called after every request with
+                         `(method, endpoint, status_code, seconds, request_bytes, response_bytes)`.
 
     """
 
-    url = "https://thinking-tester-contact-list.herokuapp.com/"
+    def __init__(  # noqa: PLR0913 - options are keyword-only and documented below
+        self,
+        url: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        *,
+        keep_alive: bool = True,
+        transport: BaseAdapter | None = None,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        ledger: ResourceLedger | None = None,
+        timeout: float | None = None,
+        token_ttl: float | None = 300,
+        relogin_on_unauthorized: bool = False,
+    ) -> None:
+        """Create client with its own connection pool.
+
+        Args:
+            url (str):              Application base url. Defaults to `util.config.get_base_url()`.
+            pool_connections (int): Number of hosts to keep connection pools for.
+            pool_maxsize (int):     Maximum number of connections kept alive per host.
+            keep_alive (bool):      If False, every response closes its connection (old behaviour).
+            transport (BaseAdapter): Adapter mounted for `url` instead of network one, e.g. `WSGIAdapter`
+                                     from `util.admin.transport` to call in-process application without sockets.
+            rate_limiter (RateLimiter): Limiter every request waits for before it is sent.
+            response_cache (ResponseCache): Cache of GET responses revalidated with ETag/Last-Modified.
+            ledger (ResourceLedger): Ledger which records created users and contacts.
+            timeout (float):        Seconds to wait for connection and for response data. None waits forever.
+            token_ttl (float):      Seconds to keep cached tokens. None or 0 disables token caching.
+            relogin_on_unauthorized (bool): If True, request rejected with 401 for a cached token is repeated
+                                            once with a token from a new log in.
 
-    def __init__(self):
+        """
+        self.url = url if url is not None else get_base_url()
+        self.session = requests.Session()
+        # Authorization is done only with bearer tokens, cookies must not leak it between requests
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains = []))
+        adapter = HTTPAdapter(pool_connections = pool_connections, pool_maxsize = pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        if transport is not None:
+            self.session.mount(self.url, transport)
+            # Proxy and netrc settings don't apply to a mounted transport, looking them up costs most of a request
+            self.session.trust_env = False
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.ledger = ledger
+        self.timeout = timeout
+        self.token_cache = TokenCache(token_ttl) if token_ttl else None
+        self.relogin_on_unauthorized = relogin_on_unauthorized
+        self.hooks = []
         LOGGER.info("Created AdminAPI")
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+        LOGGER.info("Closed AdminAPI session")
+
     def _is_token_none(self, token: str) -> None:
         if token is None:
             exception_msg = "Received token is None"
             raise TypeError(exception_msg)
 
+    def add_hook(self, hook: Callable) -> None:
+        self.hooks.append(hook)
+
+    def _send(self, method: str, endpoint: str, url: str, token: str | None, **kwargs) -> requests.Response:
+        auth = BearerAuth(token) if token is not None else None
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        response = self.session.request(method, url, auth = auth, **kwargs)
+        elapsed = time.perf_counter() - start
+        if self.hooks:
+            body = response.request.body
+            sent = len(body) if body else 0
+            # Body of streamed response is not read yet, so its size is known only from headers
+            content_length = response.headers.get("Content-Length")
+            if content_length is not None:
+                received = int(content_length)
+            else:
+                received = 0 if kwargs.get("stream") else len(response.content)
+            for hook in self.hooks:
+                hook(method, endpoint, response.status_code, elapsed, sent, received)
+        return response
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        token: str | None = None,
+        resource_id: str | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        url = self.url + endpoint
+        if resource_id is not None:
+            url += f"/{resource_id}"
+            endpoint += "/{id}"
+        cache = self.response_cache if method == "GET" and not kwargs.get("stream") else None
+        cached = None
+        if cache is not None:
+            cached, fresh = cache.get(token, url)
+            if fresh:
+                LOGGER.debug("Using cached response for: %s", url)
+                return cached
+            if cached is not None:
+                kwargs["headers"] = {**kwargs.get("headers", {}), **cache.validators(cached)}
+        response = self._send(method, endpoint, url, token, **kwargs)
+        if response.status_code == 401 and token is not None and self.token_cache is not None:
+            credentials = self.token_cache.invalidate(token)
+            if credentials is not None and self.relogin_on_unauthorized:
+                LOGGER.info("Token was rejected. Logging in again and repeating request")
+                response.close()
+                token = self.log_in(*credentials)
+                response = self._send(method, endpoint, url, token, **kwargs)
+        if cache is not None:
+            if response.status_code == 304 and cached is not None:
+                LOGGER.debug("Cached response is not modified: %s", url)
+                cache.put(token, url, cached)
+                return cached
+            if response.status_code == 200:
+                cache.put(token, url, response)
+        return response
+
+    def _invalidate(self, token: str, *endpoints: str, prefix: str | None = None) -> None:
+        if self.response_cache is not None:
+            prefix = self.url + prefix if prefix is not None else None
+            self.response_cache.invalidate(token, *(self.url + endpoint for endpoint in endpoints), prefix = prefix)
+
+    def _run_batch(self, function: Callable, items: Iterable, max_workers: int) -> list:
+        """Call `function` for every item concurrently.
+
+        Results keep the order of `items`. Failed items get their `AdminAPIException` in place of the result,
+        so one failure doesn't abort the rest of the batch.
+        """
+        def call(item):
+            try:
+                return function(item)
+            except AdminAPIException as exception:
+                return exception
+
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            results = list(executor.map(call, items))
+        failed = sum(isinstance(result, AdminAPIException) for result in results)
+        if failed:
+            LOGGER.warning("%d of %d batch requests failed", failed, len(results))
+        return results
+
     def create_user(self, user: dict) -> str:
         LOGGER.debug("Creating user: %s", user)
-        response = requests.post(AdminAPI.url + "users", json = user)
+        response = self._request("POST", "users", json = user)
         if response.status_code != 201:
             exception_msg = f"Couldn't create user: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
         token = response.json()["token"]
+        if self.token_cache is not None and "email" in user and "password" in user:
+            self.token_cache.put(user["email"], user["password"], token)
+        if self.ledger is not None and "email" in user and "password" in user:
+            self.ledger.add_user(user["email"], user["password"], token)
         LOGGER.debug("Created user and received token: %s", token)
         return token
 
-    def log_in(self, email: str, password: str) -> str:
+    def log_in(self, email: str, password: str, *, fresh: bool = False) -> str:
+        """Return token of user, cached one unless `fresh` is set, e.g. when the token is going to be logged out."""
         LOGGER.debug("Logging in user with credentials: {email: %s, password: %s}", email, password)
+        if self.token_cache is not None and not fresh:
+            token = self.token_cache.get(email, password)
+            if token is not None:
+                return token
         login_data = {
             "email": email,
             "password": password,
         }
-        response = requests.post(AdminAPI.url + "users/login", json = login_data)
+        response = self._request("POST", "users/login", json = login_data)
         if response.status_code != 200:
             exception_msg = f"Couldn't log in: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
         token = response.json()["token"]
+        if self.token_cache is not None:
+            self.token_cache.put(email, password, token)
+        if self.ledger is not None:
+            self.ledger.add_token(token, email, password)
         LOGGER.debug("Logged in and received token: %s", token)
         return token
 
     def log_out(self, token: str) -> None:
         LOGGER.debug("Logging out with token: %s", token)
         self._is_token_none(token)
-        response = requests.post(AdminAPI.url + "users/logout", auth = BearerAuth(token))
+        response = self._request("POST", "users/logout", token)
         if response.status_code != 200:
             exception_msg = f"Couldn't log out: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
+        if self.token_cache is not None:
+            self.token_cache.invalidate(token)
+        if self.response_cache is not None:
+            self.response_cache.invalidate_token(token)
         LOGGER.debug("Logged out")
 
     def get_user(self, token: str) -> dict:
         LOGGER.debug("Getting user with token: %s", token)
         self._is_token_none(token)
-        response = requests.get(AdminAPI.url + "users/me", auth = BearerAuth(token))
+        response = self._request("GET", "users/me", token)
         if response.status_code != 200:
             exception_msg = f"Couldn't get user: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
         user = response.json()
         LOGGER.debug("Received user: %s", user)
         return user
 
+    def patch_user(self, token: str, fields: dict) -> dict:
+        LOGGER.debug("Patching user with token: %s. Fields: %s", token, fields)
+        self._is_token_none(token)
+        response = self._request("PATCH", "users/me", token, json = fields)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't patch user: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        user = response.json()
+        self._invalidate(token, "users/me")
+        if self.token_cache is not None and ("email" in fields or "password" in fields):
+            credentials = self.token_cache.invalidate(token)
+            if credentials is not None:
+                self.token_cache.put(fields.get("email", credentials[0]), fields.get("password", credentials[1]), token)
+        if self.ledger is not None and ("email" in fields or "password" in fields):
+            self.ledger.patch_user(token, fields.get("email"), fields.get("password"))
+        LOGGER.debug("Patched user: %s", user)
+        return user
+
     def delete_user(self, token: str) -> None:
         LOGGER.debug("Deleting user with token: %s", token)
         self._is_token_none(token)
-        response = requests.delete(AdminAPI.url + "users/me", auth = BearerAuth(token))
+        response = self._request("DELETE", "users/me", token)
         if response.status_code != 200:
             exception_msg = f"Couldn't delete user: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
+        if self.token_cache is not None:
+            self.token_cache.invalidate(token)
+        if self.response_cache is not None:
+            self.response_cache.invalidate_token(token)
+        if self.ledger is not None:
+            self.ledger.remove_user(token)
         LOGGER.debug("User deleted")
 
     def create_contact(self, token: str, contact: dict) -> dict:
         LOGGER.debug("Using token: %s. Creating contact: %s", token, contact)
         self._is_token_none(token)
-        response = requests.post(AdminAPI.url + "contacts", auth = BearerAuth(token), json = contact)
+        response = self._request("POST", "contacts", token, json = contact)
         if response.status_code != 201:
             exception_msg = f"Couldn't create contact: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
         created_contact = response.json()
+        self._invalidate(token, "contacts")
+        if self.ledger is not None:
+            self.ledger.add_contact(token, created_contact["_id"])
         LOGGER.debug("Contact created: %s", created_contact)
         return created_contact
 
     def get_contact(self, token: str, contact_id: str) -> dict:
         LOGGER.debug("Getting contact with id: %s using token: %s", contact_id, token)
         self._is_token_none(token)
-        response = requests.get(AdminAPI.url + f"contacts/{contact_id}", auth = BearerAuth(token))
+        response = self._request("GET", "contacts", token, contact_id)
         if response.status_code != 200:
             exception_msg = f"Couldn't get contact: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
         contact = response.json()
         LOGGER.debug("Received contact: %s", contact)
         return contact
 
+    def update_contact(self, token: str, contact_id: str, contact: dict) -> dict:
+        LOGGER.debug("Updating contact with id: %s using token: %s. New contact: %s", contact_id, token, contact)
+        self._is_token_none(token)
+        response = self._request("PUT", "contacts", token, contact_id, json = contact)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't update contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        updated_contact = response.json()
+        self._invalidate(token, f"contacts/{contact_id}", "contacts")
+        LOGGER.debug("Updated contact: %s", updated_contact)
+        return updated_contact
+
+    def patch_contact(self, token: str, contact_id: str, fields: dict) -> dict:
+        LOGGER.debug("Patching contact with id: %s using token: %s. Fields: %s", contact_id, token, fields)
+        self._is_token_none(token)
+        response = self._request("PATCH", "contacts", token, contact_id, json = fields)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't patch contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        patched_contact = response.json()
+        self._invalidate(token, f"contacts/{contact_id}", "contacts")
+        LOGGER.debug("Patched contact: %s", patched_contact)
+        return patched_contact
+
     def delete_contact(self, token: str, contact_id: str) -> None:
         LOGGER.debug("Deleting contact with id: %s using token: %s", contact_id, token)
         self._is_token_none(token)
-        response = requests.delete(AdminAPI.url + f"contacts/{contact_id}", auth = BearerAuth(token))
+        response = self._request("DELETE", "contacts", token, contact_id)
         if response.status_code != 200:
             exception_msg = f"Couldn't delete contact: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
+        self._invalidate(token, f"contacts/{contact_id}", "contacts")
+        if self.ledger is not None:
+            self.ledger.remove_contact(contact_id)
         LOGGER.debug("Contact deleted")
 
     def get_contact_list(self, token: str) -> list:
         LOGGER.debug("Getting contact list using token: %s", token)
         self._is_token_none(token)
-        response = requests.get(AdminAPI.url + "contacts", auth = BearerAuth(token))
+        response = self._request("GET", "contacts", token)
         if response.status_code != 200:
             exception_msg = f"Couldn't get contact list: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
         contact_list = response.json()
         LOGGER.debug("Received contact list: %s", contact_list)
         return contact_list
 
+    def iter_contact_list(self, token: str, chunk_size: int = 65536) -> Iterator[dict]:
+        """Yield contacts one by one while response body is being downloaded and parsed.
+
+        Unlike `get_contact_list` the whole list is never kept in memory. Request is sent on first iteration.
+        """
+        LOGGER.debug("Streaming contact list using token: %s", token)
+        self._is_token_none(token)
+        response = self._request("GET", "contacts", token, stream = True)
+        with response:
+            if response.status_code != 200:
+                exception_msg = f"Couldn't get contact list: {response.text}"
+                raise AdminAPIException(exception_msg, response.status_code)
+            count = 0
+            for contact in iter_json_array(response.iter_content(chunk_size)):
+                count += 1
+                yield contact
+        LOGGER.debug("Received contact list of %d contacts", count)
+
     def delete_contact_list(self, token: str) -> None:
         LOGGER.debug("Deleting contact list using token: %s", token)
         self._is_token_none(token)
-        response = requests.delete(AdminAPI.url + "contacts", auth = BearerAuth(token))
+        response = self._request("DELETE", "contacts", token)
         if response.status_code != 200:
             exception_msg = f"Couldn't delete contacts: {response.text}"
-            raise AdminAPIException(exception_msg)
+            raise AdminAPIException(exception_msg, response.status_code)
+        self._invalidate(token, "contacts", prefix = "contacts/")
+        if self.ledger is not None:
+            self.ledger.remove_contacts(token)
         LOGGER.debug("Contact list deleted")
+
+    def create_contacts(self, token: str, contacts: Iterable[dict], max_workers: int = 10) -> list:
+        LOGGER.debug("Using token: %s. Creating contacts in batch", token)
+        self._is_token_none(token)
+        return self._run_batch(lambda contact: self.create_contact(token, contact), contacts, max_workers)
+
+    def get_contacts(self, token: str, contact_ids: Iterable[str], max_workers: int = 10) -> list:
+        LOGGER.debug("Using token: %s. Getting contacts in batch", token)
+        self._is_token_none(token)
+        return self._run_batch(lambda contact_id: self.get_contact(token, contact_id), contact_ids, max_workers)
+
+    def delete_contacts(self, token: str, contact_ids: Iterable[str], max_workers: int = 10) -> list:
+        LOGGER.debug("Using token: %s. Deleting contacts in batch", token)
+        self._is_token_none(token)
+        return self._run_batch(lambda contact_id: self.delete_contact(token, contact_id), contact_ids, max_workers)
+
+    def delete_users(self, credentials: Iterable[tuple], max_workers: int = 10, timeout: float | None = None) -> list:
+        """Log in with every (email, password) pair and delete the user, concurrently.
+
+        Result for every credential keeps input order: True if user was deleted, False if there is no such user,
+        exception if log in or deletion failed, `TimeoutError` if it took longer than `timeout` seconds.
+        User is never deleted once its timeout has passed.
+        """
+        credentials = list(credentials)
+        deadlines = {}
+
+        def delete(index: int, credential: tuple) -> object:
+            deadlines[index] = time.monotonic() + timeout if timeout is not None else None
+            try:
+                token = self.log_in(*credential)
+            except AdminAPIException as exception:
+                return False if exception.status_code == 401 else exception
+            except requests.RequestException as exception:
+                return exception
+            if deadlines[index] is not None and time.monotonic() > deadlines[index]:
+                return TimeoutError(f"Deletion of {credential[0]} timed out")
+            try:
+                self.delete_user(token)
+            except (AdminAPIException, requests.RequestException) as exception:
+                return exception
+            return True
+
+        executor = ThreadPoolExecutor(max_workers = max_workers)
+        futures = [executor.submit(delete, index, credential) for index, credential in enumerate(credentials)]
+        poll = 0.05 if timeout is not None else None
+        results = [
+            _wait_result(future, deadlines, index, poll, f"Deletion of {credentials[index][0]} timed out")
+            for index, future in enumerate(futures)
+        ]
+        # Timed out requests are left to finish in background instead of blocking the caller
+        executor.shutdown(wait = False, cancel_futures = True)
+        return results
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import httpx
+
+from util.admin.admin_api import AdminAPIException
+from util.config import get_base_url
+
+if TYPE_CHECKING:
+    from typing import Self
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncAdminAPI:
+    """Asyncio twin of `AdminAPI` for driving many requests concurrently from one process.
+
+    Methods have the same names, arguments and `AdminAPIException` semantics as `AdminAPI`, but are coroutines.
+    All requests share one `httpx.AsyncClient` connection pool and at most `max_concurrency` requests
+    are in flight at once, so hundreds of calls can be gathered without opening a connection per call.
+
+    Attributes:
+        url (str):       Contact List Application base url.
+        client (httpx.AsyncClient): Client with pooled keep-alive connections used for every request.
+        max_concurrency (int): Maximum number of requests in flight.
+
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        max_concurrency: int = 100,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Create client with its own connection pool.
+
+        Args:
+            url (str):                       Application base url. Defaults to `util.config.get_base_url()`.
+            max_concurrency (int):           Maximum number of requests awaited at the same time.
+            max_connections (int):           Maximum number of open connections in the pool.
+            max_keepalive_connections (int): Maximum number of idle connections kept alive in the pool.
+            transport (httpx.AsyncBaseTransport): Transport used instead of network one,
+                                                  e.g. `httpx.ASGITransport` to call in-process application.
+
+        """
+        self.url = url if url is not None else get_base_url()
+        limits = httpx.Limits(max_connections = max_connections, max_keepalive_connections = max_keepalive_connections)
+        self.client = httpx.AsyncClient(limits = limits, transport = transport)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        LOGGER.info("Created AsyncAdminAPI")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+        LOGGER.info("Closed AsyncAdminAPI client")
+
+    def _is_token_none(self, token: str) -> None:
+        if token is None:
+            exception_msg = "Received token is None"
+            raise TypeError(exception_msg)
+
+    async def _request(self, method: str, endpoint: str, token: str | None = None, **kwargs) -> httpx.Response:
+        if token is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Authorization": "Bearer " + token}
+        async with self._semaphore:
+            return await self.client.request(method, self.url + endpoint, **kwargs)
+
+    async def request(self, method: str, endpoint: str, token: str | None = None, **kwargs) -> httpx.Response:
+        """Send request to `endpoint` and return response of any status, e.g. to check rejection of invalid data."""
+        LOGGER.debug("Sending %s request to: %s", method, endpoint)
+        return await self._request(method, endpoint, token, **kwargs)
+
+    async def create_user(self, user: dict) -> str:
+        LOGGER.debug("Creating user: %s", user)
+        response = await self._request("POST", "users", json = user)
+        if response.status_code != 201:
+            exception_msg = f"Couldn't create user: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        token = response.json()["token"]
+        LOGGER.debug("Created user and received token: %s", token)
+        return token
+
+    async def log_in(self, email: str, password: str) -> str:
+        LOGGER.debug("Logging in user with credentials: {email: %s, password: %s}", email, password)
+        login_data = {
+            "email": email,
+            "password": password,
+        }
+        response = await self._request("POST", "users/login", json = login_data)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't log in: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        token = response.json()["token"]
+        LOGGER.debug("Logged in and received token: %s", token)
+        return token
+
+    async def log_out(self, token: str) -> None:
+        LOGGER.debug("Logging out with token: %s", token)
+        self._is_token_none(token)
+        response = await self._request("POST", "users/logout", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't log out: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        LOGGER.debug("Logged out")
+
+    async def get_user(self, token: str) -> dict:
+        LOGGER.debug("Getting user with token: %s", token)
+        self._is_token_none(token)
+        response = await self._request("GET", "users/me", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't get user: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        user = response.json()
+        LOGGER.debug("Received user: %s", user)
+        return user
+
+    async def patch_user(self, token: str, fields: dict) -> dict:
+        LOGGER.debug("Patching user with token: %s. Fields: %s", token, fields)
+        self._is_token_none(token)
+        response = await self._request("PATCH", "users/me", token, json = fields)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't patch user: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        user = response.json()
+        LOGGER.debug("Patched user: %s", user)
+        return user
+
+    async def delete_user(self, token: str) -> None:
+        LOGGER.debug("Deleting user with token: %s", token)
+        self._is_token_none(token)
+        response = await self._request("DELETE", "users/me", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't delete user: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        LOGGER.debug("User deleted")
+
+    async def create_contact(self, token: str, contact: dict) -> dict:
+        LOGGER.debug("Using token: %s. Creating contact: %s", token, contact)
+        self._is_token_none(token)
+        response = await self._request("POST", "contacts", token, json = contact)
+        if response.status_code != 201:
+            exception_msg = f"Couldn't create contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        created_contact = response.json()
+        LOGGER.debug("Contact created: %s", created_contact)
+        return created_contact
+
+    async def get_contact(self, token: str, contact_id: str) -> dict:
+        LOGGER.debug("Getting contact with id: %s using token: %s", contact_id, token)
+        self._is_token_none(token)
+        response = await self._request("GET", f"contacts/{contact_id}", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't get contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        contact = response.json()
+        LOGGER.debug("Received contact: %s", contact)
+        return contact
+
+    async def update_contact(self, token: str, contact_id: str, contact: dict) -> dict:
+        LOGGER.debug("Updating contact with id: %s using token: %s. New contact: %s", contact_id, token, contact)
+        self._is_token_none(token)
+        response = await self._request("PUT", f"contacts/{contact_id}", token, json = contact)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't update contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        updated_contact = response.json()
+        LOGGER.debug("Updated contact: %s", updated_contact)
+        return updated_contact
+
+    async def patch_contact(self, token: str, contact_id: str, fields: dict) -> dict:
+        LOGGER.debug("Patching contact with id: %s using token: %s. Fields: %s", contact_id, token, fields)
+        self._is_token_none(token)
+        response = await self._request("PATCH", f"contacts/{contact_id}", token, json = fields)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't patch contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        patched_contact = response.json()
+        LOGGER.debug("Patched contact: %s", patched_contact)
+        return patched_contact
+
+    async def delete_contact(self, token: str, contact_id: str) -> None:
+        LOGGER.debug("Deleting contact with id: %s using token: %s", contact_id, token)
+        self._is_token_none(token)
+        response = await self._request("DELETE", f"contacts/{contact_id}", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't delete contact: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        LOGGER.debug("Contact deleted")
+
+    async def get_contact_list(self, token: str) -> list:
+        LOGGER.debug("Getting contact list using token: %s", token)
+        self._is_token_none(token)
+        response = await self._request("GET", "contacts", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't get contact list: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        contact_list = response.json()
+        LOGGER.debug("Received contact list: %s", contact_list)
+        return contact_list
+
+    async def delete_contact_list(self, token: str) -> None:
+        LOGGER.debug("Deleting contact list using token: %s", token)
+        self._is_token_none(token)
+        response = await self._request("DELETE", "contacts", token)
+        if response.status_code != 200:
+            exception_msg = f"Couldn't delete contacts: {response.text}"
+            raise AdminAPIException(exception_msg, response.status_code)
+        LOGGER.debug("Contact list deleted")
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import base64
+import contextlib
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import RequestException
+
+from util.admin.transport import body_bytes, build_response
+
+if TYPE_CHECKING:
+    from requests.models import PreparedRequest, Response
+
+LOGGER = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Headers which describe the connection or the moment of recording rather than the response
+_SKIPPED_HEADERS = {"connection", "content-encoding", "content-length", "date", "keep-alive", "transfer-encoding"}
+
+
+class UnmatchedRequestError(RequestException):
+    """Raised in strict replay for a request which is not recorded in the cassette."""
+
+
+def request_key(request: PreparedRequest) -> str:
+    """Return digest identifying request by method, path with query, authorization and body.
+
+    JSON bodies are compared by content, not by formatting or key order.
+    """
+    url = urlsplit(request.url)
+    body = body_bytes(request)
+    with contextlib.suppress(ValueError):
+        body = json.dumps(json.loads(body), sort_keys = True).encode() if body else b""
+    path = url.path + ("?" + url.query if url.query else "")
+    parts = [request.method, path, request.headers.get("Authorization", "")]
+    digest = hashlib.sha256("\n".join(parts).encode() + b"\n" + body)
+    return digest.hexdigest()[:32]
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter which records responses into a cassette file or replays them from it.
+
+    In record mode requests are sent through `adapter` and every response is stored. In replay mode responses
+    are served from memory: requests with the same method, path, authorization and body get recorded responses
+    in recording order. Unmatched request raises `UnmatchedRequestError` in strict replay, otherwise it is sent
+    through `adapter` and added to the cassette. Cassette is written on `close()` if anything was recorded.
+
+    Cassette is a gzip-compressed JSON document with responses indexed by `request_key()`.
+    Mount it for the application url, e.g. with `AdminAPI(transport = CassetteAdapter(...))`.
+
+    Attributes:
+        path (str):      Cassette file.
+        mode (str):      `RECORD` or `REPLAY`.
+        strict (bool):   If True, unmatched requests fail in replay mode.
+        adapter (BaseAdapter): Adapter which sends requests that are recorded.
+
+    """
+
+    def __init__(
+        self, path: str, mode: str = REPLAY, *, strict: bool = False, adapter: BaseAdapter | None = None,
+    ) -> None:
+        if mode not in (RECORD, REPLAY):
+            exception_msg = f"Cassette mode must be {RECORD!r} or {REPLAY!r}, got {mode!r}"
+            raise ValueError(exception_msg)
+        super().__init__()
+        self.path = path
+        self.mode = mode
+        self.strict = strict
+        self.adapter = adapter if adapter is not None else HTTPAdapter()
+        self._lock = threading.Lock()
+        self._interactions = defaultdict(list)
+        self._requests = {}
+        self._played = defaultdict(int)
+        self._changed = False
+        if mode == REPLAY:
+            with gzip.open(path, "rt", encoding = "utf-8") as file:
+                document = json.load(file)
+            self._requests = document["requests"]
+            self._interactions.update(document["interactions"])
+            LOGGER.info("Loaded cassette %s with %d requests", path, sum(map(len, self._interactions.values())))
+
+    def _record(self, key: str, request: PreparedRequest, kwargs: dict) -> Response:
+        response = self.adapter.send(request, **kwargs)
+        body = response.content
+        headers = [(name, value) for name, value in response.headers.items() if name.lower() not in _SKIPPED_HEADERS]
+        try:
+            stored_body = {"text": body.decode()}
+        except UnicodeDecodeError:
+            stored_body = {"base64": base64.b64encode(body).decode()}
+        with self._lock:
+            self._requests.setdefault(key, f"{request.method} {urlsplit(request.url).path}")
+            self._interactions[key].append({"status": response.status_code, "headers": headers, **stored_body})
+            self._played[key] += 1
+            self._changed = True
+        return build_response(request, response.status_code, headers, body)
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        key = request_key(request)
+        if self.mode == RECORD:
+            return self._record(key, request, kwargs)
+        with self._lock:
+            recorded = self._interactions.get(key, [])
+            index = self._played[key]
+            if index < len(recorded):
+                self._played[key] += 1
+                interaction = recorded[index]
+            else:
+                interaction = None
+        if interaction is None:
+            if self.strict:
+                exception_msg = f"Request {request.method} {request.url} is not recorded in cassette {self.path}"
+                raise UnmatchedRequestError(exception_msg, request = request)
+            LOGGER.info("Recording request missing in cassette: %s %s", request.method, request.url)
+            return self._record(key, request, kwargs)
+        body = base64.b64decode(interaction["base64"]) if "base64" in interaction else interaction["text"].encode()
+        return build_response(request, interaction["status"], interaction["headers"], body)
+
+    def save(self) -> None:
+        with self._lock:
+            document = {"version": 1, "requests": self._requests, "interactions": self._interactions}
+            temporary = self.path + ".tmp"
+            with gzip.open(temporary, "wt", encoding = "utf-8") as file:
+                json.dump(document, file, separators = (",", ":"))
+            Path(temporary).replace(self.path)
+            self._changed = False
+        LOGGER.info("Saved cassette %s", self.path)
+
+    def close(self) -> None:
+        if self._changed:
+            self.save()
+        self.adapter.close()
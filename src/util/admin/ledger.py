@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from util.admin.admin_api import AdminAPIException
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from util.admin.admin_api import AdminAPI
+
+LOGGER = logging.getLogger(__name__)
+
+# Key telling the kind of a journal entry, the entry is applied by `_apply_<kind>` method
+_ENTRY_KINDS = (
+    "user", "leased_user", "returned_user", "contact", "deleted_contact", "deleted_contacts", "deleted_user",
+    "patched_user",
+)
+
+
+class ResourceLedger:
+    """Thread-safe record of users and contacts created through AdminAPI and not deleted yet.
+
+    AdminAPI registers every created resource in the ledger and removes it after successful deletion, so teardown
+    deletes exactly what was created with `sweep()` instead of guessing. `mark()` returns a position in the ledger,
+    sweeping since a mark deletes only resources created after it, e.g. by one test or module.
+    Contacts of a swept user are not deleted one by one, they are removed together with their owner.
+
+    Users leased from a pool are recorded apart from created users together with the pooled email and password,
+    they are never swept by tests because the pool returns them; `sweep(include_leases = True)` deletes leases
+    which a crashed run didn't end.
+
+    When `path` is given, every change is appended to that journal file and the ledger is restored from it,
+    so resources left by a crashed run are known to the next one. The journal is locked while the ledger is open,
+    `claim_stale()` opens only journals which no running process holds.
+
+    Attributes:
+        path (str):      Journal file or None if ledger is kept only in memory.
+
+    """
+
+    def __init__(self, path: str | None = None, *, blocking: bool = True) -> None:
+        """Open ledger and restore resources recorded in existing journal.
+
+        Raises:
+            BlockingIOError: If `blocking` is False and journal is locked by another ledger.
+
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._sequence = 0
+        # email -> {"sequence", "password"}
+        self._users = {}
+        # contact id -> {"sequence", "email", "password", "token"}, owner email and password are None if unknown
+        self._contacts = {}
+        # leased email -> {"sequence", "password", "pool_email", "pool_password"}
+        self._leases = {}
+        # token -> (email, password)
+        self._credentials = {}
+        self._journal = None
+        if path is not None:
+            # Journal stays open and locked until close()
+            self._journal = Path(path).open("a+", encoding = "utf-8")  # noqa: SIM115
+            if fcntl is not None:
+                try:
+                    fcntl.flock(self._journal.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except OSError:
+                    self._journal.close()
+                    raise
+            self._journal.seek(0)
+            for line in self._journal:
+                if line.strip():
+                    self._apply(json.loads(line))
+            if self._users or self._contacts or self._leases:
+                LOGGER.info(
+                    "Restored %d users, %d contacts and %d leases from ledger %s",
+                    len(self._users), len(self._contacts), len(self._leases), path,
+                )
+
+    @classmethod
+    def claim_stale(cls, directory: str, pattern: str = "*.jsonl") -> list:
+        """Open journals in `directory` which are not held by any open ledger."""
+        ledgers = []
+        for path in sorted(Path(directory).glob(pattern)):
+            try:
+                ledgers.append(cls(str(path), blocking = False))
+            except (BlockingIOError, FileNotFoundError):
+                continue
+        return ledgers
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close journal. Journal of an empty ledger is removed, otherwise it is compacted to live resources."""
+        with self._lock:
+            if self._journal is None:
+                return
+            self._journal.seek(0)
+            self._journal.truncate()
+            if not self._users and not self._contacts and not self._leases:
+                # Truncated first, so a process which opened it before removal finds nothing to restore
+                Path(self.path).unlink()
+            else:
+                for email, user in self._users.items():
+                    self._write({"user": email, "password": user["password"], "token": None})
+                for contact_id, contact in self._contacts.items():
+                    fields = {key: contact[key] for key in ("email", "password", "token")}
+                    self._write({"contact": contact_id, **fields})
+                for email, lease in self._leases.items():
+                    fields = {key: lease[key] for key in ("password", "pool_email", "pool_password")}
+                    self._write({"leased_user": email, "token": None, **fields})
+                LOGGER.warning(
+                    "Ledger %s still has %d users, %d contacts and %d leases",
+                    self.path, len(self._users), len(self._contacts), len(self._leases),
+                )
+            self._journal.close()
+            self._journal = None
+
+    def _write(self, entry: dict) -> None:
+        self._journal.write(json.dumps(entry) + "\n")
+        self._journal.flush()
+
+    def _apply(self, entry: dict) -> bool:
+        """Change ledger according to journal entry. Return False if it changed nothing."""
+        kind = next(kind for kind in _ENTRY_KINDS if kind in entry)
+        return getattr(self, f"_apply_{kind}")(entry)
+
+    def _apply_user(self, entry: dict) -> bool:
+        self._sequence += 1
+        self._users[entry["user"]] = {"sequence": self._sequence, "password": entry["password"]}
+        if entry["token"] is not None:
+            self._credentials[entry["token"]] = (entry["user"], entry["password"])
+        return True
+
+    def _apply_leased_user(self, entry: dict) -> bool:
+        self._sequence += 1
+        self._leases[entry["leased_user"]] = {
+            "sequence": self._sequence,
+            "password": entry["password"],
+            "pool_email": entry["pool_email"],
+            "pool_password": entry["pool_password"],
+        }
+        if entry["token"] is not None:
+            self._credentials[entry["token"]] = (entry["leased_user"], entry["password"])
+        return True
+
+    def _apply_returned_user(self, entry: dict) -> bool:
+        return self._leases.pop(entry["returned_user"], None) is not None
+
+    def _apply_contact(self, entry: dict) -> bool:
+        self._sequence += 1
+        self._contacts[entry["contact"]] = {
+            "sequence": self._sequence,
+            "email": entry["email"],
+            "password": entry["password"],
+            "token": entry["token"],
+        }
+        return True
+
+    def _apply_deleted_contact(self, entry: dict) -> bool:
+        return self._contacts.pop(entry["deleted_contact"], None) is not None
+
+    def _apply_deleted_contacts(self, entry: dict) -> bool:
+        email, token = entry["deleted_contacts"], entry["token"]
+        owned = [
+            contact_id for contact_id, contact in self._contacts.items()
+            if (email is not None and contact["email"] == email) or contact["token"] == token
+        ]
+        for contact_id in owned:
+            del self._contacts[contact_id]
+        return bool(owned)
+
+    def _apply_deleted_user(self, entry: dict) -> bool:
+        email = entry["deleted_user"]
+        owned = [contact_id for contact_id, contact in self._contacts.items() if contact["email"] == email]
+        for contact_id in owned:
+            del self._contacts[contact_id]
+        for token in [token for token, credentials in self._credentials.items() if credentials[0] == email]:
+            del self._credentials[token]
+        leased = self._leases.pop(email, None) is not None
+        return self._users.pop(email, None) is not None or leased or bool(owned)
+
+    def _apply_patched_user(self, entry: dict) -> bool:
+        old_email, email, password = entry["patched_user"], entry["email"], entry["password"]
+        if old_email in self._users:
+            user = self._users.pop(old_email)
+            self._users[email] = {"sequence": user["sequence"], "password": password}
+        if old_email in self._leases:
+            lease = self._leases.pop(old_email)
+            self._leases[email] = {**lease, "password": password}
+        for contact in self._contacts.values():
+            if contact["email"] == old_email:
+                contact["email"], contact["password"] = email, password
+        for token, credentials in self._credentials.items():
+            if credentials[0] == old_email:
+                self._credentials[token] = (email, password)
+        return True
+
+    def _record(self, entry: dict) -> None:
+        with self._lock:
+            if self._apply(entry) and self._journal is not None:
+                self._write(entry)
+
+    def add_user(self, email: str, password: str, token: str) -> None:
+        self._record({"user": email, "password": password, "token": token})
+
+    def add_token(self, token: str, email: str, password: str) -> None:
+        """Remember owner of token received from log in, so contacts created with it can be swept later."""
+        with self._lock:
+            self._credentials[token] = (email, password)
+
+    def add_lease(self, token: str, email: str, password: str, pool_email: str, pool_password: str) -> None:
+        """Record pooled user patched to `email` and `password` for a test, so a crashed run can't leak it."""
+        self._record({
+            "leased_user": email,
+            "password": password,
+            "token": token,
+            "pool_email": pool_email,
+            "pool_password": pool_password,
+        })
+
+    def end_lease(self, token: str) -> None:
+        """Forget lease of token owner after the user was returned to the pool."""
+        with self._lock:
+            if token in self._credentials:
+                self._record({"returned_user": self._credentials[token][0]})
+
+    def patch_user(self, token: str, email: str | None = None, password: str | None = None) -> None:
+        with self._lock:
+            if token not in self._credentials:
+                return
+            old_email, old_password = self._credentials[token]
+            self._record({
+                "patched_user": old_email,
+                "email": email if email is not None else old_email,
+                "password": password if password is not None else old_password,
+            })
+
+    def remove_user(self, token: str) -> None:
+        with self._lock:
+            if token in self._credentials:
+                self._record({"deleted_user": self._credentials[token][0]})
+            else:
+                self._record({"deleted_contacts": None, "token": token})
+
+    def add_contact(self, token: str, contact_id: str) -> None:
+        with self._lock:
+            email, password = self._credentials.get(token, (None, None))
+            self._record({"contact": contact_id, "email": email, "password": password, "token": token})
+
+    def remove_contact(self, contact_id: str) -> None:
+        self._record({"deleted_contact": contact_id})
+
+    def remove_contacts(self, token: str) -> None:
+        """Forget all contacts of the token owner, e.g. after its contact list was deleted."""
+        with self._lock:
+            email = self._credentials.get(token, (None, None))[0]
+            self._record({"deleted_contacts": email, "token": token})
+
+    def mark(self) -> int:
+        with self._lock:
+            return self._sequence
+
+    def pending(self, since: int = 0) -> tuple:
+        """Return (users, contacts) recorded after `since` mark.
+
+        Users are (email, password) pairs, contacts are (contact id, owner email, owner password, token) tuples.
+        """
+        with self._lock:
+            users = [(email, user["password"]) for email, user in self._users.items() if user["sequence"] > since]
+            contacts = [
+                (contact_id, contact["email"], contact["password"], contact["token"])
+                for contact_id, contact in self._contacts.items() if contact["sequence"] > since
+            ]
+        return users, contacts
+
+    def leases(self) -> list:
+        """Return leased users as (email, password, pooled email, pooled password) tuples."""
+        with self._lock:
+            return [
+                (email, lease["password"], lease["pool_email"], lease["pool_password"])
+                for email, lease in self._leases.items()
+            ]
+
+    def _sweep_leases(self, admin: AdminAPI, max_workers: int) -> None:
+        # Crash could happen before or after the user got its pooled email and password back, so both are tried
+        leases = self.leases()
+        credentials = []
+        for email, password, pool_email, pool_password in leases:
+            credentials += [(email, password), (pool_email, pool_password)]
+        results = admin.delete_users(credentials, max_workers)
+        for index, (email, *_) in enumerate(leases):
+            pair = results[2 * index:2 * index + 2]
+            if True in pair or all(result is False for result in pair):
+                self._record({"deleted_user": email})
+
+    def _sweep_contacts(self, admin: AdminAPI, contacts: list, swept: set, max_workers: int) -> None:
+        # Contacts of swept users are deleted with their owner, the rest are deleted by owner logged in again
+        owners = defaultdict(list)
+        for contact_id, email, password, token in contacts:
+            if email not in swept:
+                owners[(email, password, token)].append(contact_id)
+        for (email, password, token), contact_ids in owners.items():
+            try:
+                owner_token = admin.log_in(email, password) if email is not None else token
+            except AdminAPIException as exception:
+                if exception.status_code != 401:
+                    continue
+                # Owner doesn't exist anymore, its contacts were deleted with it
+                self._record({"deleted_user": email})
+                continue
+            results = admin.delete_contacts(owner_token, contact_ids, max_workers)
+            for contact_id, result in zip(contact_ids, results, strict = True):
+                if not isinstance(result, AdminAPIException) or result.status_code in (400, 401, 404):
+                    self.remove_contact(contact_id)
+
+    def sweep(self, admin: AdminAPI, since: int = 0, max_workers: int = 10, *, include_leases: bool = False) -> int:
+        """Delete users and contacts recorded after `since` mark in concurrent batches.
+
+        Leased users are deleted only with `include_leases`, e.g. for a journal of a crashed run, because running
+        pool returns them itself. Resources which are already gone are forgotten.
+        Return number of resources which couldn't be deleted.
+        """
+        if include_leases and self._leases:
+            self._sweep_leases(admin, max_workers)
+        users, contacts = self.pending(since)
+        if not users and not contacts:
+            return len(self._leases) if include_leases else 0
+        self._sweep_contacts(admin, contacts, {email for email, _ in users}, max_workers)
+        results = admin.delete_users(users, max_workers)
+        for (email, _), result in zip(users, results, strict = True):
+            # Sweeping client may have no ledger attached, so deleted users are forgotten here too
+            if isinstance(result, bool):
+                self._record({"deleted_user": email})
+        users, contacts = self.pending(since)
+        left = len(users) + len(contacts) + (len(self._leases) if include_leases else 0)
+        if left:
+            LOGGER.warning("Couldn't delete %d users and %d contacts from ledger", len(users), len(contacts))
+        else:
+            LOGGER.info("Swept ledger since mark %d", since)
+        return left
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+LOGGER = logging.getLogger(__name__)
+
+_STATE = struct.Struct("dd")
+
+
+class RateLimiter:
+    """Token bucket limiting requests per second, optionally shared by all processes on the host.
+
+    Bucket holds up to `burst` tokens and is refilled with `rate` tokens per second. Every request takes one token
+    and waits until it is available. When `path` is given, bucket state lives in that file and is updated under
+    an exclusive file lock, so all workers of a parallel run together stay within the limit.
+    Without `fcntl` (Windows) the bucket is shared only by threads of one process.
+
+    Attributes:
+        rate (float):    Tokens added per second, i.e. sustained requests per second.
+        burst (int):     Maximum number of tokens, i.e. requests which can be sent at once after idle time.
+        path (str):      File with shared bucket state or None.
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1, path: str | None = None) -> None:
+        if rate <= 0 or burst < 1:
+            exception_msg = f"Rate must be positive and burst at least 1, got rate={rate}, burst={burst}"
+            raise ValueError(exception_msg)
+        self.rate = rate
+        self.burst = burst
+        self.path = path if fcntl is not None else None
+        if path is not None and self.path is None:
+            LOGGER.warning("File locks are not supported, rate limit is shared only inside this process")
+        self._lock = threading.Lock()
+        self._state = (float(burst), time.monotonic())
+
+    def _take(self, state: tuple) -> tuple:
+        """Refill bucket, take one token if possible and return new state with seconds to wait before retry."""
+        tokens, updated = state
+        now = time.monotonic()
+        if updated > now:
+            # State was written before reboot, monotonic clock started again
+            tokens, updated = float(self.burst), now
+        tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+        if tokens >= 1:
+            return (tokens - 1, now), 0.0
+        return (tokens, now), (1 - tokens) / self.rate
+
+    def _take_shared(self) -> float:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.pread(fd, _STATE.size, 0)
+            state = _STATE.unpack(raw) if len(raw) == _STATE.size else (float(self.burst), time.monotonic())
+            state, wait = self._take(state)
+            os.pwrite(fd, _STATE.pack(*state), 0)
+            return wait
+        finally:
+            os.close(fd)
+
+    def acquire(self) -> None:
+        """Block until request is allowed."""
+        while True:
+            with self._lock:
+                if self.path is not None:
+                    wait = self._take_shared()
+                else:
+                    self._state, wait = self._take(self._state)
+            if wait <= 0:
+                return
+            time.sleep(wait)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """LRU cache of GET responses revalidated with `ETag` and `Last-Modified`.
+
+    Responses are cached per token and url. Cached response is served without a request while it is younger than
+    `max_age` seconds, after that it is revalidated with `If-None-Match`/`If-Modified-Since` and reused on 304.
+    Writes made through the same client must invalidate affected entries.
+
+    Attributes:
+        max_entries (int): Maximum number of cached responses, least recently used are evicted first.
+        max_age (float):   Seconds during which cached response is used without revalidation.
+
+    """
+
+    def __init__(self, max_entries: int = 256, max_age: float = 0) -> None:
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str | None, url: str) -> tuple:
+        """Return cached response and whether it is still fresh, or (None, False)."""
+        with self._lock:
+            entry = self._entries.get((token, url))
+            if entry is None:
+                return None, False
+            self._entries.move_to_end((token, url))
+        response, validated = entry
+        return response, time.monotonic() - validated < self.max_age
+
+    def validators(self, response: requests.Response) -> dict:
+        headers = {}
+        if "ETag" in response.headers:
+            headers["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+    def put(self, token: str | None, url: str, response: requests.Response) -> None:
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers and not self.max_age:
+            return
+        with self._lock:
+            self._entries[(token, url)] = (response, time.monotonic())
+            self._entries.move_to_end((token, url))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last = False)
+
+    def invalidate(self, token: str | None, *urls: str, prefix: str | None = None) -> None:
+        """Forget responses of `urls` and, if `prefix` is given, of every url starting with it."""
+        with self._lock:
+            for url in urls:
+                self._entries.pop((token, url), None)
+            if prefix is not None:
+                for key in [key for key in self._entries if key[0] == token and key[1].startswith(prefix)]:
+                    del self._entries[key]
+
+    def invalidate_token(self, token: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == token]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TeardownQueue:
+    """Queue of teardown calls run by background threads, so tests don't wait for deletions of previous ones.
+
+    Calls submitted with the same key, e.g. email of the user which owns deleted resources, run one after another
+    in submission order, calls with different keys run concurrently. Exceptions of calls are kept and returned
+    by `wait()`, which is a safe point where all queued calls of the key or of all keys are finished.
+    With `max_workers = 0` calls run immediately in the caller and their exceptions propagate as without the queue.
+
+    Attributes:
+        max_workers (int): Number of background threads, 0 runs calls immediately.
+
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix = "teardown") if max_workers else None
+        self._pending = {}
+        self._failures = []
+        self._condition = threading.Condition()
+
+    def submit(self, key: Hashable, function: Callable, *args, **kwargs) -> None:
+        if self._executor is None:
+            function(*args, **kwargs)
+            return
+        with self._condition:
+            calls = self._pending.setdefault(key, deque())
+            calls.append((function, args, kwargs))
+            if len(calls) == 1:
+                self._executor.submit(self._run, key)
+
+    def _run(self, key: Hashable) -> None:
+        while True:
+            with self._condition:
+                function, args, kwargs = self._pending[key][0]
+            try:
+                function(*args, **kwargs)
+            except Exception as exception:
+                # Any failure is kept for wait(), traceback is logged because it is not raised in the test
+                LOGGER.warning("Deferred teardown of %s failed: %s", key, exception, exc_info = True)
+                with self._condition:
+                    self._failures.append((key, exception))
+            with self._condition:
+                calls = self._pending[key]
+                calls.popleft()
+                if not calls:
+                    del self._pending[key]
+                    self._condition.notify_all()
+                    return
+
+    def wait(self, key: Hashable | None = None) -> list:
+        """Wait for queued calls of `key` or of all keys. Return and forget their failures as (key, exception)."""
+        with self._condition:
+            if key is None:
+                self._condition.wait_for(lambda: not self._pending)
+                failures, self._failures = self._failures, []
+            else:
+                self._condition.wait_for(lambda: key not in self._pending)
+                failures = [failure for failure in self._failures if failure[0] == key]
+                self._failures = [failure for failure in self._failures if failure[0] != key]
+        return failures
+
+    def close(self) -> list:
+        """Wait for all queued calls and stop background threads. Return failures which were not returned yet."""
+        failures = self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+        return failures
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """Thread-safe cache of authorization tokens keyed by user credentials.
+
+    Tokens live for `ttl` seconds. Besides the credential key, the cache remembers which credentials each token
+    belongs to, so a token can be invalidated when it is logged out, its user is deleted or it is rejected.
+
+    Attributes:
+        ttl (float):     Seconds after which cached token is considered stale.
+
+    """
+
+    def __init__(self, ttl: float = 300) -> None:
+        self.ttl = ttl
+        self._tokens = {}
+        self._credentials = {}
+        self._lock = threading.Lock()
+
+    def get(self, email: str, password: str) -> str | None:
+        key = (email, password)
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                return None
+            token, expires = entry
+            if time.monotonic() >= expires:
+                del self._tokens[key]
+                self._credentials.pop(token, None)
+                LOGGER.debug("Cached token expired for: %s", email)
+                return None
+        LOGGER.debug("Using cached token for: %s", email)
+        return token
+
+    def put(self, email: str, password: str, token: str) -> None:
+        key = (email, password)
+        with self._lock:
+            previous = self._tokens.get(key)
+            if previous is not None:
+                self._credentials.pop(previous[0], None)
+            self._tokens[key] = (token, time.monotonic() + self.ttl)
+            self._credentials[token] = key
+
+    def invalidate(self, token: str) -> tuple | None:
+        """Forget token and return credentials it belonged to, if they are known."""
+        with self._lock:
+            key = self._credentials.pop(token, None)
+            if key is not None and self._tokens.get(key, (None,))[0] == token:
+                del self._tokens[key]
+        if key is not None:
+            LOGGER.debug("Invalidated cached token for: %s", key[0])
+        return key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+            self._credentials.clear()
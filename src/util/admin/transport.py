@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import io
+import sys
+import threading
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from requests.models import PreparedRequest
+
+
+def body_bytes(request: PreparedRequest) -> bytes:
+    """Return body of prepared request as bytes, empty if it has none."""
+    body = request.body
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode()
+    return body
+
+
+def build_response(request: PreparedRequest, status: int, headers: list, body: bytes) -> Response:
+    """Return response to `request` made of status, (name, value) header pairs and body, as network adapters do."""
+    response = Response()
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(body)
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class WSGIAdapter(BaseAdapter):
+    """Transport adapter which passes requests directly to in-process WSGI application without sockets.
+
+    Mount it on `requests.Session` for the application url, e.g. `session.mount("http://stand-in/", adapter)`.
+    """
+
+    def __init__(self, app: Callable) -> None:
+        super().__init__()
+        self.app = app
+
+    def send(self, request: PreparedRequest, **_kwargs) -> Response:
+        url = urlsplit(request.url)
+        body = body_bytes(request)
+        environ = {
+            "REQUEST_METHOD": request.method,
+            "PATH_INFO": url.path or "/",
+            "QUERY_STRING": url.query,
+            "CONTENT_TYPE": request.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": str(len(body)),
+            "SERVER_NAME": url.hostname or "localhost",
+            "SERVER_PORT": str(url.port or (443 if url.scheme == "https" else 80)),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": url.scheme,
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in request.headers.items():
+            key = "HTTP_" + name.upper().replace("-", "_")
+            if key not in ("HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+                environ[key] = value
+
+        response_start = []
+
+        def start_response(status: str, headers: list, exc_info: object = None) -> None:  # noqa: ARG001 - WSGI signature
+            response_start[:] = [status, headers]
+
+        chunks = self.app(environ, start_response)
+        try:
+            content = b"".join(chunks)
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+        status, headers = response_start
+        return build_response(request, int(status.split(" ", 1)[0]), headers, content)
+
+    def close(self) -> None:
+        pass
+
+
+class ASGIAdapter(BaseAdapter):
+    """Transport adapter which passes requests directly to in-process ASGI application without sockets.
+
+    Application runs on an event loop in a background thread, so the adapter can be used from many threads.
+    """
+
+    def __init__(self, app: Callable) -> None:
+        super().__init__()
+        self.app = app
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target = self._loop.run_forever, name = "asgi-adapter", daemon = True)
+        self._thread.start()
+
+    async def _call(self, request: PreparedRequest) -> tuple:
+        url = urlsplit(request.url)
+        body = body_bytes(request)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": url.scheme,
+            "path": url.path or "/",
+            "raw_path": (url.path or "/").encode(),
+            "query_string": url.query.encode(),
+            "root_path": "",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in request.headers.items()],
+            "server": (url.hostname or "localhost", url.port or (443 if url.scheme == "https" else 80)),
+            "client": ("127.0.0.1", 0),
+        }
+        received = False
+        status = 500
+        headers = []
+        content = bytearray()
+
+        async def receive() -> dict:
+            nonlocal received
+            if received:
+                return {"type": "http.disconnect"}
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: dict) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = [(name.decode(), value.decode()) for name, value in message.get("headers", [])]
+            elif message["type"] == "http.response.body":
+                content.extend(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, headers, bytes(content)
+
+    def send(self, request: PreparedRequest, **_kwargs) -> Response:
+        status, headers, content = asyncio.run_coroutine_threadsafe(self._call(request), self._loop).result()
+        return build_response(request, status, headers, content)
+
+    def close(self) -> None:
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+
+def app_adapter(app: Callable) -> BaseAdapter:
+    """Return `ASGIAdapter` for coroutine applications and `WSGIAdapter` for any other callable."""
+    # Instance of a class with `async def __call__` is not a coroutine function itself
+    call = app if inspect.isfunction(app) or inspect.ismethod(app) else type(app).__call__
+    if inspect.iscoroutinefunction(call):
+        return ASGIAdapter(app)
+    return WSGIAdapter(app)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from util.admin.admin_api import AdminAPIException
+
+if TYPE_CHECKING:
+    from util.admin.admin_api import AdminAPI
+
+LOGGER = logging.getLogger(__name__)
+
+
+class UserPool:
+    """Pool of registered users leased to tests instead of registering and deleting a user for every test.
+
+    Leased user is patched to the requested profile, on release its contacts are deleted and its email and password
+    are reset to the ones of the pool, so idle users never hold emails which tests use; user which can't be reset
+    is deleted. Idle pooled users are not recorded in the AdminAPI ledger, they live until `clear()`. Leases are
+    recorded, so users leased by a crashed run are deleted by the next sweep of its ledger.
+    Idle accounts can be saved and passed to a new pool in the next run. They are checked on lease:
+    expired token is renewed with a log in and users which can't log in anymore are dropped.
+
+    Attributes:
+        admin (AdminAPI):    Client used for all requests.
+        email_template (str): Email of idle pooled users with `{}` for their number, e.g. `john.green+p{}@mail.com`.
+        password (str):      Password of idle pooled users.
+        accounts (list):     Idle users as dicts with "number", "email", "password" and "token".
+
+    """
+
+    def __init__(self, admin: AdminAPI, email_template: str, password: str, accounts: list | None = None) -> None:
+        self.admin = admin
+        self.email_template = email_template
+        self.password = password
+        self.accounts = list(accounts) if accounts is not None else []
+        self._leased = {}
+        self._next_number = max((account["number"] for account in self.accounts), default = -1) + 1
+        self._lock = threading.Lock()
+
+    def _register(self) -> dict:
+        with self._lock:
+            number = self._next_number
+            self._next_number += 1
+        email = self.email_template.format(number)
+        user = {"firstName": "Pooled", "lastName": "User", "email": email, "password": self.password}
+        try:
+            token = self.admin.create_user(user)
+        except AdminAPIException as exception:
+            # Idle users registered by a crashed run are not in the saved accounts, so their numbers are reused
+            try:
+                token = self.admin.log_in(email, self.password)
+            except AdminAPIException:
+                raise exception from None
+            LOGGER.info("Adopted pooled user %s left by a previous run", email)
+            return {"number": number, "email": email, "password": self.password, "token": token}
+        # Pooled users outlive tests, so teardown sweeps must not delete them
+        if self.admin.ledger is not None:
+            self.admin.ledger.remove_user(token)
+        LOGGER.info("Registered pooled user %s", email)
+        return {"number": number, "email": email, "password": self.password, "token": token}
+
+    def _patch(self, account: dict, fields: dict) -> str | None:
+        """Patch account with its token, renewing the token if needed. Return None if account is not valid."""
+        token = account["token"]
+        try:
+            self.admin.patch_user(token, fields)
+        except AdminAPIException as exception:
+            if exception.status_code != 401:
+                raise
+        else:
+            return token
+        try:
+            token = self.admin.log_in(account["email"], account["password"])
+        except AdminAPIException:
+            LOGGER.warning("Pooled user %s can't log in anymore, dropping it", account["email"])
+            return None
+        self.admin.patch_user(token, fields)
+        return token
+
+    def lease(self, user: dict) -> str:
+        """Change pooled user to `user` profile and return its token. Registers a new user if pool is empty."""
+        while True:
+            with self._lock:
+                account = self.accounts.pop() if self.accounts else None
+            if account is None:
+                account = self._register()
+            # Changing password makes the application hash it, so it is skipped when it is the same
+            fields = {key: value for key, value in user.items() if key != "password" or value != account["password"]}
+            try:
+                token = self._patch(account, fields)
+            except AdminAPIException:
+                with self._lock:
+                    self.accounts.append(account)
+                raise
+            if token is not None:
+                break
+        if self.admin.token_cache is not None:
+            self.admin.token_cache.put(user["email"], user["password"], token)
+        if self.admin.ledger is not None:
+            self.admin.ledger.add_lease(token, user["email"], user["password"], account["email"], account["password"])
+        with self._lock:
+            self._leased[token] = (account, user)
+        LOGGER.debug("Leased pooled user %s as %s", account["email"], user["email"])
+        return token
+
+    def _delete(self, token: str, account: dict, user: dict) -> None:
+        """Delete leased user which can't be returned to the pool, so it doesn't keep the test's email."""
+        try:
+            self.admin.delete_user(token)
+        except AdminAPIException:
+            # Token could be invalidated, the user has either the test's or the pooled credentials
+            credentials = [(user["email"], user["password"]), (account["email"], account["password"])]
+            if True not in self.admin.delete_users(credentials):
+                LOGGER.warning("Couldn't delete pooled user %s leased as %s", account["email"], user["email"])
+
+    def release(self, token: str) -> None:
+        """Delete contacts of leased user and return it to the pool. User which can't be reset is deleted."""
+        with self._lock:
+            account, user = self._leased.pop(token)
+        try:
+            try:
+                contacts = self.admin.get_contact_list(token)
+            except AdminAPIException as exception:
+                if exception.status_code != 401:
+                    raise
+                # Token was logged out by the test
+                token = self.admin.log_in(user["email"], user["password"])
+                contacts = self.admin.get_contact_list(token)
+            for result in self.admin.delete_contacts(token, [contact["_id"] for contact in contacts]):
+                if isinstance(result, AdminAPIException):
+                    raise result
+            # Test could change password, so it is always reset
+            self.admin.patch_user(token, {"email": account["email"], "password": account["password"]})
+        except AdminAPIException as exception:
+            LOGGER.warning("Couldn't reset pooled user %s, deleting it: %s", account["email"], exception)
+            self._delete(token, account, user)
+            return
+        if self.admin.ledger is not None:
+            self.admin.ledger.end_lease(token)
+        account["token"] = token
+        with self._lock:
+            self.accounts.append(account)
+        LOGGER.debug("Released pooled user %s", account["email"])
+
+    def clear(self) -> None:
+        """Delete all idle pooled users."""
+        with self._lock:
+            accounts, self.accounts = self.accounts, []
+        results = self.admin.delete_users([(account["email"], account["password"]) for account in accounts])
+        LOGGER.info("Deleted %d pooled users", sum(result is True for result in results))
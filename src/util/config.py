@@ -0,0 +1,16 @@
+import os
+
+BASE_URL_ENV = "CONTACT_LIST_URL"
+DEFAULT_BASE_URL = "https://thinking-tester-contact-list.herokuapp.com/"
+
+
+def get_base_url() -> str:
+    """Return Contact List Application base url ending with slash.
+
+    Url is taken from `CONTACT_LIST_URL` environment variable, which is also set by `--contact-list-url`
+    and `--stand-in` pytest options. Falls back to the public Heroku application.
+    """
+    url = os.environ.get(BASE_URL_ENV) or DEFAULT_BASE_URL
+    if not url.endswith("/"):
+        url += "/"
+    return url
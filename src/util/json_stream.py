@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = "0123456789.eE+-"
+
+
+class _Reader:
+    """Text decoded from byte chunks on demand. Only the not yet parsed tail is kept in `buffer`."""
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self.buffer = ""
+        self.position = 0
+        self.finished = False
+
+    def read_more(self) -> None:
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.buffer = self.buffer[self.position:] + self._decoder.decode(b"", final = True)
+            self.finished = True
+        else:
+            self.buffer = self.buffer[self.position:] + self._decoder.decode(chunk)
+        self.position = 0
+
+    def peek(self) -> str | None:
+        """Skip whitespace, reading more data if needed. Return next character or None if stream ended."""
+        while True:
+            buffer, position = self.buffer, self.position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self.position = position
+            if position < len(buffer):
+                return buffer[position]
+            if self.finished:
+                return None
+            self.read_more()
+
+    def decode(self, decoder: json.JSONDecoder) -> object:
+        """Decode value at current position, reading more data until it is complete."""
+        while True:
+            buffer = self.buffer
+            try:
+                value, end = decoder.raw_decode(buffer, self.position)
+            except json.JSONDecodeError:
+                if self.finished:
+                    raise
+                self.read_more()
+                continue
+            if not self.finished and type(value) in (int, float):
+                # Number cut at buffer end is decoded without its tail, e.g. `2` of `2.5` or `1` of `1e5`
+                tail = end
+                while tail < len(buffer) and buffer[tail] in _NUMBER_CHARACTERS:
+                    tail += 1
+                if tail == len(buffer):
+                    self.read_more()
+                    continue
+            self.position = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator:
+    """Parse JSON array from byte chunks and yield its elements one by one.
+
+    Only the not yet parsed tail of the stream is kept in memory, so memory use is bounded by
+    the size of one element plus one chunk regardless of the array length.
+
+    Raises:
+        ValueError: If stream is not a valid JSON array.
+
+    """
+    decoder = json.JSONDecoder()
+    reader = _Reader(chunks, encoding)
+    if reader.peek() != "[":
+        exception_msg = "JSON stream doesn't start with array"
+        raise ValueError(exception_msg)
+    reader.position += 1
+    started = False
+    while True:
+        character = reader.peek()
+        if character is None:
+            exception_msg = "JSON array is not closed"
+            raise ValueError(exception_msg)
+        if character == "]":
+            return
+        if started:
+            if character != ",":
+                exception_msg = f"Expected ',' in JSON array, got {character!r}"
+                raise ValueError(exception_msg)
+            reader.position += 1
+            if reader.peek() is None:
+                exception_msg = "JSON array is not closed"
+                raise ValueError(exception_msg)
+        started = True
+        yield reader.decode(decoder)
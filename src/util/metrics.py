@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+
+# Upper bounds in seconds of histogram buckets exported to OpenMetrics
+EXPORT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of latencies with microsecond resolution.
+
+    Values below `2 ** precision_bits` microseconds are counted exactly, larger ones fall into buckets whose width
+    doubles every power of two, so relative error stays below `2 ** (1 - precision_bits)` for any value.
+    Recording is a few integer operations and one dictionary update.
+
+    Attributes:
+        count (int):     Number of recorded values.
+        total (float):   Sum of recorded values in seconds.
+        min (float):     Smallest recorded value in seconds.
+        max (float):     Largest recorded value in seconds.
+
+    """
+
+    def __init__(self, precision_bits: int = 7) -> None:
+        self._precision_bits = precision_bits
+        self._half = 1 << (precision_bits - 1)
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def _index(self, micros: int) -> int:
+        shift = micros.bit_length() - self._precision_bits
+        if shift <= 0:
+            return micros
+        return shift * self._half + (micros >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < 2 * self._half:
+            return index
+        shift = index // self._half - 1
+        return ((index - shift * self._half + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        index = self._index(int(seconds * 1_000_000))
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        with self._lock:
+            for index, count in other._counts.items():
+                self._counts[index] = self._counts.get(index, 0) + count
+            self.count += other.count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Return value in seconds which `percent` of recorded values don't exceed."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index) / 1_000_000, self.max)
+        return self.max
+
+    def count_at_or_below(self, seconds: float) -> int:
+        limit = int(seconds * 1_000_000)
+        return sum(count for index, count in self._counts.items() if self._highest_equivalent(index) <= limit)
+
+
+class MetricsRecorder:
+    """AdminAPI hook collecting latency, status and bytes of requests per endpoint and method.
+
+    Pass instance to `AdminAPI.add_hook()`. Collected data can be exported as OpenMetrics text
+    with `to_openmetrics()` or as a table of percentiles with `format_summary()`.
+    """
+
+    def __init__(self) -> None:
+        self.latencies = defaultdict(LatencyHistogram)
+        self.statuses = defaultdict(int)
+        self.bytes_sent = defaultdict(int)
+        self.bytes_received = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def __call__(  # noqa: PLR0913, PLR0917 - signature of AdminAPI hooks
+        self, method: str, endpoint: str, status: int, seconds: float, sent: int, received: int,
+    ) -> None:
+        key = (endpoint, method)
+        with self._lock:
+            histogram = self.latencies[key]
+            self.statuses[(endpoint, method, status)] += 1
+            self.bytes_sent[key] += sent
+            self.bytes_received[key] += received
+        histogram.record(seconds)
+
+    def to_openmetrics(self) -> str:
+        lines = [
+            "# TYPE admin_api_request_duration_seconds histogram",
+            "# UNIT admin_api_request_duration_seconds seconds",
+            "# HELP admin_api_request_duration_seconds Latency of Contact List API requests made by AdminAPI.",
+        ]
+        for (endpoint, method), histogram in sorted(self.latencies.items()):
+            labels = f'endpoint="{endpoint}",method="{method}"'
+            for bound in EXPORT_BUCKETS:
+                count = histogram.count_at_or_below(bound)
+                lines.append(f'admin_api_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'admin_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"admin_api_request_duration_seconds_count{{{labels}}} {histogram.count}")
+            lines.append(f"admin_api_request_duration_seconds_sum{{{labels}}} {histogram.total}")
+        lines.append("# TYPE admin_api_requests counter")
+        lines.append("# HELP admin_api_requests Number of requests by response status.")
+        for (endpoint, method, status), count in sorted(self.statuses.items()):
+            labels = f'endpoint="{endpoint}",method="{method}",status="{status}"'
+            lines.append(f"admin_api_requests_total{{{labels}}} {count}")
+        for name, values, help_text in (
+            ("admin_api_request_bytes", self.bytes_sent, "Bytes of request bodies."),
+            ("admin_api_response_bytes", self.bytes_received, "Bytes of response bodies."),
+        ):
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"# UNIT {name} bytes")
+            lines.append(f"# HELP {name} {help_text}")
+            for (endpoint, method), value in sorted(values.items()):
+                lines.append(f'{name}_total{{endpoint="{endpoint}",method="{method}"}} {value}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self) -> list:
+        header = (
+            f"{'endpoint':<18} {'method':<7} {'count':>6} {'errors':>6} "
+            f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+        )
+        lines = [header, "-" * len(header)]
+        for (endpoint, method), histogram in sorted(self.latencies.items()):
+            errors = sum(
+                count for (_endpoint, _method, status), count in self.statuses.items()
+                if (_endpoint, _method) == (endpoint, method) and status >= 400
+            )
+            lines.append(
+                f"{endpoint:<18} {method:<7} {histogram.count:>6} {errors:>6} "
+                f"{histogram.percentile(50) * 1000:>8.2f} {histogram.percentile(90) * 1000:>8.2f} "
+                f"{histogram.percentile(99) * 1000:>8.2f} {histogram.max * 1000:>8.2f}",
+            )
+        return lines
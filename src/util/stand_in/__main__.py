@@ -0,0 +1,24 @@
+import argparse
+import contextlib
+import logging
+
+from util.stand_in.server import StandInServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog = "python -m util.stand_in",
+        description = "Run local in-memory Contact List server.",
+    )
+    parser.add_argument("--host", default = "127.0.0.1", help = "interface to listen on")
+    parser.add_argument("--port", type = int, default = 8000, help = "port to listen on, 0 picks a free one")
+    parser.add_argument("--log-level", default = "INFO", help = "logging level")
+    args = parser.parse_args()
+    logging.basicConfig(level = args.log_level, format = "%(asctime)s [%(levelname)s] %(message)s")
+    server = StandInServer(args.host, args.port)
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from util.stand_in.store import ContactListStore, StandInError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ContactListApp:
+    """WSGI application implementing Contact List API on top of `ContactListStore`.
+
+    Implements `/users`, `/users/login`, `/users/logout`, `/users/me`, `/contacts` and `/contacts/{id}` endpoints
+    with the same status codes and JSON bodies as the public application.
+    Like Express, successful GET responses carry weak `ETag` and `If-None-Match` is answered with 304.
+
+    Attributes:
+        store (ContactListStore): Storage with all users and contacts of the application.
+
+    """
+
+    def __init__(self, store: ContactListStore | None = None) -> None:
+        self.store = store if store is not None else ContactListStore()
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "/").rstrip("/") or "/"
+        try:
+            status, body = self._dispatch(method, path, environ)
+        except StandInError as error:
+            status, body = error.status, error.body
+        LOGGER.debug("%s %s -> %d", method, path, status)
+        return self._respond(start_response, status, body, environ)
+
+    def _respond(self, start_response: Callable, status: int, body: object, environ: dict) -> list:
+        if body is None:
+            payload, content_type = b"", "text/plain; charset=utf-8"
+        elif isinstance(body, str):
+            payload, content_type = body.encode(), "text/plain; charset=utf-8"
+        else:
+            payload = json.dumps(body, separators = (",", ":")).encode()
+            content_type = "application/json; charset=utf-8"
+        headers = [("Content-Type", content_type)]
+        if environ["REQUEST_METHOD"] == "GET" and status == 200:
+            digest = base64.b64encode(hashlib.sha1(payload, usedforsecurity = False).digest()).decode().rstrip("=")
+            etag = f'W/"{len(payload):x}-{digest}"'
+            headers.append(("ETag", etag))
+            if etag in environ.get("HTTP_IF_NONE_MATCH", ""):
+                status, payload = 304, b""
+        headers.append(("Content-Length", str(len(payload))))
+        start_response(f"{status} {HTTPStatus(status).phrase}", headers)
+        return [payload]
+
+    def _read_json(self, environ: dict) -> dict:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        raw = environ["wsgi.input"].read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            data = json.loads(raw)
+        except ValueError as error:
+            raise StandInError(400, {"message": "Invalid JSON"}) from error
+        if not isinstance(data, dict):
+            raise StandInError(400, {"message": "Invalid JSON"})
+        return data
+
+    def _authenticate(self, environ: dict) -> str:
+        """Return token of request, unknown token is answered with 401 before the method is checked."""
+        header = environ.get("HTTP_AUTHORIZATION", "")
+        token = header[len("Bearer "):] if header.startswith("Bearer ") else None
+        self.store.authenticate(token)
+        return token
+
+    def _dispatch(self, method: str, path: str, environ: dict) -> tuple:
+        if path.startswith("/contacts/") and path.count("/") == 2:
+            return self._contact(method, environ, path[len("/contacts/"):])
+        routes = {
+            "/users": self._users,
+            "/users/login": self._login,
+            "/users/logout": self._logout,
+            "/users/me": self._me,
+            "/contacts": self._contacts,
+        }
+        if path not in routes:
+            return 404, None
+        return routes[path](method, environ)
+
+    def _users(self, method: str, environ: dict) -> tuple:
+        if method == "POST":
+            return 201, self.store.create_user(self._read_json(environ))
+        return 405, None
+
+    def _login(self, method: str, environ: dict) -> tuple:
+        if method == "POST":
+            return 200, self.store.log_in(self._read_json(environ))
+        return 405, None
+
+    def _logout(self, method: str, environ: dict) -> tuple:
+        if method == "POST":
+            self.store.log_out(self._authenticate(environ))
+            return 200, None
+        return 405, None
+
+    def _me(self, method: str, environ: dict) -> tuple:
+        token = self._authenticate(environ)
+        if method == "GET":
+            return 200, self.store.get_user(token)
+        if method == "PATCH":
+            return 200, self.store.update_user(token, self._read_json(environ))
+        if method == "DELETE":
+            self.store.delete_user(token)
+            return 200, None
+        return 405, None
+
+    def _contacts(self, method: str, environ: dict) -> tuple:
+        token = self._authenticate(environ)
+        if method == "POST":
+            return 201, self.store.create_contact(token, self._read_json(environ))
+        if method == "GET":
+            return 200, self.store.get_contact_list(token)
+        if method == "DELETE":
+            return 200, {"deletedCount": self.store.delete_contact_list(token)}
+        return 405, None
+
+    def _contact(self, method: str, environ: dict, contact_id: str) -> tuple:
+        token = self._authenticate(environ)
+        if method == "GET":
+            return 200, self.store.get_contact(token, contact_id)
+        if method == "PUT":
+            return 200, self.store.replace_contact(token, contact_id, self._read_json(environ))
+        if method == "PATCH":
+            return 200, self.store.update_contact(token, contact_id, self._read_json(environ))
+        if method == "DELETE":
+            self.store.delete_contact(token, contact_id)
+            return 200, "Contact deleted"
+        return 405, None
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import io
+import logging
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+from util.stand_in.app import ContactListApp
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Self
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _WSGIRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler with keep-alive connections which passes every request to WSGI application."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, without TCP_NODELAY every response waits for delayed ACK
+    disable_nagle_algorithm = True
+
+    def _handle(self) -> None:
+        path, _, query = self.path.partition("?")
+        length = int(self.headers.get("Content-Length") or 0)
+        environ = {
+            "REQUEST_METHOD": self.command,
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "CONTENT_TYPE": self.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": str(length),
+            "SERVER_NAME": self.server.server_address[0],
+            "SERVER_PORT": str(self.server.server_address[1]),
+            "SERVER_PROTOCOL": self.request_version,
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(self.rfile.read(length)),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in self.headers.items():
+            key = "HTTP_" + name.upper().replace("-", "_")
+            if key not in ("HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+                environ[key] = value
+
+        response_start = []
+
+        def start_response(status: str, headers: list, exc_info: object = None) -> None:  # noqa: ARG001 - WSGI signature
+            response_start[:] = [status, headers]
+
+        body = b"".join(self.server.app(environ, start_response))
+        status, headers = response_start
+        code, _, reason = status.partition(" ")
+        self.send_response(int(code), reason)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Names are looked up by BaseHTTPRequestHandler
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle  # noqa: N815
+
+    def log_message(self, message_format: str, *args) -> None:
+        LOGGER.debug(message_format, *args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple, app: Callable) -> None:
+        super().__init__(address, _WSGIRequestHandler)
+        self.app = app
+
+
+class StandInServer:
+    """Local HTTP server with in-memory Contact List Application.
+
+    Can be used as a context manager or with explicit `start()` and `stop()`. Port 0 picks a free port.
+
+    Attributes:
+        app (Callable):  WSGI application served by the server.
+        url (str):       Base url of the running server ending with slash.
+
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, app: Callable | None = None) -> None:
+        self.app = app if app is not None else ContactListApp()
+        self._server = _Server((host, port), self.app)
+        self._thread = None
+        host, port = self._server.server_address[:2]
+        self.url = f"http://{host}:{port}/"
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target = self._server.serve_forever, name = "stand-in-server", daemon = True)
+        self._thread.start()
+        LOGGER.info("Started stand-in Contact List server at %s", self.url)
+
+    def serve_forever(self) -> None:
+        LOGGER.info("Serving stand-in Contact List server at %s", self.url)
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        LOGGER.info("Stopped stand-in Contact List server")
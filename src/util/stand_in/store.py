@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+import re
+import secrets
+import threading
+import time
+
+EMAIL_PATTERN = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)+$")
+PHONE_PATTERN = re.compile(r"^\+?\d{6,15}$")
+POSTAL_CODE_PATTERN = re.compile(r"^[A-Za-z0-9 -]{3,7}$")
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+USER_FIELDS = ("firstName", "lastName", "email", "password")
+CONTACT_FIELDS = (
+    "firstName",
+    "lastName",
+    "birthdate",
+    "email",
+    "phone",
+    "street1",
+    "street2",
+    "city",
+    "stateProvince",
+    "postalCode",
+    "country",
+)
+CONTACT_MAX_LENGTH = {
+    "firstName": 20,
+    "lastName": 20,
+    "street1": 40,
+    "street2": 40,
+    "city": 40,
+    "stateProvince": 20,
+    "country": 40,
+}
+
+
+class StandInError(Exception):
+    """Raised by store when request must be answered with error response.
+
+    Attributes:
+        status (int):    HTTP status code of error response.
+        body (object):   JSON body of error response or None for empty body.
+
+    """
+
+    def __init__(self, status: int, body: object = None) -> None:
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+
+
+def _validator_error(path: str, message: str, kind: str, value: object) -> dict:
+    return {
+        "name": "ValidatorError",
+        "message": message,
+        "properties": {"message": message, "type": kind, "path": path, "value": value},
+        "kind": kind,
+        "path": path,
+        "value": value,
+    }
+
+
+def _validation_failed(model: str, errors: dict) -> StandInError:
+    prefix = f"{model} validation failed" if model else "Validation failed"
+    message = prefix + ": " + ", ".join(f"{path}: {error['message']}" for path, error in errors.items())
+    return StandInError(400, {"errors": errors, "_message": prefix, "message": message})
+
+
+def _is_valid_birthdate(value: str) -> bool:
+    if not isinstance(value, str) or not DATE_PATTERN.match(value):
+        return False
+    try:
+        birthdate = dt.date.fromisoformat(value)
+    except ValueError:
+        return False
+    return dt.date(1900, 1, 1) <= birthdate <= dt.datetime.now(dt.UTC).date()
+
+
+# Field: (check, error message) of contact fields with a format
+CONTACT_FORMATS = {
+    "birthdate": (_is_valid_birthdate, "Birthdate is invalid"),
+    "email": (EMAIL_PATTERN.match, "Email is invalid"),
+    "phone": (PHONE_PATTERN.match, "Phone number is invalid"),
+    "postalCode": (POSTAL_CODE_PATTERN.match, "Postal code is invalid"),
+}
+
+
+def _user_field_error(field: str, value: object) -> dict | None:
+    if not isinstance(value, str) or not value.strip():
+        return _validator_error(field, f"Path `{field}` is required.", "required", value)
+    if field == "email" and not EMAIL_PATTERN.match(value.strip()):
+        return _validator_error(field, "Email is invalid", "user defined", value)
+    if field == "password" and len(value) < 7:
+        message = f"Path `password` (`{value}`) is shorter than the minimum allowed length (7)."
+        return _validator_error(field, message, "minlength", value)
+    if field == "password" and len(value) > 100:
+        message = f"Path `password` (`{value}`) is longer than the maximum allowed length (100)."
+        return _validator_error(field, message, "maxlength", value)
+    return None
+
+
+def _contact_field_error(field: str, value: object) -> dict | None:
+    if not isinstance(value, str):
+        return _validator_error(field, f"Cast to string failed for value `{value}`", "string", value)
+    if field in ("firstName", "lastName") and not value.strip():
+        return _validator_error(field, f"Path `{field}` is required.", "required", value)
+    if field in CONTACT_MAX_LENGTH and len(value) > CONTACT_MAX_LENGTH[field]:
+        maximum = CONTACT_MAX_LENGTH[field]
+        message = f"Path `{field}` (`{value}`) is longer than the maximum allowed length ({maximum})."
+        return _validator_error(field, message, "maxlength", value)
+    if field in CONTACT_FORMATS and not CONTACT_FORMATS[field][0](value):
+        return _validator_error(field, CONTACT_FORMATS[field][1], "user defined", value)
+    return None
+
+
+class ContactListStore:
+    """Thread-safe in-memory storage of Contact List users, tokens and contacts.
+
+    Every lookup done by the application endpoints is a dictionary access:
+    users are indexed by id and by email, tokens by value and contacts by id and by owner.
+    Validation follows the field rules described by test cases in `tests/api`.
+    Operations of a user take its token and resolve it under the same lock acquisition as the operation itself,
+    so a user deleted by a concurrent request is answered with 401 instead of disappearing midway.
+    """
+
+    def __init__(self) -> None:
+        self._users = {}
+        self._passwords = {}
+        self._user_ids_by_email = {}
+        self._user_ids_by_token = {}
+        self._tokens_by_user_id = {}
+        self._contacts = {}
+        self._contact_ids_by_owner = {}
+        self._counter = itertools.count()
+        self._lock = threading.RLock()
+
+    def _new_id(self) -> str:
+        # Same 24 hex characters layout as MongoDB ObjectId: creation time first, so ids sort by creation
+        return f"{int(time.time()):08x}{secrets.token_hex(4)}{next(self._counter) & 0xFFFFFFFF:08x}"
+
+    def _new_token(self, user_id: str) -> str:
+        token = secrets.token_urlsafe(32)
+        self._user_ids_by_token[token] = user_id
+        self._tokens_by_user_id[user_id].add(token)
+        self._users[user_id]["__v"] += 1
+        return token
+
+    def _validate_user(self, data: dict, *, partial: bool) -> dict:
+        if "_id" in data or any(field not in USER_FIELDS for field in data):
+            raise StandInError(400, {"message": "Invalid updates!"})
+        errors = {}
+        for field in USER_FIELDS:
+            if field not in data:
+                if not partial:
+                    errors[field] = _validator_error(field, f"Path `{field}` is required.", "required", None)
+                continue
+            error = _user_field_error(field, data[field])
+            if error is not None:
+                errors[field] = error
+        if errors:
+            raise _validation_failed(model = "User", errors = errors)
+        cleaned = {field: value.strip() for field, value in data.items() if field != "password"}
+        if "email" in cleaned:
+            cleaned["email"] = cleaned["email"].lower()
+        if "password" in data:
+            cleaned["password"] = data["password"]
+        return cleaned
+
+    def _validate_contact(self, data: dict, *, partial: bool, model: str) -> dict:
+        errors = {}
+        for field in CONTACT_FIELDS:
+            if field not in data:
+                if not partial and field in ("firstName", "lastName"):
+                    errors[field] = _validator_error(field, f"Path `{field}` is required.", "required", None)
+                continue
+            error = _contact_field_error(field, data[field])
+            if error is not None:
+                errors[field] = error
+        if errors:
+            raise _validation_failed(model, errors)
+        return {field: data[field] for field in CONTACT_FIELDS if field in data}
+
+    def _public_user(self, user_id: str) -> dict:
+        return dict(self._users[user_id])
+
+    def _user_id(self, token: str | None) -> str:
+        # Caller holds the lock
+        user_id = self._user_ids_by_token.get(token)
+        if user_id is None:
+            raise StandInError(401, {"error": "Please authenticate."})
+        return user_id
+
+    def authenticate(self, token: str | None) -> str:
+        with self._lock:
+            return self._user_id(token)
+
+    def create_user(self, data: dict) -> dict:
+        user = self._validate_user(data, partial = False)
+        with self._lock:
+            if user["email"] in self._user_ids_by_email:
+                raise StandInError(400, {"message": "Email address is already in use"})
+            user_id = self._new_id()
+            self._passwords[user_id] = user.pop("password")
+            self._users[user_id] = {"_id": user_id, **user, "__v": 0}
+            self._user_ids_by_email[user["email"]] = user_id
+            self._tokens_by_user_id[user_id] = set()
+            self._contact_ids_by_owner[user_id] = {}
+            token = self._new_token(user_id)
+            return {"user": self._public_user(user_id), "token": token}
+
+    def log_in(self, data: dict) -> dict:
+        email = data.get("email")
+        with self._lock:
+            user_id = self._user_ids_by_email.get(email.strip().lower()) if isinstance(email, str) else None
+            if user_id is None or self._passwords[user_id] != data.get("password"):
+                raise StandInError(401)
+            token = self._new_token(user_id)
+            return {"user": self._public_user(user_id), "token": token}
+
+    def log_out(self, token: str | None) -> None:
+        with self._lock:
+            user_id = self._user_id(token)
+            del self._user_ids_by_token[token]
+            self._tokens_by_user_id[user_id].discard(token)
+
+    def get_user(self, token: str | None) -> dict:
+        with self._lock:
+            return self._public_user(self._user_id(token))
+
+    def update_user(self, token: str | None, data: dict) -> dict:
+        update = self._validate_user(data, partial = True)
+        with self._lock:
+            user_id = self._user_id(token)
+            user = self._users[user_id]
+            if "email" in update and update["email"] != user["email"]:
+                if update["email"] in self._user_ids_by_email:
+                    raise StandInError(400, {"message": "Email address is already in use"})
+                del self._user_ids_by_email[user["email"]]
+                self._user_ids_by_email[update["email"]] = user_id
+            if "password" in update:
+                self._passwords[user_id] = update.pop("password")
+            user.update(update)
+            return self._public_user(user_id)
+
+    def delete_user(self, token: str | None) -> None:
+        with self._lock:
+            user_id = self._user_id(token)
+            user = self._users.pop(user_id)
+            del self._passwords[user_id]
+            del self._user_ids_by_email[user["email"]]
+            for user_token in self._tokens_by_user_id.pop(user_id):
+                del self._user_ids_by_token[user_token]
+            for contact_id in self._contact_ids_by_owner.pop(user_id):
+                del self._contacts[contact_id]
+
+    def create_contact(self, token: str | None, data: dict) -> dict:
+        contact = self._validate_contact(data, partial = False, model = "Contact")
+        with self._lock:
+            owner = self._user_id(token)
+            contact_id = self._new_id()
+            self._contacts[contact_id] = {"_id": contact_id, **contact, "owner": owner, "__v": 0}
+            self._contact_ids_by_owner[owner][contact_id] = None
+            return dict(self._contacts[contact_id])
+
+    def _owned_contact(self, owner: str, contact_id: str) -> dict:
+        if contact_id not in self._contact_ids_by_owner[owner]:
+            raise StandInError(404)
+        return self._contacts[contact_id]
+
+    def get_contact(self, token: str | None, contact_id: str) -> dict:
+        with self._lock:
+            return dict(self._owned_contact(self._user_id(token), contact_id))
+
+    def get_contact_list(self, token: str | None) -> list:
+        with self._lock:
+            return [dict(self._contacts[contact_id]) for contact_id in self._contact_ids_by_owner[self._user_id(token)]]
+
+    def replace_contact(self, token: str | None, contact_id: str, data: dict) -> dict:
+        replacement = self._validate_contact(data, partial = False, model = "")
+        with self._lock:
+            owner = self._user_id(token)
+            contact = self._owned_contact(owner, contact_id)
+            self._contacts[contact_id] = {"_id": contact_id, **replacement, "owner": owner, "__v": contact["__v"]}
+            return dict(self._contacts[contact_id])
+
+    def update_contact(self, token: str | None, contact_id: str, data: dict) -> dict:
+        update = self._validate_contact(data, partial = True, model = "")
+        with self._lock:
+            owner = self._user_id(token)
+            contact = self._owned_contact(owner, contact_id)
+            merged = {**contact, **update}
+            self._contacts[contact_id] = {
+                "_id": contact_id,
+                **{field: merged[field] for field in CONTACT_FIELDS if field in merged},
+                "owner": owner,
+                "__v": contact["__v"],
+            }
+            return dict(self._contacts[contact_id])
+
+    def delete_contact(self, token: str | None, contact_id: str) -> None:
+        with self._lock:
+            owner = self._user_id(token)
+            self._owned_contact(owner, contact_id)
+            del self._contact_ids_by_owner[owner][contact_id]
+            del self._contacts[contact_id]
+
+    def delete_contact_list(self, token: str | None) -> int:
+        with self._lock:
+            owner = self._user_id(token)
+            contact_ids = self._contact_ids_by_owner[owner]
+            for contact_id in contact_ids:
+                del self._contacts[contact_id]
+            self._contact_ids_by_owner[owner] = {}
+            return len(contact_ids)
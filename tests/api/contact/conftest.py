@@ -4,7 +4,8 @@ import pytest
 
 from tests.api.contact.test_cases_contact import CONTACTS, CONTACTS_INVALID, CONTACTS_PATCHED, CONTACTS_UPDATED
 from tests.util.test_case_parse import get_test_case_id_payload_expected_id, get_test_case_id_payload_id
-from util.admin.admin_api import AdminAPI
+from util.admin.admin_api import AdminAPI, AdminAPIException
+from util.admin.teardown_queue import TeardownQueue
 
 LOGGER = logging.getLogger(__name__)
 
@@ -36,19 +37,26 @@ def contact_patched_raw_data_invalid(request) -> dict:
     return request.param[0]
 
 @pytest.fixture
-def contact_created(admin: AdminAPI, token: str, contact_default: dict):
+def contact_created(
+    admin: AdminAPI, teardown_queue: TeardownQueue, user_registered: dict, token: str, contact_default: dict,
+):
     contact_default_created = admin.create_contact(token, contact_default)
     LOGGER.info("Created default contact")
     yield contact_default_created
-    admin.delete_contact(token, contact_default_created["_id"])
+    # Keyed by owner, so deletion is finished before the owner is released
+    teardown_queue.submit(user_registered["email"], admin.delete_contact, token, contact_default_created["_id"])
     LOGGER.info("Deleted default contact")
 
 @pytest.fixture
-def contact_list_created(admin: AdminAPI, token: str, contact_list_default: list):
-    contact_list_default_created = []
-    for contact in contact_list_default:
-        contact_list_default_created.append(admin.create_contact(token, contact))
+def contact_list_created(
+    admin: AdminAPI, teardown_queue: TeardownQueue, user_registered: dict, token: str, contact_list_default: list,
+):
+    contact_list_default_created = admin.create_contacts(token, contact_list_default)
+    for contact in contact_list_default_created:
+        if isinstance(contact, AdminAPIException):
+            admin.delete_contact_list(token)
+            raise contact
     LOGGER.info("Created default contact list")
     yield contact_list_default_created
-    admin.delete_contact_list(token)
+    teardown_queue.submit(user_registered["email"], admin.delete_contact_list, token)
     LOGGER.info("Deleted default contact list")
@@ -3,13 +3,16 @@ import logging
 import pytest
 import requests
 
+from tests.util.list_diff import diff_lists
+from tests.util.schema import SchemaValidator
 from util.admin.admin_api import AdminAPI, AdminAPIException, BearerAuth
+from util.config import get_base_url
 
 LOGGER = logging.getLogger(__name__)
 
 
 class TestAPIContact:
-    endpoint = "https://thinking-tester-contact-list.herokuapp.com/contacts/"
+    endpoint = get_base_url() + "contacts/"
 
     schema = (
         "_id",
@@ -27,20 +30,29 @@ class TestAPIContact:
         "owner",
         "__v",
     )
+    validator = SchemaValidator(schema)
 
     def check_contact_json_schema(self, contact: dict) -> None:
-        for field in TestAPIContact.schema:
-            assert field in contact
+        TestAPIContact.validator.validate([contact])
         LOGGER.info("Contact JSON schema is correct")
 
+    def check_contact_list_json_schema(self, contact_list: list) -> None:
+        TestAPIContact.validator.validate(contact_list)
+        LOGGER.info("JSON schema of %d contacts is correct", len(contact_list))
+
     def check_contact_equals(self, contact: dict, another: dict) -> None:
         for key in contact:
             assert contact[key] == another[key]
 
+    def check_contact_list_equals(self, contact_list: list, another: list) -> None:
+        diff = diff_lists(contact_list, another)
+        assert not diff, diff.format()
 
-    def test_create_contact(self, admin: AdminAPI, token: str, contact_raw_data: dict) -> None:
+    def test_create_contact(
+        self, session: requests.Session, admin: AdminAPI, token: str, contact_raw_data: dict,
+    ) -> None:
         LOGGER.debug("Creating contact: %s", contact_raw_data)
-        response = requests.post(TestAPIContact.endpoint, auth = BearerAuth(token), json = contact_raw_data)
+        response = session.post(TestAPIContact.endpoint, auth = BearerAuth(token), json = contact_raw_data)
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 201
         assert "application/json" in response.headers["Content-Type"]
@@ -60,9 +72,11 @@ class TestAPIContact:
         # Cleanup
         admin.delete_contact(token, data["_id"])
 
-    def test_create_contact_invalid(self, admin: AdminAPI, token: str, contact_raw_data_invalid: dict) -> None:
+    def test_create_contact_invalid(
+        self, session: requests.Session, admin: AdminAPI, token: str, contact_raw_data_invalid: dict,
+    ) -> None:
         LOGGER.debug("Creating invalid contact: %s", contact_raw_data_invalid)
-        response = requests.post(TestAPIContact.endpoint, auth = BearerAuth(token), json = contact_raw_data_invalid)
+        response = session.post(TestAPIContact.endpoint, auth = BearerAuth(token), json = contact_raw_data_invalid)
         LOGGER.debug("Received response text: %s", response.text)
         try:
             assert response.status_code == 400
@@ -73,9 +87,9 @@ class TestAPIContact:
             exception_msg = "Invalid contact was created"
             raise AssertionError(exception_msg) from error
 
-    def test_get_contact(self, token: str, contact_created: dict):
+    def test_get_contact(self, session: requests.Session, token: str, contact_created: dict):
         LOGGER.debug("Getting contact: %s", contact_created)
-        response = requests.get(TestAPIContact.endpoint + contact_created["_id"], auth = BearerAuth(token))
+        response = session.get(TestAPIContact.endpoint + contact_created["_id"], auth = BearerAuth(token))
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
@@ -85,30 +99,39 @@ class TestAPIContact:
         self.check_contact_equals(contact_created, received_contact)
         LOGGER.info("Successfully received contact")
 
-    def test_get_contact_without_auth(self, contact_created: dict):
+    def test_get_contact_without_auth(self, session: requests.Session, contact_created: dict):
         LOGGER.debug("Getting contact: %s", contact_created)
-        response = requests.get(TestAPIContact.endpoint + contact_created["_id"])
+        response = session.get(TestAPIContact.endpoint + contact_created["_id"])
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 401
         LOGGER.info("Can't get contact without authorization as it is intended")
 
-    def test_get_contact_list(self, token: str, contact_list_created: list):
+    def test_get_contact_list(self, session: requests.Session, token: str, contact_list_created: list):
         LOGGER.debug("Getting contact list: %s", contact_list_created)
-        response = requests.get(TestAPIContact.endpoint, auth = BearerAuth(token))
+        response = session.get(TestAPIContact.endpoint, auth = BearerAuth(token))
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
         LOGGER.info("Response status code and headers are correct")
 
-        received_contact_list = response.json()
-        received_contact_list.reverse()
-        for i in range(0, len(contact_list_created)):
-            self.check_contact_equals(contact_list_created[i], received_contact_list[i])
+        # Contacts are created concurrently, so the order of received contacts is not guaranteed
+        self.check_contact_list_equals(contact_list_created, response.json())
         LOGGER.info("Successfully received contact")
 
-    def test_update_contact(self, admin: AdminAPI, token: str, contact_created: dict, contact_updated_raw_data: dict) -> None:
+    def test_update_contact(
+        self,
+        session: requests.Session,
+        admin: AdminAPI,
+        token: str,
+        contact_created: dict,
+        contact_updated_raw_data: dict,
+    ) -> None:
         LOGGER.debug("Updating contact with %s", contact_updated_raw_data[0])
-        response = requests.put(TestAPIContact.endpoint + contact_created["_id"], auth = BearerAuth(token), json = contact_updated_raw_data[0])
+        response = session.put(
+            TestAPIContact.endpoint + contact_created["_id"],
+            auth = BearerAuth(token),
+            json = contact_updated_raw_data[0],
+        )
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
@@ -122,9 +145,20 @@ class TestAPIContact:
         self.check_contact_equals(contact_updated_raw_data[1], updated_contact)
         LOGGER.info("Successfully received contact with updated fields")
 
-    def test_update_contact_invalid(self, admin: AdminAPI, token: str, contact_created: dict, contact_updated_raw_data_invalid: dict) -> None:
+    def test_update_contact_invalid(
+        self,
+        session: requests.Session,
+        admin: AdminAPI,
+        token: str,
+        contact_created: dict,
+        contact_updated_raw_data_invalid: dict,
+    ) -> None:
         LOGGER.debug("Updating contact with %s", contact_updated_raw_data_invalid)
-        response = requests.put(TestAPIContact.endpoint + contact_created["_id"], auth = BearerAuth(token), json = contact_updated_raw_data_invalid)
+        response = session.put(
+            TestAPIContact.endpoint + contact_created["_id"],
+            auth = BearerAuth(token),
+            json = contact_updated_raw_data_invalid,
+        )
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 400
         LOGGER.info("Can't update contact fields to invalid ones as it is intended")
@@ -133,9 +167,20 @@ class TestAPIContact:
         self.check_contact_equals(contact_created, updated_contact)
         LOGGER.info("Contact fields was not updated to invalid ones")
 
-    def test_patch_contact(self, admin: AdminAPI, token: str, contact_created: dict, contact_patched_raw_data: dict) -> None:
+    def test_patch_contact(
+        self,
+        session: requests.Session,
+        admin: AdminAPI,
+        token: str,
+        contact_created: dict,
+        contact_patched_raw_data: dict,
+    ) -> None:
         LOGGER.debug("Patching contact with %s", contact_patched_raw_data[0])
-        response = requests.patch(TestAPIContact.endpoint + contact_created["_id"], auth = BearerAuth(token), json = contact_patched_raw_data[0])
+        response = session.patch(
+            TestAPIContact.endpoint + contact_created["_id"],
+            auth = BearerAuth(token),
+            json = contact_patched_raw_data[0],
+        )
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
@@ -149,12 +194,23 @@ class TestAPIContact:
         self.check_contact_equals(contact_patched_raw_data[1], updated_contact)
         LOGGER.info("Successfully received contact with patched fields")
 
-    def test_patch_contact_invalid(self, admin: AdminAPI, token: str, contact_created: dict, contact_patched_raw_data_invalid: dict) -> None:
+    def test_patch_contact_invalid(
+        self,
+        session: requests.Session,
+        admin: AdminAPI,
+        token: str,
+        contact_created: dict,
+        contact_patched_raw_data_invalid: dict,
+    ) -> None:
         # TODO: Fix this
         if contact_patched_raw_data_invalid == {}:
             return
         LOGGER.debug("Patching contact with %s", contact_patched_raw_data_invalid)
-        response = requests.patch(TestAPIContact.endpoint + contact_created["_id"], auth = BearerAuth(token), json = contact_patched_raw_data_invalid)
+        response = session.patch(
+            TestAPIContact.endpoint + contact_created["_id"],
+            auth = BearerAuth(token),
+            json = contact_patched_raw_data_invalid,
+        )
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 400
         LOGGER.info("Can't patch contact fields to invalid ones as it is intended")
@@ -163,12 +219,12 @@ class TestAPIContact:
         self.check_contact_equals(contact_created, patched_contact)
         LOGGER.info("Contact fields was not patched to invalid ones")
 
-    def test_delete_contact(self, admin: AdminAPI, token: str, contact_default: dict):
+    def test_delete_contact(self, session: requests.Session, admin: AdminAPI, token: str, contact_default: dict):
         # Setup
         contact = admin.create_contact(token, contact_default)
 
         LOGGER.debug("Deleting contact %s with token %s", contact, token)
-        response = requests.delete(TestAPIContact.endpoint + contact["_id"], auth = BearerAuth(token))
+        response = session.delete(TestAPIContact.endpoint + contact["_id"], auth = BearerAuth(token))
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         LOGGER.info("Response status code is correct")
@@ -177,20 +233,22 @@ class TestAPIContact:
             admin.get_contact(token, contact["_id"])
         LOGGER.info("Can't get contact that was deleted")
 
-    def test_delete_contact_without_auth(self, contact_created: dict):
+    def test_delete_contact_without_auth(self, session: requests.Session, contact_created: dict):
         LOGGER.debug("Deleting contact: %s", contact_created)
-        response = requests.delete(TestAPIContact.endpoint + contact_created["_id"])
+        response = session.delete(TestAPIContact.endpoint + contact_created["_id"])
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 401
         LOGGER.info("Can't delete contact without authorization as it is intended")
 
-    def test_delete_contact_list(self, admin: AdminAPI, token: str, contact_list_default: dict):
+    def test_delete_contact_list(
+        self, session: requests.Session, admin: AdminAPI, token: str, contact_list_default: dict,
+    ):
         # Setup
-        for contact in contact_list_default:
-            admin.create_contact(token, contact)
+        for contact in admin.create_contacts(token, contact_list_default):
+            assert not isinstance(contact, AdminAPIException)
 
         LOGGER.debug("Deleting contact list with token: %s", token)
-        response = requests.delete(TestAPIContact.endpoint, auth = BearerAuth(token))
+        response = session.delete(TestAPIContact.endpoint, auth = BearerAuth(token))
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         LOGGER.info("Response status code is correct")
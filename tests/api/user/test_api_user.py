@@ -3,24 +3,31 @@ import logging
 import pytest
 import requests
 
+from tests.util.schema import SchemaValidator
 from util.admin.admin_api import AdminAPI, AdminAPIException
 from util.admin.bearer_auth import BearerAuth
+from util.config import get_base_url
 
 LOGGER = logging.getLogger(__name__)
 
 
 class TestAPIUser:
-    endpoint = "https://thinking-tester-contact-list.herokuapp.com/users/"
+    endpoint = get_base_url() + "users/"
     myself = "me"
     login = "login"
     logout = "logout"
 
+    schema = (
+        "_id",
+        "firstName",
+        "lastName",
+        "email",
+        "__v",
+    )
+    validator = SchemaValidator(schema)
+
     def check_user_json_schema(self, user: dict) -> None:
-        assert "_id" in user
-        assert "firstName" in user
-        assert "lastName" in user
-        assert "email" in user
-        assert "__v" in user
+        TestAPIUser.validator.validate([user])
         LOGGER.info("User JSON schema is correct")
 
     def check_user_equals(self, user: dict, another: dict) -> None:
@@ -29,9 +36,9 @@ class TestAPIUser:
         assert user["email"] == another["email"]
 
 
-    def test_create_user(self, admin: AdminAPI, user_raw_data: dict) -> None:
+    def test_create_user(self, session: requests.Session, admin: AdminAPI, user_raw_data: dict) -> None:
         LOGGER.debug("Creating user: %s", user_raw_data)
-        response = requests.post(TestAPIUser.endpoint, json = user_raw_data)
+        response = session.post(TestAPIUser.endpoint, json = user_raw_data)
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 201
         assert "application/json" in response.headers["Content-Type"]
@@ -52,9 +59,9 @@ class TestAPIUser:
         # Cleanup
         admin.delete_user(data["token"])
 
-    def test_create_user_invalid(self, admin: AdminAPI, user_raw_data_invalid: dict) -> None:
+    def test_create_user_invalid(self, session: requests.Session, admin: AdminAPI, user_raw_data_invalid: dict) -> None:
         LOGGER.debug("Creating invalid user: %s", user_raw_data_invalid)
-        response = requests.post(TestAPIUser.endpoint, json = user_raw_data_invalid)
+        response = session.post(TestAPIUser.endpoint, json = user_raw_data_invalid)
         LOGGER.debug("Received response text: %s", response.text)
         try:
             assert response.status_code == 400
@@ -66,9 +73,9 @@ class TestAPIUser:
             raise AssertionError(exception_msg) from error
 
 
-    def test_get_user_myself(self, user_registered: dict, token: str) -> None:
+    def test_get_user_myself(self, session: requests.Session, user_registered: dict, token: str) -> None:
         LOGGER.debug("Getting user %s with token %s", user_registered, token)
-        response = requests.get(TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token))
+        response = session.get(TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token))
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
@@ -79,17 +86,21 @@ class TestAPIUser:
         self.check_user_equals(user_registered, received_user)
         LOGGER.info("Successfully received user")
 
-    def test_get_user_myself_without_auth(self, user_registered: dict) -> None:
+    def test_get_user_myself_without_auth(self, session: requests.Session, user_registered: dict) -> None:
         LOGGER.debug("Getting user: %s", user_registered)
-        response = requests.get(TestAPIUser.endpoint + TestAPIUser.myself)
+        response = session.get(TestAPIUser.endpoint + TestAPIUser.myself)
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 401
         LOGGER.info("Can't get user without authorization as it is intended")
 
 
-    def test_patch_user(self, admin: AdminAPI, token: str, user_updated_raw_data: dict) -> None:
+    def test_patch_user(
+        self, session: requests.Session, admin: AdminAPI, token: str, user_updated_raw_data: dict,
+    ) -> None:
         LOGGER.debug("Updating user with %s", user_updated_raw_data[0])
-        response = requests.patch(TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token), json = user_updated_raw_data[0])
+        response = session.patch(
+            TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token), json = user_updated_raw_data[0],
+        )
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
@@ -105,9 +116,18 @@ class TestAPIUser:
         self.check_user_equals(user_updated_raw_data[1], updated_user)
         LOGGER.info("Successfully received user with updated fields")
 
-    def test_patch_user_invalid(self, admin: AdminAPI, user_registered: dict, token: str, user_updated_raw_data_invalid: dict) -> None:
+    def test_patch_user_invalid(
+        self,
+        session: requests.Session,
+        admin: AdminAPI,
+        user_registered: dict,
+        token: str,
+        user_updated_raw_data_invalid: dict,
+    ) -> None:
         LOGGER.debug("Updating user with %s", user_updated_raw_data_invalid)
-        response = requests.patch(TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token), json = user_updated_raw_data_invalid)
+        response = session.patch(
+            TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token), json = user_updated_raw_data_invalid,
+        )
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 400
         LOGGER.info("Can't update user fields to invalid ones as it is intended")
@@ -118,12 +138,12 @@ class TestAPIUser:
         LOGGER.info("User fields was not updated to invalid ones")
 
 
-    def test_delete_user(self, admin: AdminAPI, user_default: dict) -> None:
+    def test_delete_user(self, session: requests.Session, admin: AdminAPI, user_default: dict) -> None:
         # Setup
         token = admin.create_user(user_default)
 
         LOGGER.debug("Deleting user: %s", user_default)
-        response = requests.delete(TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token))
+        response = session.delete(TestAPIUser.endpoint + TestAPIUser.myself, auth = BearerAuth(token))
         LOGGER.debug("Received response text: %s", response.text)
         assert response.status_code == 200
         LOGGER.info("Deleted existing user")
@@ -136,12 +156,12 @@ class TestAPIUser:
         LOGGER.info("Can't log in user that was deleted")
 
 
-    def test_log_in_user(self, admin: AdminAPI, user_registered: dict) -> None:
+    def test_log_in_user(self, session: requests.Session, admin: AdminAPI, user_registered: dict) -> None:
         log_in_data = {
             "email": user_registered["email"],
             "password": user_registered["password"],
         }
-        response = requests.post(TestAPIUser.endpoint + TestAPIUser.login, json = log_in_data)
+        response = session.post(TestAPIUser.endpoint + TestAPIUser.login, json = log_in_data)
         assert response.status_code == 200
         assert "application/json" in response.headers["Content-Type"]
         LOGGER.info("Response status code and headers are correct")
@@ -158,11 +178,12 @@ class TestAPIUser:
         self.check_user_equals(user_registered, logged_in_user)
         LOGGER.info("Can use received token and use it to get user")
 
-    def test_log_out_user(self, admin: AdminAPI, user_registered: dict) -> None:
+    def test_log_out_user(self, session: requests.Session, admin: AdminAPI, user_registered: dict) -> None:
         # Setup
-        token = admin.log_in(user_registered["email"], user_registered["password"])
+        # Token of the fixture stays valid for its teardown
+        token = admin.log_in(user_registered["email"], user_registered["password"], fresh = True)
 
-        response = requests.post(TestAPIUser.endpoint + TestAPIUser.logout, auth = BearerAuth(token))
+        response = session.post(TestAPIUser.endpoint + TestAPIUser.logout, auth = BearerAuth(token))
         assert response.status_code == 200
         LOGGER.info("Logged out from user account")
 
@@ -0,0 +1,61 @@
+import argparse
+import functools
+import logging
+import sys
+
+from tests.benchmarks.harness import compare, load_results, measure, save_results
+from tests.benchmarks.suite import run_benchmarks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog = "python -m tests.benchmarks", description = "Microbenchmarks of client-side hot paths.",
+    )
+    commands = parser.add_subparsers(dest = "command", required = True)
+    run_parser = commands.add_parser("run", help = "run benchmarks against in-process stand-in and save results")
+    run_parser.add_argument(
+        "--output", default = "benchmarks.json", help = "JSON file for results (default: benchmarks.json)",
+    )
+    run_parser.add_argument("--filter", default = None, help = "run only benchmarks whose name contains this text")
+    run_parser.add_argument(
+        "--repeat", type = int, default = 5, help = "timed repetitions of every benchmark (default: 5)",
+    )
+    run_parser.add_argument(
+        "--min-time", type = float, default = 0.05, help = "minimal seconds of one repetition (default: 0.05)",
+    )
+    run_parser.add_argument("--baseline", default = None, help = "compare results with this baseline after the run")
+    run_parser.add_argument(
+        "--threshold", type = float, default = 0.1, help = "slowdown flagged as regression (default: 0.1)",
+    )
+    compare_parser = commands.add_parser("compare", help = "compare two result files")
+    compare_parser.add_argument("baseline", help = "baseline results")
+    compare_parser.add_argument("current", help = "current results")
+    compare_parser.add_argument(
+        "--threshold", type = float, default = 0.1, help = "slowdown flagged as regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+    # Checks and clients log on INFO level, which would be measured too
+    logging.disable(logging.INFO)
+
+    if args.command == "run":
+        timer = functools.partial(measure, repeat = args.repeat, min_time = args.min_time)
+        results = run_benchmarks(timer, args.filter)
+        for name, result in results.items():
+            print(f"{name:<44} {result['median'] * 1e6:>12.2f} us")  # noqa: T201
+        save_results(args.output, results)
+        print(f"Results written to {args.output}")  # noqa: T201
+        if args.baseline is None:
+            return
+        baseline, current = load_results(args.baseline), results
+    else:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+    lines, regressions = compare(baseline, current, args.threshold)
+    for line in lines:
+        print(line)  # noqa: T201
+    if regressions:
+        print(f"{len(regressions)} benchmarks are slower than baseline by more than {args.threshold:.0%}")  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def measure(function: Callable, repeat: int = 5, min_time: float = 0.05) -> dict:
+    """Time `function` and return seconds per call.
+
+    Number of calls per repetition is calibrated so one repetition takes at least `min_time` seconds, which keeps
+    timer resolution and per-repetition overhead out of the result. Median is the value compared between runs.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / elapsed) + 1) if elapsed > 0 else loops * 10
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((time.perf_counter() - start) / loops)
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+def save_results(path: str, results: dict) -> None:
+    document = {
+        "created": datetime.now(UTC).isoformat(timespec = "seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with Path(path).open("w", encoding = "utf-8") as file:
+        json.dump(document, file, indent = 2, sort_keys = True)
+        file.write("\n")
+
+def load_results(path: str) -> dict:
+    with Path(path).open(encoding = "utf-8") as file:
+        return json.load(file)["results"]
+
+def compare(baseline: dict, current: dict, threshold: float) -> tuple:
+    """Compare medians of current benchmarks with baseline ones.
+
+    Return report lines and names of benchmarks which are slower than baseline by more than `threshold`
+    (0.1 is 10 %). Benchmarks which were not run, e.g. because of a filter, are skipped.
+    """
+    header = f"{'benchmark':<44} {'baseline us':>12} {'current us':>12} {'change':>8}"
+    lines = [header, "-" * len(header)]
+    regressions = []
+    for name in sorted(current):
+        if name not in baseline:
+            lines.append(f"{name:<44} {'':>12} {current[name]['median'] * 1e6:>12.2f} {'new':>8}")
+            continue
+        old, new = baseline[name]["median"], current[name]["median"]
+        change = new / old - 1 if old else 0.0
+        line = f"{name:<44} {old * 1e6:>12.2f} {new * 1e6:>12.2f} {change:>+8.1%}"
+        if change > threshold:
+            regressions.append(name)
+            line += "  REGRESSION"
+        elif change < -threshold:
+            line += "  improved"
+        lines.append(line)
+    return lines, regressions
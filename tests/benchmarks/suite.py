@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import requests
+
+from tests.api.contact.test_api_contact import TestAPIContact
+from tests.api.contact.test_cases_contact import CONTACTS, CONTACTS_PATCHED, CONTACTS_UPDATED
+from tests.api.test_cases_user import USERS_REGISTRATION
+from tests.api.user.test_api_user import TestAPIUser
+from tests.util.identity import namespace_email
+from util.admin.admin_api import AdminAPI
+from util.admin.bearer_auth import BearerAuth
+from util.admin.transport import WSGIAdapter
+from util.admin.user_pool import UserPool
+from util.json_stream import iter_json_array
+from util.stand_in.app import ContactListApp
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+URL = "http://benchmark.local/"
+LARGE_LIST_SIZE = 10000
+CHUNK_SIZE = 65536
+
+
+class _Counter:
+    """Source of unique emails for benchmarks which register users on every call."""
+
+    def __init__(self, email: str) -> None:
+        self._email = email
+        self._number = 0
+
+    def next_user(self) -> dict:
+        self._number += 1
+        return {**USERS_REGISTRATION[0][0], "email": namespace_email(self._email, f"b{self._number}")}
+
+
+def _admin_benchmarks(admin: AdminAPI, cached_admin: AdminAPI) -> dict:
+    user = USERS_REGISTRATION[0][0]
+    token = admin.create_user(user)
+    contact = CONTACTS[0][0]
+    contact_id = admin.create_contact(token, contact)["_id"]
+    contact_list = [case[0] for case in CONTACTS[:10]]
+    for case in CONTACTS[1:3]:
+        admin.create_contact(token, case[0])
+    contact_ids = [contact_id] * 10
+    counter = _Counter(user["email"])
+
+    def create_and_delete_user() -> None:
+        admin.delete_user(admin.create_user(counter.next_user()))
+
+    def log_in_and_log_out() -> None:
+        admin.log_out(admin.log_in(user["email"], user["password"]))
+
+    def create_and_delete_contact() -> None:
+        admin.delete_contact(token, admin.create_contact(token, contact)["_id"])
+
+    def iter_contact_list() -> None:
+        for _ in admin.iter_contact_list(token):
+            pass
+
+    # Separate user, so its contact list doesn't change contact list of the other benchmarks
+    batch_token = admin.create_user(counter.next_user())
+
+    def create_contacts_and_delete_contact_list() -> None:
+        admin.create_contacts(batch_token, contact_list)
+        admin.delete_contact_list(batch_token)
+
+    return {
+        "admin.log_in": lambda: admin.log_in(user["email"], user["password"]),
+        "admin.log_in_cached": lambda: cached_admin.log_in(user["email"], user["password"]),
+        "admin.get_user": lambda: admin.get_user(token),
+        "admin.patch_user": lambda: admin.patch_user(token, {"firstName": user["firstName"]}),
+        "admin.create_user+delete_user": create_and_delete_user,
+        "admin.log_in+log_out": log_in_and_log_out,
+        "admin.create_contact+delete_contact": create_and_delete_contact,
+        "admin.get_contact": lambda: admin.get_contact(token, contact_id),
+        "admin.update_contact": lambda: admin.update_contact(token, contact_id, CONTACTS_UPDATED[0][0]),
+        "admin.patch_contact": lambda: admin.patch_contact(token, contact_id, CONTACTS_PATCHED[0][0]),
+        "admin.get_contact_list": lambda: admin.get_contact_list(token),
+        "admin.iter_contact_list": iter_contact_list,
+        "admin.get_contacts[10]": lambda: admin.get_contacts(token, contact_ids),
+        "admin.create_contacts+delete_contact_list[10]": create_contacts_and_delete_contact_list,
+    }
+
+def _fixture_benchmarks(admin: AdminAPI) -> dict:
+    """Return requests made by setup and teardown of `user_registered`, `contact_created` and `contact_list_created`."""
+    user = USERS_REGISTRATION[0][0]
+    counter = _Counter(namespace_email(user["email"], "fixture"))
+    pool = UserPool(admin, namespace_email(user["email"], "p{}"), user["password"])
+    token = admin.create_user(counter.next_user())
+    contact_list = [case[0] for case in CONTACTS[:3]]
+
+    def user_registered() -> None:
+        pool.release(pool.lease(counter.next_user()))
+
+    def user_registered_without_pool() -> None:
+        admin.delete_user(admin.create_user(counter.next_user()))
+
+    def contact_created() -> None:
+        admin.delete_contact(token, admin.create_contact(token, CONTACTS[0][0])["_id"])
+
+    def contact_list_created() -> None:
+        admin.create_contacts(token, contact_list)
+        admin.delete_contact_list(token)
+
+    return {
+        "fixture.user_registered": user_registered,
+        "fixture.user_registered_without_pool": user_registered_without_pool,
+        "fixture.contact_created": contact_created,
+        "fixture.contact_list_created": contact_list_created,
+    }
+
+def _json_benchmarks(admin: AdminAPI) -> dict:
+    contacts = [
+        {"_id": f"{index:024x}", **CONTACTS[index % len(CONTACTS)][0], "owner": "0" * 24, "__v": 0}
+        for index in range(LARGE_LIST_SIZE)
+    ]
+    body = json.dumps(contacts).encode()
+    chunks = [body[start:start + CHUNK_SIZE] for start in range(0, len(body), CHUNK_SIZE)]
+    user = USERS_REGISTRATION[0][0]
+    token = admin.create_user({**user, "email": namespace_email(user["email"], "json")})
+    admin.create_contacts(token, [CONTACTS[index % 3][0] for index in range(1000)])
+
+    def iter_contact_list() -> None:
+        for _ in iter_json_array(chunks):
+            pass
+
+    def admin_iter_contact_list() -> None:
+        for _ in admin.iter_contact_list(token):
+            pass
+
+    return {
+        f"json.loads[{LARGE_LIST_SIZE}]": lambda: json.loads(body),
+        f"json.iter_json_array[{LARGE_LIST_SIZE}]": iter_contact_list,
+        "json.admin.get_contact_list[1000]": lambda: admin.get_contact_list(token),
+        "json.admin.iter_contact_list[1000]": admin_iter_contact_list,
+    }
+
+def _check_benchmarks() -> dict:
+    test_contact = TestAPIContact()
+    test_user = TestAPIUser()
+    contact = {"_id": "0" * 24, **CONTACTS[0][0], "owner": "1" * 24, "__v": 0}
+    contact_list = [{**contact, "_id": f"{index:024x}"} for index in range(LARGE_LIST_SIZE)]
+    user = {"_id": "0" * 24, **USERS_REGISTRATION[0][0], "__v": 0}
+    request = requests.Request("GET", URL + "contacts").prepare()
+    auth = BearerAuth("t" * 43)
+    return {
+        "check.contact_json_schema": lambda: test_contact.check_contact_json_schema(contact),
+        f"check.contact_list_json_schema[{LARGE_LIST_SIZE}]": lambda: test_contact.check_contact_list_json_schema(
+            contact_list,
+        ),
+        "check.contact_equals": lambda: test_contact.check_contact_equals(CONTACTS[0][0], contact),
+        "check.user_json_schema": lambda: test_user.check_user_json_schema(user),
+        "check.user_equals": lambda: test_user.check_user_equals(USERS_REGISTRATION[0][0], user),
+        "bearer_auth": lambda: auth(request),
+    }
+
+def collect_benchmarks() -> tuple:
+    """Return benchmarks by name and clients which must be closed after the run.
+
+    Every client calls its own in-process stand-in, so benchmarks don't depend on network or each other's data.
+    """
+    clients = []
+
+    def client(**kwargs) -> AdminAPI:
+        clients.append(AdminAPI(URL, transport = WSGIAdapter(ContactListApp()), **kwargs))
+        return clients[-1]
+
+    admin = client(token_ttl = None)
+    # Token cache shares the application with uncached client, so both log in the same user
+    cached_admin = AdminAPI(URL, transport = admin.session.get_adapter(URL))
+    clients.append(cached_admin)
+    benchmarks = {
+        **_admin_benchmarks(admin, cached_admin),
+        **_fixture_benchmarks(client()),
+        **_json_benchmarks(client(token_ttl = None)),
+        **_check_benchmarks(),
+    }
+    return benchmarks, clients
+
+def run_benchmarks(measure: Callable, name_filter: str | None = None) -> dict:
+    benchmarks, clients = collect_benchmarks()
+    try:
+        return {
+            name: measure(function) for name, function in benchmarks.items() if not name_filter or name_filter in name
+        }
+    finally:
+        for client in clients:
+            client.close()
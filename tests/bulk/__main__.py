@@ -0,0 +1,56 @@
+import argparse
+import logging
+import time
+
+from tests.api.test_cases_user import USERS_REGISTRATION
+from tests.bulk.generator import ContactGenerator
+from tests.util.identity import namespace_email
+from util.admin.admin_api import AdminAPI
+from util.stand_in.server import StandInServer
+
+
+def create(args: argparse.Namespace, url: str | None, generator: ContactGenerator) -> None:
+    with AdminAPI(url) as admin:
+        if args.email:
+            token = admin.log_in(args.email, args.password)
+        else:
+            default = USERS_REGISTRATION[0][0]
+            user = {**default, "email": namespace_email(default["email"], f"bulk{time.time_ns()}")}
+            token = admin.create_user(user)
+            print(f"Registered {user['email']} with password {user['password']}")  # noqa: T201
+        start = time.perf_counter()
+        created = generator.create_contacts(admin, token, args.count, max_workers = args.workers)
+        elapsed = time.perf_counter() - start
+    print(f"Created {created} of {args.count} contacts in {elapsed:.1f} s ({created / elapsed:.0f} contacts/s)")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog = "python -m tests.bulk",
+        description = "Generate seeded valid contact payloads and write them to a file or create them in bulk.",
+    )
+    parser.add_argument("--count", type = int, default = 10000, help = "number of contacts (default: 10000)")
+    parser.add_argument("--seed", type = int, default = 0, help = "seed of generated payloads (default: 0)")
+    parser.add_argument("--batch-size", type = int, default = 1000, help = "contacts generated at once (default: 1000)")
+    parser.add_argument("--output", default = None, help = "write contacts to this JSON lines file, don't create them")
+    parser.add_argument("--url", default = None, help = "application url (default: CONTACT_LIST_URL or public one)")
+    parser.add_argument("--stand-in", action = "store_true", help = "create contacts in local in-memory stand-in")
+    parser.add_argument("--email", default = None, help = "existing user owning contacts (default: register a new one)")
+    parser.add_argument("--password", default = None, help = "password of --email user")
+    parser.add_argument("--workers", type = int, default = 10, help = "concurrent create requests (default: 10)")
+    parser.add_argument("--log-level", default = "WARNING", help = "logging level")
+    args = parser.parse_args()
+    logging.basicConfig(level = args.log_level, format = "%(asctime)s [%(levelname)s] %(message)s")
+    generator = ContactGenerator(args.seed, args.batch_size)
+
+    if args.output:
+        generator.write_jsonl(args.output, args.count)
+    elif args.stand_in:
+        with StandInServer() as server:
+            create(args, server.url, generator)
+    else:
+        create(args, args.url, generator)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from util.admin.admin_api import AdminAPIException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from util.admin.admin_api import AdminAPI
+
+LOGGER = logging.getLogger(__name__)
+
+FIRST_NAMES = (
+    "Will", "Bob", "John", "Anna", "Maria", "Olena", "Taras", "Emma", "Liam", "Noah",
+    "Olivia", "Sophia", "Lucas", "Mia", "Leap", "Aaaaaaaaaabbbbbbbbbb",
+)
+LAST_NAMES = (
+    "Smith", "Ross", "Dylan", "Green", "Shevchenko", "Kowalski", "Muller", "Garcia", "Rossi", "Dubois",
+    "Tanaka", "Brown", "Year", "Aaaaaaaaaabbbbbbbbbb",
+)
+STREETS = (
+    "Main St.", "Kingston Ave", "Eiffel Tower", "Khreshchatyk St.", "Marszalkowska", "Baker Street",
+    "Aaaaaaaaaabbbbbbbbbbccccccccccdddd",
+)
+STREET2 = ("Apartment A", "House 33", "Suite 100", "Floor 2", "aaaaaaaaaabbbbbbbbbbccccccccccdddddddddd")
+# (city, stateProvince, postalCode, country), postal codes are 3 to 7 digits as in the valid test cases
+PLACES = (
+    ("New York", "NY", "10118", "USA"),
+    ("Daytona Beach", "FL", "22222", "USA"),
+    ("Paris", "PR", "75001", "France"),
+    ("Kyiv", "Kyiv", "01001", "Ukraine"),
+    ("Warszawa", "Mazowieckie", "00950", "Poland"),
+    ("Sao Paulo", "SP", "1310100", "Brazil"),
+    (
+        "aaaaaaaaaabbbbbbbbbbccccccccccdddddddddd",
+        "aaaaaaaaaabbbbbbbbbb",
+        "111",
+        "aaaaaaaaaabbbbbbbbbbccccccccccdddddddddd",
+    ),
+)
+DOMAINS = ("mail.com", "example.com", "test.org")
+# Phones have 9 or 10 digits or +55 and 10 digits. Other country codes of the valid test cases are rejected
+# by the live backend, so they are not generated
+PHONE_NUMBERS = range(10 ** 8, 10 ** 10)
+PREFIXED_PHONE_NUMBERS = range(10 ** 9, 10 ** 10)
+PREFIXED_PHONE_RATE = 0.25
+OPTIONAL_FIELDS = (
+    "birthdate", "email", "phone", "street1", "street2", "city", "stateProvince", "postalCode", "country",
+)
+
+# Fixed bounds, so the same seed gives the same payloads on any day
+_FIRST_BIRTHDATE = dt.date(1900, 1, 1).toordinal()
+_LAST_BIRTHDATE = dt.date(2020, 12, 31).toordinal()
+
+
+class ContactGenerator:
+    """Seeded generator of valid contact payloads following the field rules of `CONTACTS` test cases.
+
+    Payloads are built in batches column by column: every field of the batch is drawn with one
+    `random.choices(..., k = batch_size)` call and rows are zipped from the columns, so cost per contact is
+    a few tuple lookups instead of a chain of random calls. The same seed and batch size give the same payloads.
+    A `minimal_rate` share of contacts has only required `firstName` and `lastName`.
+
+    Attributes:
+        seed (int):           Seed of the random generator.
+        batch_size (int):     Contacts per batch.
+        minimal_rate (float): Share of contacts without optional fields.
+
+    """
+
+    def __init__(self, seed: int = 0, batch_size: int = 1000, minimal_rate: float = 0.05) -> None:
+        self.seed = seed
+        self.batch_size = batch_size
+        self.minimal_rate = minimal_rate
+        self._random = random.Random(seed)
+        self._generated = 0
+
+    def _batch(self, size: int) -> list:
+        choices = self._random.choices
+        first = self._generated
+        self._generated += size
+        first_names = choices(FIRST_NAMES, k = size)
+        last_names = choices(LAST_NAMES, k = size)
+        birthdates = [
+            dt.date.fromordinal(ordinal).isoformat()
+            for ordinal in choices(range(_FIRST_BIRTHDATE, _LAST_BIRTHDATE + 1), k = size)
+        ]
+        # Running number keeps emails unique within the generated set
+        emails = [
+            f"{first_name}.{last_name}.{number}@{domain}".lower()
+            for first_name, last_name, number, domain in zip(
+                first_names, last_names, range(first, first + size), choices(DOMAINS, k = size), strict = True,
+            )
+        ]
+        prefixed = choices((True, False), weights = (PREFIXED_PHONE_RATE, 1 - PREFIXED_PHONE_RATE), k = size)
+        phones = [
+            f"+55{prefixed_number}" if is_prefixed else str(number)
+            for is_prefixed, number, prefixed_number in zip(
+                prefixed, choices(PHONE_NUMBERS, k = size), choices(PREFIXED_PHONE_NUMBERS, k = size), strict = True,
+            )
+        ]
+        streets1 = list(map("{} {}".format, choices(range(1, 1000), k = size), choices(STREETS, k = size)))
+        streets2 = choices(STREET2, k = size)
+        places = choices(PLACES, k = size)
+        minimal = choices((True, False), weights = (self.minimal_rate, 1 - self.minimal_rate), k = size)
+        batch = []
+        columns = (first_names, last_names, minimal, birthdates, emails, phones, streets1, streets2, places)
+        for row in zip(*columns, strict = True):
+            first_name, last_name, is_minimal, *optional = row
+            contact = {"firstName": first_name, "lastName": last_name}
+            if not is_minimal:
+                contact.update(zip(OPTIONAL_FIELDS, (*optional[:-1], *optional[-1]), strict = True))
+            batch.append(contact)
+        return batch
+
+    def batches(self, count: int) -> Iterator[list]:
+        """Yield `count` contacts in lists of at most `batch_size`, only one batch is kept in memory."""
+        while count > 0:
+            size = min(count, self.batch_size)
+            count -= size
+            yield self._batch(size)
+
+    def write_jsonl(self, path: str, count: int) -> None:
+        """Write `count` contacts to `path`, one JSON object per line."""
+        with Path(path).open("w", encoding = "utf-8") as file:
+            for batch in self.batches(count):
+                file.writelines(json.dumps(contact) + "\n" for contact in batch)
+        LOGGER.info("Wrote %d generated contacts to %s", count, path)
+
+    def create_contacts(self, admin: AdminAPI, token: str, count: int, max_workers: int = 10) -> int:
+        """Create `count` contacts of the token's user batch by batch and return number of created ones."""
+        created = 0
+        for batch in self.batches(count):
+            results = admin.create_contacts(token, batch, max_workers = max_workers)
+            created += sum(not isinstance(result, AdminAPIException) for result in results)
+            LOGGER.debug("Created %d of %d generated contacts", created, count)
+        return created
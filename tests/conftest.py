@@ -1,42 +1,346 @@
-import contextlib
 import logging
+import os
+import tempfile
 import warnings
+from pathlib import Path
+from urllib.parse import urlsplit
 
 import pytest
+import requests
 
 from tests.api.contact.test_cases_contact import CONTACTS
-from tests.api.test_cases_user import USERS_REGISTRATION, USERS_REGISTRATION_INVALID
+from tests.api.test_cases_user import (
+    USERS_PATCHED,
+    USERS_PATCHED_INVALID,
+    USERS_REGISTRATION,
+    USERS_REGISTRATION_INVALID,
+)
+from tests.util.identity import get_namespace, get_worker_number, namespace_email, namespace_payload
 from util.admin.admin_api import AdminAPI, AdminAPIException
+from util.admin.cassette import RECORD, REPLAY, CassetteAdapter
+from util.admin.ledger import ResourceLedger
+from util.admin.rate_limiter import RateLimiter
+from util.admin.response_cache import ResponseCache
+from util.admin.teardown_queue import TeardownQueue
+from util.admin.transport import app_adapter
+from util.admin.user_pool import UserPool
+from util.config import BASE_URL_ENV, get_base_url
+from util.metrics import MetricsRecorder
+from util.stand_in.app import ContactListApp
+from util.stand_in.server import StandInServer
 
 LOGGER = logging.getLogger(__name__)
 
+STAND_IN_SERVER = pytest.StashKey[StandInServer]()
+STAND_IN_APP = pytest.StashKey[ContactListApp]()
+METRICS_RECORDER = pytest.StashKey[MetricsRecorder]()
+TEST_INDEX = pytest.StashKey[int]()
+IN_PROCESS_URL = "http://stand-in.local/"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("contact-list")
+    group.addoption(
+        "--contact-list-url",
+        default = None,
+        help = f"Contact List Application base url (env: {BASE_URL_ENV})",
+    )
+    group.addoption(
+        "--stand-in",
+        action = "store_true",
+        help = "run tests against local in-memory Contact List server",
+    )
+    group.addoption(
+        "--in-process",
+        action = "store_true",
+        help = "call in-memory Contact List application in-process without sockets",
+    )
+    group.addoption(
+        "--record-cassette",
+        default = None,
+        help = "record all HTTP traffic of the run into cassette FILE",
+    )
+    group.addoption(
+        "--replay-cassette",
+        default = None,
+        help = "serve HTTP traffic from cassette FILE recorded with the same tests and options",
+    )
+    group.addoption(
+        "--cassette-strict",
+        action = "store_true",
+        help = "fail requests missing in replayed cassette instead of sending and recording them",
+    )
+    group.addoption(
+        "--cleanup-workers",
+        type = int,
+        default = 10,
+        help = "number of users deleted concurrently during session start cleanup (default: 10)",
+    )
+    group.addoption(
+        "--cleanup-timeout",
+        type = float,
+        default = 30,
+        help = "seconds allowed for cleanup of one user (default: 30)",
+    )
+    group.addoption(
+        "--identity-prefix",
+        default = "",
+        help = "prefix of per-test email tags, unique for every run sharing the backend, e.g. CI node",
+    )
+    group.addoption(
+        "--no-user-pool",
+        action = "store_true",
+        help = "register and delete a new user for every test instead of leasing pooled ones",
+    )
+    group.addoption(
+        "--clear-user-pool",
+        action = "store_true",
+        help = "delete pooled users at the end of the session instead of keeping them for the next run",
+    )
+    group.addoption(
+        "--sweep-scope",
+        choices = ("test", "module", "session"),
+        default = "test",
+        help = "delete resources recorded in the ledger after every test, module or only at session end "
+        "(default: test)",
+    )
+    group.addoption(
+        "--teardown-workers",
+        type = int,
+        default = 0,
+        help = "delete fixture resources in N background threads, waiting for them only at module and session end "
+        "(default: 0, delete immediately)",
+    )
+    group.addoption(
+        "--driver-max-uses",
+        type = int,
+        default = 50,
+        help = "number of UI tests run in one browser instance before it is relaunched "
+        "(default: 50, 1 launches browser for every test)",
+    )
+    group.addoption(
+        "--rate-limit",
+        type = float,
+        default = None,
+        help = "maximum AdminAPI requests per second shared by all workers on the host",
+    )
+    group.addoption(
+        "--rate-burst",
+        type = int,
+        default = 5,
+        help = "number of requests allowed at once by --rate-limit (default: 5)",
+    )
+    group.addoption(
+        "--http-cache",
+        action = "store_true",
+        help = "revalidate repeated AdminAPI GET requests with ETag instead of downloading them",
+    )
+    group.addoption(
+        "--metrics-file",
+        default = None,
+        help = "record AdminAPI request metrics, write them to OpenMetrics file and show summary",
+    )
+
+def pytest_configure(config):
+    url = config.getoption("--contact-list-url")
+    if config.getoption("--in-process"):
+        config.stash[STAND_IN_APP] = ContactListApp()
+        url = IN_PROCESS_URL
+    elif config.getoption("--stand-in"):
+        server = StandInServer()
+        server.start()
+        config.stash[STAND_IN_SERVER] = server
+        url = server.url
+    if url is not None:
+        os.environ[BASE_URL_ENV] = url
+    if config.getoption("--metrics-file"):
+        config.stash[METRICS_RECORDER] = MetricsRecorder()
+
+@pytest.hookimpl(tryfirst = True)
+def pytest_collection_modifyitems(session, config, items):
+    # Every xdist worker collects the same items, so index of a test is the same in any worker and any run.
+    # Index is taken before deselection, so -k and -m don't change emails recorded in cassettes.
+    for index, item in enumerate(items):
+        item.stash[TEST_INDEX] = index
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if METRICS_RECORDER not in config.stash:
+        return
+    recorder = config.stash[METRICS_RECORDER]
+    path = config.getoption("--metrics-file")
+    Path(path).write_text(recorder.to_openmetrics(), encoding = "utf-8")
+    terminalreporter.write_sep("=", "AdminAPI request latency")
+    for line in recorder.format_summary():
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"OpenMetrics written to {path}")
+
+def pytest_unconfigure(config):
+    if STAND_IN_SERVER in config.stash:
+        config.stash[STAND_IN_SERVER].stop()
+
+
+def _keeps_state(config) -> bool:
+    """Whether the application outlives the run and requests of the run don't have to be reproducible.
+
+    In-memory stand-in is gone after the run. State kept between runs changes requests, so it is not used
+    when traffic is recorded or replayed either.
+    """
+    return not any(
+        config.getoption(option) for option in ("--in-process", "--stand-in", "--record-cassette", "--replay-cassette")
+    )
+
+def _ledger_directory(config) -> str | None:
+    """Directory of ledger journals for the application host or None if they are not kept between runs."""
+    if not _keeps_state(config):
+        return None
+    name = urlsplit(get_base_url()).netloc.replace(":", "_")
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        return str(cache.mkdir(f"resource-ledger-{name}"))
+    directory = Path(tempfile.gettempdir()) / f"contact-list-resource-ledger-{name}"
+    directory.mkdir(parents = True, exist_ok = True)
+    return str(directory)
+
+
+@pytest.fixture(scope = "session")
+def ledger(request):
+    directory = _ledger_directory(request.config)
+    path = str(Path(directory) / f"{os.getpid()}.jsonl") if directory is not None else None
+    with ResourceLedger(path) as _ledger:
+        yield _ledger
+
+def _report_teardown_failures(failures: list) -> None:
+    for key, exception in failures:
+        LOGGER.error("Deferred teardown of %s failed: %s", key, exception)
+        warnings.warn(f"Deferred teardown of {key} failed: {exception}", stacklevel = 2)
+
 
 @pytest.fixture(autouse = True, scope = "session")
-def admin():
-    return AdminAPI()
+def admin(request, ledger: ResourceLedger):
+    transport = None
+    if STAND_IN_APP in request.config.stash:
+        transport = app_adapter(request.config.stash[STAND_IN_APP])
+    if request.config.getoption("--record-cassette"):
+        transport = CassetteAdapter(request.config.getoption("--record-cassette"), RECORD, adapter = transport)
+    elif request.config.getoption("--replay-cassette"):
+        transport = CassetteAdapter(
+            request.config.getoption("--replay-cassette"),
+            REPLAY,
+            strict = request.config.getoption("--cassette-strict"),
+            adapter = transport,
+        )
+    rate_limiter = None
+    rate = request.config.getoption("--rate-limit")
+    # Replayed responses don't reach the backend
+    if rate and not request.config.getoption("--replay-cassette"):
+        # Bucket file is per application host, so workers and parallel runs against the same backend share it
+        name = urlsplit(get_base_url()).netloc.replace(":", "_")
+        path = str(Path(tempfile.gettempdir()) / f"contact-list-rate-limit-{name}")
+        rate_limiter = RateLimiter(rate, request.config.getoption("--rate-burst"), path)
+    # Tests change resources with raw requests too, so cached responses are always revalidated
+    response_cache = ResponseCache() if request.config.getoption("--http-cache") else None
+    with AdminAPI(
+        transport = transport, rate_limiter = rate_limiter, response_cache = response_cache, ledger = ledger,
+    ) as _admin:
+        if METRICS_RECORDER in request.config.stash:
+            _admin.add_hook(request.config.stash[METRICS_RECORDER])
+        yield _admin
+
+@pytest.fixture(scope = "session")
+def session(admin: AdminAPI) -> requests.Session:
+    """Session for raw requests in tests. Shares transport and connection pool with `admin`."""
+    return admin.session
+
+def _user_payloads(item) -> list:
+    """User payloads which the test registers or patches its user to, before namespacing."""
+    default = USERS_REGISTRATION[0][0]
+    payloads = [default] if "user_default" in item.fixturenames else []
+    callspec = getattr(item, "callspec", None)
+    for param in callspec.params.values() if callspec is not None else ():
+        table = getattr(param, "table", None)
+        if table is USERS_REGISTRATION or table is USERS_REGISTRATION_INVALID:
+            payloads.append(param[0])
+        elif table is USERS_PATCHED or table is USERS_PATCHED_INVALID:
+            # Registered user is patched to these fields
+            payloads.append({**default, **param[0]})
+    return payloads
 
 @pytest.fixture(autouse = True, scope = "session")
-def unique_credentials():
+def unique_credentials(request):
+    """Credentials of users which collected tests may have left behind in this worker, e.g. in an aborted run.
+
+    Emails are namespaced the same way as in the tests, so they match users created by raw requests too.
+    """
     _unique_credentials = set()
-    user_test_cases = USERS_REGISTRATION + USERS_REGISTRATION_INVALID
-    for user in user_test_cases:
-        if "email" in user[0] and "password" in user[0]:
-            credential = (user[0]["email"], user[0]["password"])
-            _unique_credentials.add(credential)
-    LOGGER.info("Set up set of unique credentials from User test cases")
+    prefix = request.config.getoption("--identity-prefix")
+    for item in request.session.items:
+        namespace = get_namespace(item.stash.get(TEST_INDEX, 0), prefix)
+        for payload in _user_payloads(item):
+            user = namespace_payload(payload, namespace)
+            if isinstance(user.get("email"), str) and isinstance(user.get("password"), str):
+                _unique_credentials.add((user["email"], user["password"]))
+    LOGGER.info("Set up set of %d unique credentials of collected tests", len(_unique_credentials))
     return _unique_credentials
 
+@pytest.fixture(scope = "session")
+def teardown_queue(request):
+    """Queue of fixture deletions keyed by email of the user which owns deleted resources."""
+    queue = TeardownQueue(request.config.getoption("--teardown-workers"))
+    yield queue
+    _report_teardown_failures(queue.close())
+
 @pytest.fixture(autouse = True, scope = "session")
-def cleanup(admin: AdminAPI, unique_credentials: set):
-    for credential in unique_credentials:
-        with contextlib.suppress(AdminAPIException):
-            token = admin.log_in(credential[0], credential[1])
-            admin.delete_user(token)
-    LOGGER.info("Performed data cleanup")
+def cleanup(request, admin: AdminAPI, ledger: ResourceLedger, teardown_queue: TeardownQueue, unique_credentials: set):
+    directory = _ledger_directory(request.config)
+    if directory is not None:
+        # Journals left by crashed runs, journals of running workers stay locked
+        for stale in ResourceLedger.claim_stale(directory):
+            with stale:
+                stale.sweep(admin, max_workers = request.config.getoption("--cleanup-workers"), include_leases = True)
+    results = admin.delete_users(
+        unique_credentials,
+        max_workers = request.config.getoption("--cleanup-workers"),
+        timeout = request.config.getoption("--cleanup-timeout"),
+    )
+    removed = sum(result is True for result in results)
+    absent = sum(result is False for result in results)
+    timed_out = sum(isinstance(result, TimeoutError) for result in results)
+    failed = len(results) - removed - absent - timed_out
+    LOGGER.info(
+        "Performed data cleanup: %d stale users removed, %d already absent, %d failed, %d timed out",
+        removed, absent, failed, timed_out,
+    )
+    yield
+    _report_teardown_failures(teardown_queue.wait())
+    ledger.sweep(admin)
+    LOGGER.info("Deleted resources created during session")
+
+@pytest.fixture(autouse = True, scope = "module")
+def sweep_module(request, admin: AdminAPI, ledger: ResourceLedger, teardown_queue: TeardownQueue):
+    mark = ledger.mark()
+    yield
+    _report_teardown_failures(teardown_queue.wait())
+    # Sweep after every test would wait for deferred teardown, so it is done here
+    if request.config.getoption("--sweep-scope") == "module" or (
+        request.config.getoption("--sweep-scope") == "test" and teardown_queue.max_workers
+    ):
+        ledger.sweep(admin, since = mark)
+
+@pytest.fixture(autouse = True)
+def sweep_test(request, admin: AdminAPI, ledger: ResourceLedger, teardown_queue: TeardownQueue):
+    mark = ledger.mark()
+    yield
+    if request.config.getoption("--sweep-scope") == "test" and not teardown_queue.max_workers:
+        ledger.sweep(admin, since = mark)
 
 @pytest.fixture
-def user_default() -> dict:
-    return USERS_REGISTRATION[0][0]
+def identity(request) -> str:
+    """Namespace of user emails unique for the test and the worker, e.g. `w3t17`."""
+    return get_namespace(request.node.stash.get(TEST_INDEX, 0), request.config.getoption("--identity-prefix"))
+
+@pytest.fixture
+def user_default(identity: str) -> dict:
+    return namespace_payload(USERS_REGISTRATION[0][0], identity)
 
 @pytest.fixture
 def contact_default() -> dict:
@@ -50,20 +354,59 @@ def contact_list_default() -> dict:
     contact_list.append(CONTACTS[2][0])
     return contact_list
 
+@pytest.fixture(scope = "session")
+def user_pool(request, admin: AdminAPI, teardown_queue: TeardownQueue):
+    # Pooled user is shared by tests, so its requests would depend on which tests run and replay of a part would fail
+    options = ("--no-user-pool", "--record-cassette", "--replay-cassette")
+    if any(request.config.getoption(option) for option in options):
+        yield None
+        return
+    prefix = request.config.getoption("--identity-prefix")
+    default = USERS_REGISTRATION[0][0]
+    email_template = namespace_email(default["email"], f"{prefix}w{get_worker_number()}p{{}}")
+    cache = getattr(request.config, "cache", None) if _keeps_state(request.config) else None
+    key = f"contact-list/user-pool/{urlsplit(get_base_url()).netloc}/{prefix}w{get_worker_number()}"
+    accounts = cache.get(key, []) if cache is not None else []
+    pool = UserPool(admin, email_template, default["password"], accounts)
+    LOGGER.info("Set up user pool with %d users", len(pool.accounts))
+    yield pool
+    # Leased users return to the pool only after their deferred release
+    _report_teardown_failures(teardown_queue.wait())
+    if request.config.getoption("--clear-user-pool"):
+        pool.clear()
+    if cache is not None:
+        cache.set(key, pool.accounts)
+        LOGGER.info("Saved %d pooled users", len(pool.accounts))
+
 @pytest.fixture
-def user_registered(admin: AdminAPI, user_default):
+def user_registered(admin: AdminAPI, user_pool: UserPool | None, teardown_queue: TeardownQueue, user_default):
+    if user_pool is not None:
+        token = user_pool.lease(user_default)
+        LOGGER.info("Leased registered user")
+        yield user_default
+        teardown_queue.submit(user_default["email"], user_pool.release, token)
+        LOGGER.info("Released registered user")
+        return
     token = admin.create_user(user_default)
     LOGGER.info("Created registered user")
     yield user_default
-    try:
-        admin.delete_user(token)
-        LOGGER.info("Deleted registered user")
-    except AdminAPIException as exception:
-        LOGGER.warning("Registered user was not deleted from the first try")
-        warnings.warn("Registered user was not deleted from the first try")
-        LOGGER.warning("For some reason original token was invalidated. Couldn't delete user required for test from the first attempt")
-        warnings.warn("For some reason original token was invalidated. Couldn't delete user required for test from the first attempt")
-        LOGGER.info("Logging in to receive new token")
-        token = admin.log_in(user_default["email"], user_default["password"])
-        admin.delete_user(token)
-        LOGGER.info("Registered user was deleted from the second try")
\ No newline at end of file
+
+    def delete_user_registered(token: str) -> None:
+        try:
+            admin.delete_user(token)
+            LOGGER.info("Deleted registered user")
+        except AdminAPIException:
+            LOGGER.warning("Registered user was not deleted from the first try")
+            warnings.warn("Registered user was not deleted from the first try", stacklevel = 2)
+            message = (
+                "For some reason original token was invalidated. "
+                "Couldn't delete user required for test from the first attempt"
+            )
+            LOGGER.warning(message)
+            warnings.warn(message, stacklevel = 2)
+            LOGGER.info("Logging in to receive new token")
+            token = admin.log_in(user_default["email"], user_default["password"])
+            admin.delete_user(token)
+            LOGGER.info("Registered user was deleted from the second try")
+
+    teardown_queue.submit(user_default["email"], delete_user_registered, token)
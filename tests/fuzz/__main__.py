@@ -0,0 +1,51 @@
+import argparse
+import asyncio
+import logging
+import sys
+
+from tests.fuzz.fuzzer import TARGETS, Fuzzer
+from util.admin.async_admin_api import AsyncAdminAPI
+from util.stand_in.server import StandInServer
+
+
+async def run(args: argparse.Namespace, url: str | None) -> Fuzzer:
+    async with AsyncAdminAPI(url, max_concurrency = args.concurrency, max_connections = args.concurrency) as admin:
+        fuzzer = Fuzzer(admin)
+        await fuzzer.setup()
+        try:
+            await fuzzer.run(args.target or list(TARGETS), args.count, seed = args.seed)
+        finally:
+            await fuzzer.teardown()
+        return fuzzer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog = "python -m tests.fuzz",
+        description = "Send mutated invalid test case payloads to Contact List Application and group the responses.",
+    )
+    parser.add_argument("--url", default = None, help = "application url (default: CONTACT_LIST_URL or public one)")
+    parser.add_argument("--stand-in", action = "store_true", help = "start local in-memory stand-in and fuzz it")
+    parser.add_argument("--target", action = "append", choices = list(TARGETS), help = "fuzzed endpoint (default: all)")
+    parser.add_argument("--count", type = int, default = 1000, help = "variants per target (default: 1000)")
+    parser.add_argument("--seed", type = int, default = None, help = "seed of mutations")
+    parser.add_argument("--concurrency", type = int, default = 50, help = "maximum requests in flight (default: 50)")
+    parser.add_argument("--log-level", default = "INFO", help = "logging level")
+    args = parser.parse_args()
+    logging.basicConfig(level = args.log_level, format = "%(asctime)s [%(levelname)s] %(message)s")
+    # Request logs of httpx would flood the output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if args.stand_in:
+        with StandInServer() as server:
+            fuzzer = asyncio.run(run(args, server.url))
+    else:
+        fuzzer = asyncio.run(run(args, args.url))
+    for line in fuzzer.format_report():
+        print(line)  # noqa: T201
+    if any(status is None or status >= 500 for _, status, _ in fuzzer.findings()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+import httpx
+
+from tests.api.contact.test_cases_contact import CONTACTS, CONTACTS_INVALID
+from tests.api.test_cases_user import USERS_REGISTRATION, USERS_REGISTRATION_INVALID
+from tests.fuzz.mutator import CONTACT_FIELDS, USER_FIELDS, Mutator
+from tests.util.identity import namespace_email
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from util.admin.async_admin_api import AsyncAdminAPI
+
+LOGGER = logging.getLogger(__name__)
+
+# Target name: (endpoint, seed cases, valid cases, fields)
+TARGETS = {
+    "contact": ("contacts", CONTACTS_INVALID, CONTACTS, CONTACT_FIELDS),
+    "user": ("users", USERS_REGISTRATION_INVALID, USERS_REGISTRATION, USER_FIELDS),
+}
+EXAMPLES_PER_BUCKET = 3
+
+
+def response_message(response: httpx.Response) -> str:
+    """Return error message of response without values sent in the request.
+
+    Validation errors are described by failed path and validator kind, e.g. `email: user defined`, because their
+    messages quote rejected values and would put every variant in its own bucket. Created resources are `accepted`.
+    """
+    if response.is_success:
+        return "accepted"
+    try:
+        body = response.json()
+    except ValueError:
+        return response.text[:100]
+    if isinstance(body, dict) and isinstance(body.get("errors"), dict):
+        kinds = (
+            f"{path}: {error.get('kind') if isinstance(error, dict) else error}"
+            for path, error in sorted(body["errors"].items())
+        )
+        return f"{body.get('_message', 'Validation failed')}: " + ", ".join(kinds)
+    if isinstance(body, dict) and "message" in body:
+        return str(body["message"])
+    return json.dumps(body)[:100]
+
+
+class Bucket:
+    """Responses with the same status and error message.
+
+    Attributes:
+        count (int):     Number of responses.
+        examples (list): First (seed test id, labels, payload) variants which got this response.
+
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.examples = []
+
+
+class Fuzzer:
+    """Sends mutated invalid payloads concurrently through `AsyncAdminAPI` client and buckets the responses.
+
+    User variants get unique subaddressed emails, so valid looking ones are not rejected as duplicates.
+    Contacts are created for a user registered in `setup()`; `teardown()` deletes it together with users
+    and contacts created by accepted variants.
+
+    Attributes:
+        admin (AsyncAdminAPI): Client whose connection pool and concurrency limit are used for all requests.
+        buckets (dict):        `Bucket` by (target, status, message).
+        errors (int):          Number of requests which failed without response.
+        elapsed (float):       Seconds of the last `run()`.
+
+    """
+
+    def __init__(self, admin: AsyncAdminAPI) -> None:
+        self.admin = admin
+        self.buckets = {}
+        self.errors = 0
+        self.elapsed = 0.0
+        self._run_id = uuid.uuid4().hex[:8]
+        self._token = None
+        self._created_tokens = []
+
+    async def setup(self) -> None:
+        user = dict(USERS_REGISTRATION[0][0])
+        user["email"] = namespace_email(user["email"], f"fuzz{self._run_id}")
+        self._token = await self.admin.create_user(user)
+
+    async def teardown(self) -> None:
+        tokens = [*self._created_tokens, self._token] if self._token is not None else self._created_tokens
+        if self._token is not None:
+            await self.admin.delete_contact_list(self._token)
+        results = await asyncio.gather(*(self.admin.delete_user(token) for token in tokens), return_exceptions = True)
+        failed = sum(isinstance(result, Exception) for result in results)
+        LOGGER.info("Deleted %d fuzz users, %d failed", len(results) - failed, failed)
+
+    def _record(self, key: tuple, variant: tuple) -> None:
+        bucket = self.buckets.setdefault(key, Bucket())
+        bucket.count += 1
+        if len(bucket.examples) < EXAMPLES_PER_BUCKET:
+            bucket.examples.append(variant)
+
+    async def _send(self, target: str, number: int, variant: tuple) -> None:
+        endpoint = TARGETS[target][0]
+        _, _, payload = variant
+        if target == "user" and isinstance(payload.get("email"), str):
+            payload["email"] = namespace_email(payload["email"], f"fuzz{self._run_id}v{number}")
+        token = self._token if target == "contact" else None
+        try:
+            response = await self.admin.request("POST", endpoint, token, json = payload)
+        except httpx.HTTPError as exception:
+            self.errors += 1
+            self._record((target, None, type(exception).__name__), variant)
+            return
+        if target == "user" and response.status_code == 201:
+            self._created_tokens.append(response.json()["token"])
+        self._record((target, response.status_code, response_message(response)), variant)
+
+    async def run(self, targets: Iterable[str], count: int, seed: int | None = None) -> None:
+        """Send `count` variants per target, as many at once as the client allows."""
+        start = time.perf_counter()
+        tasks = set()
+        for target in targets:
+            _, seeds, valid, fields = TARGETS[target]
+            LOGGER.info("Sending %d %s variants", count, target)
+            # Variants are produced while requests are in flight, so only as many of them exist as can be sent
+            mutator = Mutator(seeds, fields, seed, valid = valid)
+            for number, variant in enumerate(mutator.variants(count)):
+                if len(tasks) >= self.admin.max_concurrency:
+                    _, tasks = await asyncio.wait(tasks, return_when = asyncio.FIRST_COMPLETED)
+                tasks.add(asyncio.create_task(self._send(target, number, variant)))
+        await asyncio.gather(*tasks)
+        self.elapsed = time.perf_counter() - start
+
+    def findings(self) -> list:
+        """Return keys of buckets with server errors, failed requests or accepted invalid payloads."""
+        return [key for key in self.buckets if key[1] is None or key[1] >= 500 or 200 <= key[1] < 300]
+
+    def format_report(self) -> list:
+        total = sum(bucket.count for bucket in self.buckets.values())
+        findings = set(self.findings())
+        lines = [f"{'target':<8} {'status':>6} {'count':>7}  message", "-" * 80]
+        for key, bucket in sorted(self.buckets.items(), key = lambda item: (item[0][0], -item[1].count)):
+            target, status, message = key
+            lines.append(f"{target:<8} {status if status is not None else '-':>6} {bucket.count:>7}  {message[:200]}")
+            if key in findings:
+                lines.extend(
+                    f"{'':>24}  e.g. {test_id} + {', '.join(labels) or 'unchanged'}: {json.dumps(payload)[:150]}"
+                    for test_id, labels, payload in bucket.examples
+                )
+        rate = total / self.elapsed if self.elapsed else 0
+        lines.append("")
+        lines.append(
+            f"Sent {total} requests in {self.elapsed:.2f} s ({rate:.0f} rps), "
+            f"{len(self.buckets)} distinct responses, {len(findings)} to review",
+        )
+        return lines
+
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+CONTACT_FIELDS = (
+    "firstName", "lastName", "birthdate", "email", "phone", "street1", "street2", "city", "stateProvince", "postalCode",
+    "country",
+)
+USER_FIELDS = ("firstName", "lastName", "email", "password")
+# Maximum length of string fields, longer values are rejected by the application
+MAX_LENGTH = {
+    "firstName": 20,
+    "lastName": 20,
+    "street1": 40,
+    "street2": 40,
+    "city": 40,
+    "stateProvince": 20,
+    "postalCode": 7,
+    "phone": 15,
+    "country": 40,
+    "password": 100,
+}
+DEFAULT_MAX_LENGTH = 1000
+BAD_DATES = (
+    "2023-02-29", "2024-02-30", "2024-04-31", "1899-12-31", "3000-01-01", "0000-00-00", "99999-01-01", "1968-1-5",
+    "25-10-1968", "1968/10/25", "1968-10-25T00:00:00Z", "1968-10-25 ", "today", "",
+)
+UNICODE_VALUES = (
+    "\u0174\u00efl\u0142 \u015am\u00ef\u021b\u0127", "\u3042\u3044\u3046\u3048\u304a", "\U0001f600" * 3,
+    "e\u0301", "\u200b", "\u202eevil", "\x00", "\ufeffBOM", "\U0001d54e\U0001d55a", "\u00a0",
+)
+TYPE_VALUES = (
+    ("int", 0), ("float", 1.5), ("bool", True), ("null", None), ("list", []), ("list", ["Will"]), ("object", {}),
+    ("object", {"$gt": ""}),
+)
+OPERATORS = ("remove", "overlong", "bad_date", "unicode", "type")
+
+_MISSING = object()
+
+
+def invalid_fields(payload: dict, valid: Iterable[dict], fields: Iterable[str] = ()) -> frozenset:
+    """Return fields of `payload` whose value or absence no `valid` payload has, i.e. which may make it invalid."""
+    valid = list(valid)
+    names = {*payload, *fields}.union(*valid)
+    return frozenset(
+        name for name in names
+        if all(payload.get(name, _MISSING) != other.get(name, _MISSING) for other in valid)
+    )
+
+
+class Mutator:
+    """Seeded engine deriving invalid payload variants from invalid test case payloads.
+
+    Every variant applies 1 to `max_mutations` operators to a copy of a seed payload:
+
+    - `remove`: field is removed;
+    - `overlong`: string is made longer than `MAX_LENGTH` of the field, sometimes with multi-byte characters;
+    - `bad_date`: birthdate gets an impossible or malformed date;
+    - `unicode`: field gets combining, zero-width, right-to-left, astral or NUL characters;
+    - `type`: field gets a number, boolean, null, list or object.
+
+    Seeds are used round-robin, so every seed gets mutated even for small counts. Fields which make a seed
+    invalid, i.e. whose value or absence none of `valid` payloads has, are never mutated, so that removing
+    or replacing them can't turn a variant into a valid payload which would be reported as accepted.
+
+    Attributes:
+        seeds (list):        (test id, payload, fields which make it invalid) tuples mutations start from.
+        fields (tuple):      Fields of the target resource which are added or changed.
+        seed (int):          Seed of the random generator.
+        max_mutations (int): Maximum number of operators applied to one variant.
+
+    """
+
+    def __init__(
+        self, seeds: Iterable, fields: tuple, seed: int | None = None, max_mutations: int = 2, *, valid: Iterable = (),
+    ) -> None:
+        valid = [case[0] for case in valid]
+        self.seeds = [
+            (case[-1], case[0], invalid_fields(case[0], valid, fields) if valid else frozenset()) for case in seeds
+        ]
+        self.fields = fields
+        self.seed = seed
+        self.max_mutations = max_mutations
+        self._random = random.Random(seed)
+
+    def _field(self, payload: dict, operator: str, protected: frozenset) -> str | None:
+        if operator == "remove":
+            candidates = [field for field in payload if field not in protected]
+        elif operator == "bad_date":
+            candidates = ["birthdate"] if "birthdate" in self.fields and "birthdate" not in protected else []
+        else:
+            candidates = [field for field in self.fields if field not in protected]
+        return self._random.choice(candidates) if candidates else None
+
+    def _overlong(self, field: str) -> tuple:
+        limit = MAX_LENGTH.get(field, DEFAULT_MAX_LENGTH)
+        length = self._random.choice((limit + 1, limit + 2, limit * 2, limit * 10))
+        # Astral characters are 2 UTF-16 code units and 4 UTF-8 bytes, which checks how length is counted
+        character = self._random.choice(("a", "1", "\u0142", "\U0001f600"))
+        return f"overlong:{field}:{length}", character * length
+
+    def _apply(self, payload: dict, operator: str, protected: frozenset) -> str | None:
+        field = self._field(payload, operator, protected)
+        if field is None:
+            return None
+        if operator == "remove":
+            del payload[field]
+            return f"remove:{field}"
+        if operator == "overlong":
+            label, payload[field] = self._overlong(field)
+            return label
+        if operator == "bad_date":
+            payload[field] = self._random.choice(BAD_DATES)
+            return f"bad_date:{field}"
+        if operator == "unicode":
+            payload[field] = self._random.choice(UNICODE_VALUES)
+            return f"unicode:{field}"
+        kind, value = self._random.choice(TYPE_VALUES)
+        payload[field] = copy.deepcopy(value)
+        return f"type:{field}:{kind}"
+
+    def mutate(self, payload: dict, protected: frozenset = frozenset()) -> tuple:
+        """Return mutated copy of `payload` and labels of applied operators, `protected` fields are kept as they are."""
+        payload = copy.deepcopy(payload)
+        labels = []
+        for operator in self._random.choices(OPERATORS, k = self._random.randint(1, self.max_mutations)):
+            label = self._apply(payload, operator, protected)
+            if label is not None:
+                labels.append(label)
+        return payload, labels
+
+    def variants(self, count: int) -> Iterator[tuple]:
+        """Yield `count` (seed test id, labels, payload) variants, one by one."""
+        for test_id, payload, protected in itertools.islice(itertools.cycle(self.seeds), count):
+            mutated, labels = self.mutate(payload, protected)
+            yield test_id, labels, mutated
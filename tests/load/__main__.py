@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import logging
+
+from tests.load.generator import DEFAULT_MIX, LoadGenerator, parse_mix
+from util.admin.async_admin_api import AsyncAdminAPI
+from util.stand_in.server import StandInServer
+
+
+async def run(args: argparse.Namespace, url: str | None) -> LoadGenerator:
+    async with AsyncAdminAPI(url, max_concurrency = args.concurrency, max_connections = args.concurrency) as admin:
+        generator = LoadGenerator(
+            admin,
+            rate = args.rate,
+            duration = args.duration,
+            ramp_up = args.ramp_up,
+            mix = parse_mix(args.mix) if args.mix else None,
+            users = args.users,
+            seed = args.seed,
+        )
+        await generator.setup()
+        try:
+            await generator.run()
+        finally:
+            await generator.teardown()
+        return generator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog = "python -m tests.load",
+        description = "Send open-loop load made of test case payloads to Contact List Application.",
+    )
+    parser.add_argument("--url", default = None, help = "application url (default: CONTACT_LIST_URL or public one)")
+    parser.add_argument("--stand-in", action = "store_true", help = "start local in-memory stand-in and load it")
+    parser.add_argument("--rate", type = float, default = 50, help = "target requests per second (default: 50)")
+    parser.add_argument("--duration", type = float, default = 10, help = "seconds of measured load (default: 10)")
+    parser.add_argument(
+        "--ramp-up", type = float, default = 2, help = "seconds to grow rate from 0, not measured (default: 2)",
+    )
+    parser.add_argument("--concurrency", type = int, default = 100, help = "maximum requests in flight (default: 100)")
+    parser.add_argument("--users", type = int, default = 10, help = "users registered before the run (default: 10)")
+    parser.add_argument("--mix", default = None, help = "operation weights, e.g. get_contact=5,create_contact=1. "
+                        f"Operations: {', '.join(DEFAULT_MIX)}")
+    parser.add_argument("--seed", type = int, default = None, help = "seed of payload and operation choice")
+    parser.add_argument("--log-level", default = "INFO", help = "logging level")
+    args = parser.parse_args()
+    logging.basicConfig(level = args.log_level, format = "%(asctime)s [%(levelname)s] %(message)s")
+    # Request logs of httpx would flood the output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if args.stand_in:
+        with StandInServer() as server:
+            generator = asyncio.run(run(args, server.url))
+    else:
+        generator = asyncio.run(run(args, args.url))
+    for line in generator.format_report():
+        print(line)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import uuid
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+import httpx
+
+from tests.api.contact.test_cases_contact import CONTACTS, CONTACTS_PATCHED, CONTACTS_UPDATED
+from tests.api.test_cases_user import USERS_REGISTRATION
+from tests.util.identity import namespace_email
+from util.admin.admin_api import AdminAPIException
+from util.metrics import LatencyHistogram
+
+if TYPE_CHECKING:
+    from util.admin.async_admin_api import AsyncAdminAPI
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIX = {
+    "get_contact_list": 25,
+    "get_contact": 25,
+    "create_contact": 15,
+    "update_contact": 10,
+    "patch_contact": 10,
+    "delete_contact": 10,
+    "log_in": 3,
+    "create_user": 2,
+}
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def parse_mix(text: str) -> dict:
+    """Parse operation weights like `get_contact=5,create_contact=1`."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            exception_msg = f"Unknown operation {name!r}, expected one of: {', '.join(DEFAULT_MIX)}"
+            raise ValueError(exception_msg)
+        mix[name] = float(weight) if weight else 1.0
+    return mix
+
+def arrival_offset(index: int, rate: float, ramp_up: float) -> float:
+    """Seconds from start at which request number `index` is intended to be sent.
+
+    Rate grows linearly from 0 to `rate` during `ramp_up` seconds and stays constant after that.
+    """
+    ramp_requests = rate * ramp_up / 2
+    if index < ramp_requests:
+        return math.sqrt(2 * index * ramp_up / rate)
+    return ramp_up + (index - ramp_requests) / rate
+
+
+class OperationStats:
+    """Latencies and outcomes of one operation.
+
+    Attributes:
+        service (LatencyHistogram):  Time from actual send to response.
+        response (LatencyHistogram): Time from intended send to response, corrected for coordinated omission:
+                                     delay of requests sent late because the generator or client was behind
+                                     schedule is counted too.
+        errors (Counter):            Number of failed requests by status code or exception name.
+
+    """
+
+    def __init__(self) -> None:
+        self.service = LatencyHistogram()
+        self.response = LatencyHistogram()
+        self.errors = Counter()
+
+
+class LoadGenerator:
+    """Open-loop load generator replaying weighted mix of test case payloads through `AsyncAdminAPI`.
+
+    Requests are sent on a fixed schedule of `rate` requests per second regardless of how fast previous ones
+    complete, so slow responses don't slow down the offered load. At most `concurrency` requests are in flight,
+    requests above it wait for a free slot and that wait is included in corrected latency.
+    Requests of the ramp-up period are sent but not measured.
+
+    Attributes:
+        admin (AsyncAdminAPI): Client used for all requests.
+        rate (float):          Target requests per second.
+        duration (float):      Seconds of measured load after ramp-up.
+        ramp_up (float):       Seconds during which rate grows linearly from 0 to `rate`.
+        mix (dict):            Weights of operations by name.
+        users (int):           Number of users registered before the run which requests are spread across.
+        stats (dict):          `OperationStats` by operation name.
+
+    """
+
+    def __init__(  # noqa: PLR0913 - options are keyword-only and documented below
+        self,
+        admin: AsyncAdminAPI,
+        rate: float,
+        duration: float,
+        *,
+        ramp_up: float = 0,
+        mix: dict | None = None,
+        users: int = 10,
+        seed: int | None = None,
+    ) -> None:
+        self.admin = admin
+        self.rate = rate
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.mix = mix if mix is not None else DEFAULT_MIX
+        self.users = users
+        self.stats = defaultdict(OperationStats)
+        self.completed = 0
+        self.elapsed = 0.0
+        self._random = random.Random(seed)
+        self._run_id = uuid.uuid4().hex[:8]
+        self._accounts = []
+        self._created_tokens = []
+        self._user_count = 0
+
+    def _new_user(self) -> dict:
+        user = dict(self._random.choice(USERS_REGISTRATION)[0])
+        user["email"] = namespace_email(user["email"], f"load{self._run_id}u{self._user_count}")
+        self._user_count += 1
+        return user
+
+    async def _register(self) -> dict:
+        user = self._new_user()
+        token = await self.admin.create_user(user)
+        self._created_tokens.append(token)
+        return {"user": user, "token": token, "contacts": []}
+
+    async def setup(self) -> None:
+        LOGGER.info("Registering %d users for load", self.users)
+        self._accounts = list(await asyncio.gather(*(self._register() for _ in range(self.users))))
+        for account in self._accounts:
+            token = account["token"]
+            contacts = await asyncio.gather(*(self.admin.create_contact(token, case[0]) for case in CONTACTS))
+            account["contacts"].extend(contact["_id"] for contact in contacts)
+
+    async def teardown(self) -> None:
+        results = await asyncio.gather(
+            *(self.admin.delete_user(token) for token in self._created_tokens), return_exceptions = True,
+        )
+        failed = sum(isinstance(result, Exception) for result in results)
+        LOGGER.info("Deleted %d load users, %d failed", len(results) - failed, failed)
+
+    def _account_with_contact(self) -> tuple:
+        account = self._random.choice(self._accounts)
+        if not account["contacts"]:
+            return account, None
+        return account, self._random.choice(account["contacts"])
+
+    async def _operation(self, name: str) -> None:
+        account = self._random.choice(self._accounts)
+        if name == "create_user":
+            await self._register()
+        elif name == "log_in":
+            await self.admin.log_in(account["user"]["email"], account["user"]["password"])
+        elif name == "get_contact_list":
+            await self.admin.get_contact_list(account["token"])
+        elif name == "create_contact":
+            contact = await self.admin.create_contact(account["token"], self._random.choice(CONTACTS)[0])
+            account["contacts"].append(contact["_id"])
+        else:
+            account, contact_id = self._account_with_contact()
+            if contact_id is None:
+                contact = await self.admin.create_contact(account["token"], self._random.choice(CONTACTS)[0])
+                account["contacts"].append(contact["_id"])
+            elif name == "get_contact":
+                await self.admin.get_contact(account["token"], contact_id)
+            elif name == "update_contact":
+                await self.admin.update_contact(account["token"], contact_id, self._random.choice(CONTACTS_UPDATED)[0])
+            elif name == "patch_contact":
+                await self.admin.patch_contact(account["token"], contact_id, self._random.choice(CONTACTS_PATCHED)[0])
+            elif name == "delete_contact":
+                account["contacts"].remove(contact_id)
+                await self.admin.delete_contact(account["token"], contact_id)
+
+    async def _execute(self, name: str, intended: float, measured: bool) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        error = None
+        try:
+            await self._operation(name)
+        except AdminAPIException as exception:
+            error = str(exception.status_code)
+        except httpx.HTTPError as exception:
+            error = type(exception).__name__
+        finished = loop.time()
+        if not measured:
+            return
+        stats = self.stats[name]
+        stats.service.record(finished - started)
+        stats.response.record(finished - intended)
+        if error is not None:
+            stats.errors[error] += 1
+        self.completed += 1
+
+    async def run(self) -> None:
+        """Send requests on schedule and wait for all of them to complete."""
+        loop = asyncio.get_running_loop()
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        tasks = set()
+        start = loop.time()
+        end = self.ramp_up + self.duration
+        index = 0
+        LOGGER.info(
+            "Sending %.1f requests per second for %.1f s after %.1f s ramp-up", self.rate, self.duration, self.ramp_up,
+        )
+        while True:
+            offset = arrival_offset(index, self.rate, self.ramp_up)
+            if offset >= end:
+                break
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name = self._random.choices(names, weights)[0]
+            task = asyncio.create_task(self._execute(name, start + offset, offset >= self.ramp_up))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            index += 1
+        await asyncio.gather(*tasks)
+        self.elapsed = loop.time() - start - self.ramp_up
+
+    def format_report(self) -> list:
+        columns = "".join(f"{f'p{percentile:g}':>9}" for percentile in PERCENTILES)
+        header = f"{'operation':<17} {'latency':<9} {'count':>6} {'errors':>6}{columns} {'max':>9}"
+        lines = [header, "-" * len(header)]
+        total = LatencyHistogram()
+        errors = Counter()
+        for name, stats in sorted(self.stats.items()):
+            for kind, histogram in (("service", stats.service), ("corrected", stats.response)):
+                values = "".join(f"{histogram.percentile(percentile) * 1000:>9.2f}" for percentile in PERCENTILES)
+                lines.append(
+                    f"{name:<17} {kind:<9} {histogram.count:>6} {sum(stats.errors.values()):>6}{values} "
+                    f"{histogram.max * 1000:>9.2f}",
+                )
+            total.merge(stats.response)
+            errors.update({f"{name} {error}": count for error, count in stats.errors.items()})
+        lines.append("")
+        achieved = self.completed / self.elapsed if self.elapsed else 0
+        lines.append(f"Latency in ms. Target rate: {self.rate:.1f} rps, achieved: {achieved:.1f} rps")
+        lines.append(
+            f"Completed {self.completed} requests in {self.elapsed:.2f} s, "
+            f"corrected p99: {total.percentile(99) * 1000:.2f} ms",
+        )
+        if errors:
+            lines.append("Errors: " + ", ".join(f"{key}: {count}" for key, count in errors.most_common()))
+        return lines
@@ -4,21 +4,26 @@ import pytest
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from tests.ui.driver_pool import DriverPool
 from tests.ui.pages import ContactListPage, LogInPage, SignUpPage
 
 LOGGER = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope = "session")
+def driver_pool(request):
+    pool = DriverPool(
+        {"Chrome": webdriver.Chrome, "Firefox": webdriver.Firefox},
+        max_uses = request.config.getoption("--driver-max-uses"),
+    )
+    yield pool
+    pool.close()
+
 @pytest.fixture(params = ["Chrome", "Firefox"])
-def driver(request):
-    _driver = None
-    if request.param == "Chrome":
-        _driver = webdriver.Chrome()
-    elif request.param == "Firefox":
-        _driver = webdriver.Firefox()
-    _driver.implicitly_wait(10)
+def driver(request, driver_pool: DriverPool):
+    _driver = driver_pool.acquire(request.param)
     yield _driver
-    _driver.quit()
+    driver_pool.release(request.param, _driver)
 
 @pytest.fixture
 def log_in_page(driver: WebDriver) -> LogInPage:
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+LOGGER = logging.getLogger(__name__)
+
+# Storage of the current origin can't be read on about:blank and similar pages, which have nothing to clear
+_CLEAR_STORAGE_SCRIPT = """
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (error) {}
+"""
+
+
+class DriverPool:
+    """Long-lived browser instances per browser name, reset between tests instead of being relaunched.
+
+    Released driver is reset: extra windows are closed, cookies and local and session storage of the current
+    page are cleared and `about:blank` is opened. Driver which fails the reset or a health check on acquire,
+    e.g. after browser crash, is quit and replaced with a new one. Every driver is also recycled after
+    `max_uses` tests, so state the reset doesn't cover can't accumulate; with `max_uses = 1` every test gets
+    a new browser.
+
+    Attributes:
+        factories (dict):    Callables launching a driver by browser name, e.g. `{"Chrome": webdriver.Chrome}`.
+        max_uses (int):      Number of tests after which driver is quit.
+        implicit_wait (float): Implicit wait set on every acquired driver.
+
+    """
+
+    def __init__(self, factories: dict, max_uses: int = 50, implicit_wait: float = 10) -> None:
+        self.factories = factories
+        self.max_uses = max_uses
+        self.implicit_wait = implicit_wait
+        self._lock = threading.Lock()
+        self._idle = defaultdict(list)
+        self._uses = {}
+        self._launched = 0
+
+    def _launch(self, browser: str) -> WebDriver:
+        driver = self.factories[browser]()
+        self._launched += 1
+        LOGGER.info("Launched %s driver", browser)
+        return driver
+
+    def _quit(self, driver: WebDriver) -> None:
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as exception:
+            LOGGER.warning("Couldn't quit driver: %s", exception)
+
+    def _is_healthy(self, driver: WebDriver) -> bool:
+        try:
+            driver.current_url  # noqa: B018
+        except WebDriverException:
+            return False
+        return True
+
+    def _reset(self, driver: WebDriver) -> None:
+        handles = driver.window_handles
+        if not handles:
+            # Test closed every window, there is no page left to reset
+            exception_msg = "Driver has no open windows"
+            raise WebDriverException(exception_msg)
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        # Cookies and storage belong to the page origin, so they are cleared before leaving the page
+        driver.delete_all_cookies()
+        driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+        driver.get("about:blank")
+
+    def acquire(self, browser: str) -> WebDriver:
+        """Return idle healthy driver of `browser` or launch a new one."""
+        while True:
+            with self._lock:
+                driver = self._idle[browser].pop() if self._idle[browser] else None
+            if driver is None:
+                driver = self._launch(browser)
+                break
+            if self._is_healthy(driver):
+                break
+            LOGGER.warning("Recycling %s driver which failed health check", browser)
+            self._quit(driver)
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        driver.implicitly_wait(self.implicit_wait)
+        return driver
+
+    def release(self, browser: str, driver: WebDriver) -> None:
+        """Reset driver and keep it for the next test, or quit it after `max_uses` tests or failed reset."""
+        if self._uses.get(id(driver), 0) >= self.max_uses:
+            LOGGER.info("Recycling %s driver after %d tests", browser, self.max_uses)
+            self._quit(driver)
+            return
+        try:
+            self._reset(driver)
+        except WebDriverException as exception:
+            LOGGER.warning("Recycling %s driver which failed reset: %s", browser, exception)
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle[browser].append(driver)
+
+    def close(self) -> None:
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+        for driver in drivers:
+            self._quit(driver)
+        LOGGER.info("Closed driver pool, %d drivers were launched", self._launched)
@@ -7,6 +7,8 @@ from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 
+from util.config import get_base_url
+
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
@@ -53,7 +55,7 @@ class BasePage:
 
 class LogInPage(BasePage):
     def __init__(self, driver: WebDriver):
-        url = "https://thinking-tester-contact-list.herokuapp.com/login"
+        url = get_base_url() + "login"
         super().__init__(driver, url)
         LOGGER.info("Created POM: LogInPage")
 
@@ -82,7 +84,7 @@ class LogInPage(BasePage):
 
 class SignUpPage(BasePage):
     def __init__(self, driver: WebDriver) -> None:
-        url = "https://thinking-tester-contact-list.herokuapp.com/addUser"
+        url = get_base_url() + "addUser"
         super().__init__(driver, url)
         LOGGER.info("Created POM: SignUpPage")
 
@@ -118,24 +120,40 @@ class SignUpPage(BasePage):
         return LogInPage(self.driver)
 
 class ContactListPage(BasePage):
+    # Number of columns is taken from the first row like `td` count of `tr[1]`
+    _parse_table_script = """
+        const rows = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const columns = rows.snapshotLength ? rows.snapshotItem(0).querySelectorAll(":scope > td").length : 0;
+        const contacts = [];
+        for (let row = 0; row < rows.snapshotLength; row++) {
+            const cells = rows.snapshotItem(row).querySelectorAll(":scope > td");
+            const contact = [];
+            for (let col = 1; col < columns; col++) {
+                contact.push(cells[col] ? cells[col].innerText.trim() : "");
+            }
+            contacts.push(contact);
+        }
+        return contacts;
+    """
+
     def __init__(self, driver: WebDriver):
-        url = "https://thinking-tester-contact-list.herokuapp.com/contactList"
+        url = get_base_url() + "contactList"
         super().__init__(driver, url)
         LOGGER.info("Created POM: ContactListPage")
 
     def parse_contact_list_table(self) -> list:
-        parsed_contacts = []
-        table_xpath = "/html/body/div/div/table"
-        table_rows_xpath = f"{table_xpath}/tr"
-        number_of_rows = len(self.driver.find_elements(by = "xpath", value = table_rows_xpath)) + 1
-        number_of_columns = len(self.driver.find_elements(by = "xpath", value = table_rows_xpath + "[1]/td")) + 1
-        for row in range(1, number_of_rows):
-            contact = []
-            for col in range(2, number_of_columns):
-                text = self.driver.find_element(by = "xpath", value = f"{table_xpath}/tr[{row}]/td[{col}]").text
-                contact.append(text)
-            parsed_contacts.append(contact)
-        LOGGER.info("Parsed contacts table")
+        """Return text of every row of contact table, first column excluded, in one script execution.
+
+        Cells are read by the browser with the same XPath as the table rows, so the number of driver calls
+        doesn't depend on the size of the table.
+        """
+        table_rows_xpath = "/html/body/div/div/table/tr"
+        # Waits implicitly until the table is rendered
+        if not self.driver.find_elements(by = "xpath", value = table_rows_xpath):
+            LOGGER.info("Parsed empty contacts table")
+            return []
+        parsed_contacts = self.driver.execute_script(ContactListPage._parse_table_script, table_rows_xpath)
+        LOGGER.info("Parsed contacts table with %d rows", len(parsed_contacts))
         return parsed_contacts
 
     def click_add_new_contact(self) -> AddContactPage:
@@ -150,7 +168,7 @@ class ContactListPage(BasePage):
 
 class AddContactPage(BasePage):
     def __init__(self, driver: WebDriver):
-        url = "https://thinking-tester-contact-list.herokuapp.com/addContact"
+        url = get_base_url() + "addContact"
         super().__init__(driver, url)
         LOGGER.info("Created POM: AddContactPage")
 
@@ -1,6 +1,7 @@
 import logging
 
 from tests.ui.pages import LogInPage
+from util.config import get_base_url
 
 LOGGER = logging.getLogger(__name__)
 
@@ -11,7 +12,7 @@ class TestUILogIn:
         log_in_page.enter_email(user_registered["email"])
         log_in_page.enter_password(user_registered["password"])
         redirected_to = log_in_page.click_submit_log_in()
-        assert redirected_to.is_browser_url_changed("https://thinking-tester-contact-list.herokuapp.com/contactList")
+        assert redirected_to.is_browser_url_changed(get_base_url() + "contactList")
 
     def test_log_in_non_existent_user(self, log_in_page: LogInPage, user_default: dict) -> None:
         log_in_page.open_page()
@@ -23,4 +24,4 @@ class TestUILogIn:
     def test_button_sign_up_is_working(self, log_in_page: LogInPage) -> None:
         log_in_page.open_page()
         redirected_to = log_in_page.click_sign_up()
-        assert redirected_to.is_browser_url_changed("https://thinking-tester-contact-list.herokuapp.com/addUser")
+        assert redirected_to.is_browser_url_changed(get_base_url() + "addUser")
@@ -2,6 +2,7 @@ import logging
 
 from src.util.admin.admin_api import AdminAPI
 from tests.ui.pages import SignUpPage
+from util.config import get_base_url
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ class TestUISignUp:
         sign_up_page.open_page()
         self.enter_sign_up_data(sign_up_page, user_default)
         redirected_to = sign_up_page.click_sign_up()
-        assert redirected_to.is_browser_url_changed("https://thinking-tester-contact-list.herokuapp.com/contactList")
+        assert redirected_to.is_browser_url_changed(get_base_url() + "contactList")
 
         # Cleanup
         token = admin.log_in(user_default["email"], user_default["password"])
@@ -39,4 +40,4 @@ class TestUISignUp:
     def test_button_cancel_sign_up_is_working(self, sign_up_page: SignUpPage) -> None:
         sign_up_page.open_page()
         redirected_to = sign_up_page.click_cancel()
-        assert redirected_to.is_browser_url_changed("https://thinking-tester-contact-list.herokuapp.com/login")
+        assert redirected_to.is_browser_url_changed(get_base_url() + "login")
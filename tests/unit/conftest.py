@@ -0,0 +1,13 @@
+import pytest
+
+from tests.util.clock import FakeTime
+from util.admin import rate_limiter, token_cache
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    """Fake clock of the modules which expire or refill anything by time."""
+    fake = FakeTime()
+    monkeypatch.setattr(token_cache, "time", fake)
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
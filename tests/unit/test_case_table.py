@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+from tests.util.case_table import CASES_DIRECTORY, CaseTable, load_case_table
+
+TABLE_NAMES = sorted(path.stem for path in CASES_DIRECTORY.glob("*.jsonl"))
+
+
+@pytest.mark.parametrize("name", TABLE_NAMES)
+def test_case_table_loads_cases(name: str) -> None:
+    lines = (CASES_DIRECTORY / f"{name}.jsonl").read_text(encoding = "utf-8").splitlines()
+    expected = [(*values, test_id) for test_id, *values in map(json.loads, filter(str.strip, lines))]
+    table = load_case_table(name)
+    assert len(table) == len(expected)
+    assert table.ids() == [case[-1] for case in expected]
+    assert [tuple(case) for case in table] == expected
+    assert [table.load(index) for index in range(len(table))] == expected
+
+
+def test_case_table_skips_blank_lines(tmp_path) -> None:
+    path = tmp_path / "cases.jsonl"
+    path.write_text('["first", {"a": 1}, {"b": 1}]\n\n["second", {"a": 2}, {"b": 2}]\n', encoding = "utf-8")
+    table = CaseTable(path)
+    assert table.ids() == ["first", "second"]
+    assert table.width == 3
+    assert table[-1].id == "second"
+    assert list(table[1]) == [{"a": 2}, {"b": 2}, "second"]
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from util.json_stream import iter_json_array
+
+# (text, test id)
+ARRAYS = (
+    ("[]", "empty"),
+    ("[1, 2.5, -3, 0.125]", "integers and floats"),
+    ("[1e5, 2.5E-3, -1e+2, 10, 0.0]", "exponents"),
+    ('["a\\"b", "c\\\\d", "\\u0142\\n", "\\ud83d\\ude00", ""]', "strings with escapes"),
+    ('[{"a": {"b": [1, {"c": null}]}, "d": 2.5}, [[]], {}]', "nested objects"),
+    ('[ true , false, null, "\\u00e9", 12345678901234567890 ]', "literals and whitespace"),
+    ('[{"name": "\\u0174\\u00efl\\u0142", "phone": 8005551234}, {"birthdate": "1970-01-01", "x": 1.5e3}]', "unicode"),
+)
+# (text, error message, test id)
+INVALID_ARRAYS = (
+    ("{}", "doesn't start with array", "object"),
+    ("[1, 2", "is not closed", "not closed"),
+    ("[1 2]", "Expected ','", "missing comma"),
+    ("[1, 2.]", "Expected ','", "incomplete float"),
+)
+
+
+def split(data: bytes, size: int) -> list:
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize(("text", "array_id"), ARRAYS, ids = [array[-1] for array in ARRAYS])
+def test_iter_json_array_chunked(text: str, array_id: str) -> None:
+    data = text.encode()
+    expected = json.loads(text)
+    for size in range(1, len(data) + 1):
+        assert list(iter_json_array(split(data, size))) == expected, f"{array_id} in chunks of {size} bytes"
+
+
+@pytest.mark.parametrize(("text", "message", "array_id"), INVALID_ARRAYS, ids = [array[-1] for array in INVALID_ARRAYS])
+def test_iter_json_array_invalid(text: str, message: str, array_id: str) -> None:
+    data = text.encode()
+    for size in range(1, len(data) + 1):
+        with pytest.raises(ValueError, match = message):
+            list(iter_json_array(split(data, size)))
@@ -0,0 +1,51 @@
+from tests.util.list_diff import MISSING, diff_lists
+
+CONTACTS = [
+    {"_id": "1", "firstName": "Will", "lastName": "Smith"},
+    {"_id": "2", "firstName": "Bob", "lastName": "Ross"},
+    {"_id": "3", "firstName": "Leap", "lastName": "Year"},
+]
+PAYLOADS = [{key: value for key, value in contact.items() if key != "_id"} for contact in CONTACTS]
+
+
+def test_diff_lists_equal_in_any_order() -> None:
+    received = [{**contact, "owner": "0", "__v": 0} for contact in reversed(CONTACTS)]
+    assert not diff_lists(CONTACTS, received)
+    assert not diff_lists(PAYLOADS, received)
+
+
+def test_diff_lists_missing() -> None:
+    diff = diff_lists(CONTACTS, CONTACTS[1:])
+    assert diff.missing == [CONTACTS[0]]
+    assert (diff.extra, diff.changed) == ([], [])
+    assert diff_lists(PAYLOADS, CONTACTS[1:]).missing == [PAYLOADS[0]]
+
+
+def test_diff_lists_extra() -> None:
+    received = [*CONTACTS, {"_id": "4", "firstName": "Extra", "lastName": "Contact"}]
+    diff = diff_lists(CONTACTS, received)
+    assert diff.extra == [received[-1]]
+    assert (diff.missing, diff.changed) == ([], [])
+    assert diff_lists(PAYLOADS, received).extra == [received[-1]]
+
+
+def test_diff_lists_changed() -> None:
+    received = [CONTACTS[0], {"_id": "2", "firstName": "Robert"}, CONTACTS[2]]
+    diff = diff_lists(CONTACTS, received)
+    assert diff.changed == [("2", {"firstName": ("Bob", "Robert"), "lastName": ("Ross", MISSING)})]
+    assert (diff.missing, diff.extra) == ([], [])
+    assert "changed 2: firstName: 'Bob' != 'Robert', lastName: 'Ross' != <missing>" in diff.format()
+    # Without ids changed object can't be told from other ones
+    diff = diff_lists(PAYLOADS, received)
+    assert (diff.missing, diff.extra, diff.changed) == ([PAYLOADS[1]], [received[1]], [])
+
+
+def test_diff_lists_duplicates() -> None:
+    diff = diff_lists(CONTACTS, [*CONTACTS, CONTACTS[0]])
+    assert diff.extra == [CONTACTS[0]]
+    assert (diff.missing, diff.changed) == ([], [])
+    # Every expected duplicate needs its own received object
+    diff = diff_lists([PAYLOADS[0], PAYLOADS[0]], [CONTACTS[0]])
+    assert (diff.missing, diff.extra) == ([PAYLOADS[0]], [])
+    diff = diff_lists([PAYLOADS[0]], [CONTACTS[0], {**CONTACTS[0], "_id": "4"}])
+    assert (diff.missing, len(diff.extra), diff.changed) == ([], 1, [])
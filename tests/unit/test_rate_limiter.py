@@ -0,0 +1,45 @@
+import pytest
+
+from tests.util.clock import FakeTime
+from util.admin import rate_limiter
+from util.admin.rate_limiter import RateLimiter
+
+# Power of two, so refill times are exact in floating point
+RATE = 8
+INTERVAL = 1 / RATE
+
+
+def test_rate_limiter_refill(clock: FakeTime) -> None:
+    limiter = RateLimiter(RATE, burst = 2)
+    for _ in range(2):
+        limiter.acquire()
+    assert clock.sleeps == []
+    # Empty bucket gets one token after 1 / rate seconds
+    limiter.acquire()
+    assert clock.sleeps == [INTERVAL]
+    limiter.acquire()
+    assert clock.sleeps == [INTERVAL, INTERVAL]
+    # Half of the interval refills half of a token, the rest is waited for
+    clock.now += INTERVAL / 2
+    limiter.acquire()
+    assert clock.sleeps == [INTERVAL, INTERVAL, INTERVAL / 2]
+    # Idle time refills the bucket only up to burst
+    clock.now += 10
+    clock.sleeps.clear()
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == [INTERVAL]
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason = "file locks are not supported")
+def test_rate_limiter_shared_bucket(clock: FakeTime, tmp_path) -> None:
+    path = str(tmp_path / "bucket")
+    first, second = RateLimiter(RATE, burst = 2, path = path), RateLimiter(RATE, burst = 2, path = path)
+    first.acquire()
+    second.acquire()
+    assert clock.sleeps == []
+    first.acquire()
+    assert clock.sleeps == [INTERVAL]
+    clock.now += INTERVAL
+    second.acquire()
+    assert clock.sleeps == [INTERVAL]
@@ -0,0 +1,24 @@
+import pytest
+
+from tests.util.schema import SchemaValidator
+
+FIELDS = ("_id", "firstName", "lastName", "__v")
+USER = {"_id": "0" * 24, "firstName": "John", "lastName": "Green", "__v": 0}
+
+
+def test_schema_validator_missing_field() -> None:
+    validator = SchemaValidator(FIELDS)
+    user = {key: value for key, value in USER.items() if key != "lastName"}
+    assert validator.errors([USER, user]) == [(1, "missing field", "lastName")]
+    with pytest.raises(AssertionError, match = r"missing field 'lastName' in 1 objects: \[1\]"):
+        validator.validate([USER, user])
+    assert SchemaValidator(FIELDS, optional = ("lastName",)).errors([user]) == []
+
+
+def test_schema_validator_extra_field() -> None:
+    user = {**USER, "password": "1234567890"}
+    assert SchemaValidator(FIELDS).errors([user]) == []
+    validator = SchemaValidator(FIELDS, allow_extra = False)
+    assert validator.errors([USER, user]) == [(1, "extra field", "password")]
+    with pytest.raises(AssertionError, match = r"extra field 'password' in 1 objects: \[1\]"):
+        validator.validate([USER, user])
@@ -0,0 +1,30 @@
+from tests.util.clock import FakeTime
+from util.admin.token_cache import TokenCache
+
+
+def test_token_cache_returns_token_of_key(clock: FakeTime) -> None:
+    cache = TokenCache(ttl = 60)
+    cache.put("will@mail.com", "1234567", "token-will")
+    cache.put("bob@mail.com", "1234567", "token-bob")
+    cache.put("will@mail.com", "7654321", "token-will-new-password")
+    assert cache.get("will@mail.com", "1234567") == "token-will"
+    assert cache.get("bob@mail.com", "1234567") == "token-bob"
+    assert cache.get("will@mail.com", "7654321") == "token-will-new-password"
+    assert cache.get("ross@mail.com", "1234567") is None
+    cache.put("will@mail.com", "1234567", "token-will-again")
+    assert cache.get("will@mail.com", "1234567") == "token-will-again"
+    # Replaced token is not known anymore, so invalidating it doesn't drop the new one
+    assert cache.invalidate("token-will") is None
+    assert cache.invalidate("token-bob") == ("bob@mail.com", "1234567")
+    assert cache.get("bob@mail.com", "1234567") is None
+    assert cache.get("will@mail.com", "1234567") == "token-will-again"
+
+
+def test_token_cache_expires_token(clock: FakeTime) -> None:
+    cache = TokenCache(ttl = 60)
+    cache.put("will@mail.com", "1234567", "token-will")
+    clock.now += 59.9
+    assert cache.get("will@mail.com", "1234567") == "token-will"
+    clock.now += 0.1
+    assert cache.get("will@mail.com", "1234567") is None
+    assert cache.invalidate("token-will") is None
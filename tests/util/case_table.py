@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import threading
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+
+# Test case files, one JSON array `["test id", {payload}, ...]` per line
+CASES_DIRECTORY = Path(__file__).parent.parent / "cases"
+
+_DECODER = json.JSONDecoder()
+
+
+class CaseTable(Sequence):
+    """Table of test cases stored as JSON lines and loaded on demand.
+
+    Only offsets of lines and test ids are read when the table is first used, so parametrization during
+    collection doesn't decode payloads. Items are `CaseRef` which behave like case tuples
+    `({payload}, ..., "test id")` and decode their line on first access, so only cases of selected tests
+    are materialised.
+
+    Attributes:
+        path (Path):     File with test cases.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._offsets = None
+        self._ids = None
+        self._width = 0
+        self._cases = {}
+
+    def _index(self) -> None:
+        if self._offsets is not None:
+            return
+        with self._lock:
+            if self._offsets is not None:
+                return
+            offsets, ids = array("Q"), []
+            offset = 0
+            with self.path.open("rb") as file:
+                for line in file:
+                    if line.strip():
+                        # Test id is the first element, the rest of the line is left undecoded
+                        test_id, _ = _DECODER.raw_decode(line.decode("utf-8"), line.index(b"[") + 1)
+                        offsets.append(offset)
+                        ids.append(test_id)
+                    offset += len(line)
+            offsets.append(offset)
+            if ids:
+                # All cases of a table have the same shape, so the first one tells the position of test id
+                self._width = len(self._read(offsets, 0))
+            self._ids = ids
+            self._offsets = offsets
+
+    def _read(self, offsets: array, index: int) -> tuple:
+        with self.path.open("rb") as file:
+            file.seek(offsets[index])
+            test_id, *values = json.loads(file.readline())
+        return (*values, test_id)
+
+    @property
+    def width(self) -> int:
+        """Number of items in every case, test id included."""
+        self._index()
+        return self._width
+
+    def ids(self) -> list:
+        self._index()
+        return list(self._ids)
+
+    def case_id(self, index: int) -> str:
+        self._index()
+        return self._ids[index]
+
+    def load(self, index: int) -> tuple:
+        """Decode case `index` and return it as `({payload}, ..., "test id")`."""
+        self._index()
+        index = range(len(self))[index]
+        case = self._cases.get(index)
+        if case is None:
+            case = self._cases.setdefault(index, self._read(self._offsets, index))
+        return case
+
+    def __len__(self) -> int:
+        self._index()
+        return len(self._ids)
+
+    def __getitem__(self, index: int | slice) -> CaseRef | list:
+        if isinstance(index, slice):
+            return [CaseRef(self, position) for position in range(len(self))[index]]
+        return CaseRef(self, range(len(self))[index])
+
+    def __repr__(self) -> str:
+        return f"CaseTable({str(self.path)!r})"
+
+
+class CaseRef(Sequence):
+    """Reference to one case of `CaseTable`.
+
+    Last item, the test id, comes from the table index; reading any other item decodes the case.
+    """
+
+    __slots__ = ("index", "table")
+
+    def __init__(self, table: CaseTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def id(self) -> str:
+        return self.table.case_id(self.index)
+
+    def __len__(self) -> int:
+        return self.table.width
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, int) and index in (-1, self.table.width - 1):
+            return self.id
+        return self.table.load(self.index)[index]
+
+    def __repr__(self) -> str:
+        return f"CaseRef({self.id!r})"
+
+
+def load_case_table(name: str) -> CaseTable:
+    """Return table of `name.jsonl` in the test case directory."""
+    return CaseTable(CASES_DIRECTORY / f"{name}.jsonl")
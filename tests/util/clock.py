@@ -0,0 +1,19 @@
+class FakeTime:
+    """Replacement of `time` module whose clock moves only when told, `sleep()` moves it too.
+
+    Attributes:
+        now (float):     Current monotonic time.
+        sleeps (list):   Seconds of every `sleep()` call.
+
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
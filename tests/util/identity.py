@@ -0,0 +1,30 @@
+import os
+
+# Set by pytest-xdist in every worker process, e.g. "gw3"
+WORKER_ENV = "PYTEST_XDIST_WORKER"
+
+
+def get_worker_number() -> int:
+    worker = os.environ.get(WORKER_ENV, "gw0")
+    return int(worker.removeprefix("gw"))
+
+def get_namespace(test_index: int, prefix: str = "") -> str:
+    """Tag unique for the worker and the test, e.g. `w3t17`. `prefix` separates parallel runs, e.g. CI nodes."""
+    return f"{prefix}w{get_worker_number()}t{test_index}"
+
+def namespace_email(email: str, namespace: str) -> str:
+    """Add `+namespace` subaddress to email, e.g. `john.green+w3t17@mail.com`.
+
+    Only emails with non-empty local part and domain are changed, so invalid emails in test cases stay invalid
+    for the same reason.
+    """
+    local, at, domain = email.rpartition("@")
+    if not at or not local or not domain:
+        return email
+    return f"{local}+{namespace}@{domain}"
+
+def namespace_payload(payload: dict, namespace: str) -> dict:
+    """Return copy of user payload with namespaced email."""
+    if not isinstance(payload.get("email"), str):
+        return payload
+    return {**payload, "email": namespace_email(payload["email"], namespace)}
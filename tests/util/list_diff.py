@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Items of every kind shown in the formatted diff
+SHOWN_ITEMS = 10
+
+
+class _Missing:
+    """Value of a field which received object doesn't have."""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING = _Missing()
+
+
+class ListDiff:
+    """Difference between expected and received lists of JSON objects.
+
+    Attributes:
+        missing (list): Expected objects which were not received.
+        extra (list):   Received objects which were not expected.
+        changed (list): (key, {field: (expected value, received value)}) of objects received with other values.
+
+    """
+
+    def __init__(self) -> None:
+        self.missing = []
+        self.extra = []
+        self.changed = []
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.extra or self.changed)
+
+    def format(self) -> str:
+        lines = [f"{len(self.missing)} missing, {len(self.extra)} extra, {len(self.changed)} changed"]
+        lines.extend(f"missing: {json.dumps(item)}" for item in self.missing[:SHOWN_ITEMS])
+        lines.extend(f"extra: {json.dumps(item)}" for item in self.extra[:SHOWN_ITEMS])
+        for key, fields in self.changed[:SHOWN_ITEMS]:
+            changes = ", ".join(
+                f"{field}: {expected!r} != {received!r}" for field, (expected, received) in fields.items()
+            )
+            lines.append(f"changed {key}: {changes}")
+        return "\n".join(lines)
+
+
+def _content_key(item: dict, fields: tuple) -> str:
+    return json.dumps([item.get(field) for field in fields])
+
+def diff_lists(expected: Iterable[dict], received: Iterable[dict], key: str = "_id") -> ListDiff:
+    """Compare lists of objects regardless of their order in O(n).
+
+    Both lists are indexed by `key` and joined on it, so every expected object is compared with received one
+    of the same key; only fields of the expected object are compared, like in `check_contact_equals`.
+    If expected objects have no `key`, e.g. payloads which were sent, objects are joined by content of the
+    expected fields instead and a changed object shows up as missing and extra one.
+    """
+    expected, received = list(expected), list(received)
+    diff = ListDiff()
+    if all(key in item for item in expected):
+        received_by_key = {}
+        for item in received:
+            if item.get(key) is None or item[key] in received_by_key:
+                diff.extra.append(item)
+            else:
+                received_by_key[item[key]] = item
+        for item in expected:
+            other = received_by_key.pop(item[key], None)
+            if other is None:
+                diff.missing.append(item)
+                continue
+            fields = {
+                field: (value, other.get(field, MISSING))
+                for field, value in item.items() if other.get(field, MISSING) != value
+            }
+            if fields:
+                diff.changed.append((item[key], fields))
+        diff.extra.extend(received_by_key.values())
+        return diff
+    fields = tuple(sorted({field for item in expected for field in item}))
+    received_by_content = defaultdict(list)
+    for item in received:
+        received_by_content[_content_key(item, fields)].append(item)
+    for item in expected:
+        same = received_by_content.get(_content_key(item, fields))
+        if same:
+            same.pop()
+        else:
+            diff.missing.append(item)
+    diff.extra.extend(item for items in received_by_content.values() for item in items)
+    return diff
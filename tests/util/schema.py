@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Indexes of objects shown for every kind of error
+SHOWN_INDEXES = 5
+
+_MISSING = object()
+
+
+class SchemaValidator:
+    """Validator of JSON objects compiled once from field names.
+
+    Required and known fields are kept as frozensets, so missing and extra fields of an object are two set
+    differences with its keys, and type checks are a prepared tuple of (field, type) pairs. Types are compared
+    exactly, so `True` is not an `int`. A whole list is validated in one pass and every error is collected
+    instead of stopping at the first one. By default only presence of fields is checked.
+
+    Attributes:
+        fields (tuple):       All fields objects may have.
+        required (frozenset): Fields objects must have.
+        allow_extra (bool):   Whether objects may have fields which are not in `fields`.
+
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[str],
+        optional: Iterable[str] = (),
+        types: dict | None = None,
+        allow_extra: bool = True,
+    ) -> None:
+        self.fields = tuple(fields)
+        self.required = frozenset(self.fields) - frozenset(optional)
+        self.allow_extra = allow_extra
+        self._known = frozenset(self.fields)
+        self._checks = tuple((types or {}).items())
+
+    def errors(self, objects: Iterable[dict]) -> list:
+        """Return (index, error, field) for every missing or disallowed extra field and type mismatch of `objects`."""
+        errors = []
+        required, known, checks = self.required, None if self.allow_extra else self._known, self._checks
+        for index, instance in enumerate(objects):
+            if type(instance) is not dict:
+                errors.append((index, "not an object", type(instance).__name__))
+                continue
+            keys = instance.keys()
+            if not required <= keys:
+                errors.extend((index, "missing field", field) for field in sorted(required - keys))
+            if known is not None and not keys <= known:
+                errors.extend((index, "extra field", field) for field in sorted(keys - known))
+            for field, kind in checks:
+                value = instance.get(field, _MISSING)
+                if value is not _MISSING and type(value) is not kind:
+                    errors.append((index, f"not {kind.__name__}", field))
+        return errors
+
+    def validate(self, objects: Iterable[dict]) -> None:
+        """Assert that `objects` have no schema errors, message groups all errors by kind and field."""
+        errors = self.errors(objects)
+        if not errors:
+            return
+        grouped = defaultdict(list)
+        for index, error, field in errors:
+            grouped[error, field].append(index)
+        lines = [f"{len(errors)} schema errors:"]
+        for (error, field), indexes in grouped.items():
+            shown = ", ".join(map(str, indexes[:SHOWN_INDEXES])) + (", ..." if len(indexes) > SHOWN_INDEXES else "")
+            lines.append(f"{error} {field!r} in {len(indexes)} objects: [{shown}]")
+        raise AssertionError("\n".join(lines))